@@ -1,18 +1,10 @@
-const sqlite3 = require('sqlite3').verbose();
-const path = require('path');
+const http = require('http');
 
-// Connect to the database
-const dbPath = path.resolve(__dirname, 'db.sqlite');
-console.log('Database path:', dbPath);
-
-const db = new sqlite3.Database(dbPath, (err) => {
-  if (err) {
-    console.error('Could not connect to database:', err);
-    process.exit(1);
-  } else {
-    console.log('✅ Connected to SQLite database successfully');
-  }
-});
+// Adds the sample employees through the running server's bulk import route,
+// so its response cache sees the writes. Start the backend first; API_URL
+// points the script at another instance.
+const apiUrl = new URL(process.env.API_URL || 'http://localhost:4000');
+console.log('API URL:', apiUrl.origin);
 
 // Sample employee data
 const sampleEmployees = [
@@ -43,67 +35,99 @@ const sampleEmployees = [
   }
 ];
 
+// Generates extra synthetic employees when a count is passed on the command
+// line, e.g. `node add-sample-data.js 50000`.
+function generateEmployees(count) {
+  const positions = sampleEmployees.map(employee => employee.position);
+  const batch = Date.now();
+  return Array.from({ length: count }, (_, i) => ({
+    name: `Employee ${i + 1}`,
+    email: `employee${i + 1}.${batch}@company.com`,
+    position: positions[i % positions.length]
+  }));
+}
+
+// Sends one request; `write(req)` streams the body, if any
+function request(method, urlPath, headers, write = req => req.end()) {
+  return new Promise((resolve, reject) => {
+    const req = http.request(new URL(urlPath, apiUrl), { method, headers }, res => {
+      let data = '';
+      res.on('data', chunk => { data += chunk; });
+      res.on('end', () => resolve({ status: res.statusCode, headers: res.headers, body: data }));
+    });
+    req.on('error', reject);
+    write(req);
+  });
+}
+
+async function login() {
+  const body = JSON.stringify({ username: 'admin', password: 'password' });
+  const res = await request('POST', '/login', { 'Content-Type': 'application/json' }, req => req.end(body));
+  if (res.status !== 200) {
+    throw new Error(`Login failed (Status: ${res.status}): ${res.body}`);
+  }
+  return JSON.parse(res.body).token;
+}
+
+async function countEmployees(token) {
+  const res = await request('GET', '/employees?limit=1', { Authorization: `Bearer ${token}` });
+  if (res.status !== 200) {
+    throw new Error(`Could not count employees (Status: ${res.status}): ${res.body}`);
+  }
+  return Number(res.headers['x-total-count']);
+}
+
+// Streams the rows as NDJSON, waiting for the socket to drain so a large
+// count is never held in memory as one body
+function importEmployees(token, employees) {
+  const headers = { 'Content-Type': 'application/x-ndjson', Authorization: `Bearer ${token}` };
+  return request('POST', '/employees/bulk', headers, async req => {
+    for (const employee of employees) {
+      if (!req.write(JSON.stringify(employee) + '\n')) {
+        await new Promise(resolve => req.once('drain', resolve));
+      }
+    }
+    req.end();
+  });
+}
+
 // Function to add sample data
-function addSampleData() {
+async function addSampleData() {
   console.log('\n🌱 Adding sample employee data...\n');
-  
+
+  const token = await login();
+  console.log('✅ Logged in to the API successfully');
+
   // Check if data already exists
-  db.get("SELECT COUNT(*) as count FROM employees", (err, row) => {
-    if (err) {
-      console.error('❌ Error checking existing data:', err);
-      db.close();
-      return;
-    }
-    
-    if (row.count > 0) {
-      console.log(`⚠️  Database already contains ${row.count} employee records.`);
-      console.log('Do you want to add more sample data anyway? (This script will add the sample data)');
-    }
-    
-    // Insert sample data
-    const stmt = db.prepare("INSERT INTO employees (name, email, position) VALUES (?, ?, ?)");
-    
-    let insertedCount = 0;
-    sampleEmployees.forEach((employee, index) => {
-      stmt.run([employee.name, employee.email, employee.position], function(err) {
-        if (err) {
-          console.error(`❌ Error inserting ${employee.name}:`, err);
-        } else {
-          console.log(`✅ Added: ${employee.name} (ID: ${this.lastID})`);
-          insertedCount++;
-        }
-        
-        // If this is the last employee, finalize
-        if (index === sampleEmployees.length - 1) {
-          stmt.finalize((err) => {
-            if (err) {
-              console.error('❌ Error finalizing statement:', err);
-            } else {
-              console.log(`\n🎉 Successfully added ${insertedCount} sample employees!`);
-              
-              // Verify the data was added
-              db.get("SELECT COUNT(*) as count FROM employees", (err, row) => {
-                if (err) {
-                  console.error('❌ Error verifying data:', err);
-                } else {
-                  console.log(`📊 Total employees in database: ${row.count}`);
-                }
-                
-                db.close((err) => {
-                  if (err) {
-                    console.error('Error closing database:', err);
-                  } else {
-                    console.log('✅ Database connection closed');
-                  }
-                });
-              });
-            }
-          });
-        }
-      });
-    });
+  const existing = await countEmployees(token);
+  if (existing > 0) {
+    console.log(`⚠️  Database already contains ${existing} employee records.`);
+    console.log('Do you want to add more sample data anyway? (This script will add the sample data)');
+  }
+
+  const extraCount = Number(process.argv[2]) || 0;
+  const employees = [...sampleEmployees, ...generateEmployees(extraCount)];
+
+  // Insert sample data in batched transactions
+  const res = await importEmployees(token, employees);
+  if (res.status !== 200) {
+    throw new Error(`Bulk import failed (Status: ${res.status}): ${res.body}`);
+  }
+  const report = JSON.parse(res.body);
+  report.errors.forEach(({ index, error }) => {
+    console.error(`❌ Error inserting ${employees[index].name}:`, error);
   });
+  if (report.errorsTruncated) {
+    console.error(`❌ ...and ${report.failed - report.errors.length} more errors`);
+  }
+  console.log(`\n🎉 Successfully added ${report.inserted} sample employees in ${report.durationMs} ms (${report.rowsPerSecond} rows/s)!`);
+
+  // Verify the data was added
+  console.log(`📊 Total employees in database: ${await countEmployees(token)}`);
 }
 
 // Run the function
-addSampleData();
+addSampleData().catch(err => {
+  console.error('❌ Could not add sample data:', err.message);
+  process.exit(1);
+});
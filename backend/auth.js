@@ -0,0 +1,284 @@
+// Password hashing and signed session tokens.
+//
+// Passwords are stored in the users table as scrypt hashes that carry their
+// own parameters ("scrypt$N$r$p$salt$hash"), so the work factor can be raised
+// with AUTH_SCRYPT_COST without invalidating existing hashes; a user whose
+// hash is weaker than the current setting is rehashed on their next login.
+//
+// A successful login returns a stateless session token,
+// base64url(JSON { sub, iat, exp }) + "." + base64url(HMAC-SHA256 of that),
+// which the /employees routes accept as "Authorization: Bearer <token>".
+// Checking one needs only SESSION_SECRET, not the database. Tokens that have
+// been verified once are kept in a bounded LRU cache, so a repeat request
+// costs a Map lookup instead of an HMAC and a JSON parse. Invalid tokens are
+// never cached, so garbage cannot push real sessions out.
+//
+// Without SESSION_SECRET a random secret is generated per process (cluster.js
+// shares one across its workers), and sessions end when the server restarts.
+
+const crypto = require('crypto');
+
+const DEFAULT_SCRYPT_COST = 16384;
+const SCRYPT_BLOCK_SIZE = 8;
+const SCRYPT_PARALLELISM = 1;
+const KEY_LENGTH = 32;
+const SALT_LENGTH = 16;
+const DEFAULT_SESSION_TTL_SECONDS = 8 * 60 * 60;
+const DEFAULT_SESSION_CACHE_SIZE = 10000;
+
+// The demo accounts the login page has always accepted
+const DEFAULT_USERS = [
+  { username: 'admin', password: 'password' },
+  { username: 'user', password: '123456' },
+  { username: 'test', password: 'test123' }
+];
+
+const SCHEMA = [
+  `CREATE TABLE IF NOT EXISTS users (
+    username TEXT PRIMARY KEY,
+    password_hash TEXT NOT NULL
+  ) WITHOUT ROWID`,
+  seedUsers
+];
+
+function positiveInteger(env, name, fallback) {
+  if (env[name] === undefined || env[name] === '') {
+    return fallback;
+  }
+  const value = Number(env[name]);
+  if (!Number.isInteger(value) || value < 1) {
+    throw new Error(`${name} must be a positive integer, got "${env[name]}"`);
+  }
+  return value;
+}
+
+// Reads AUTH_SCRYPT_COST, SESSION_SECRET, SESSION_TTL_SECONDS and
+// SESSION_CACHE_SIZE.
+function resolveAuthOptions(env = process.env) {
+  const cost = positiveInteger(env, 'AUTH_SCRYPT_COST', DEFAULT_SCRYPT_COST);
+  // scrypt's N must be a power of two
+  if ((cost & (cost - 1)) !== 0 || cost < 2) {
+    throw new Error(`AUTH_SCRYPT_COST must be a power of two, got "${env.AUTH_SCRYPT_COST}"`);
+  }
+  return {
+    cost,
+    secret: env.SESSION_SECRET || null,
+    ttlSeconds: positiveInteger(env, 'SESSION_TTL_SECONDS', DEFAULT_SESSION_TTL_SECONDS),
+    cacheSize: positiveInteger(env, 'SESSION_CACHE_SIZE', DEFAULT_SESSION_CACHE_SIZE)
+  };
+}
+
+function scrypt(password, salt, { N, r, p }, cb) {
+  // Node refuses to allocate more than 32 MiB unless told otherwise;
+  // scrypt needs 128 * N * r bytes
+  crypto.scrypt(password, salt, KEY_LENGTH, { N, r, p, maxmem: 256 * N * r }, cb);
+}
+
+// `cb(err, hash)` with the encoded "scrypt$N$r$p$salt$hash" string.
+function hashPassword(password, cost, cb) {
+  const params = { N: cost, r: SCRYPT_BLOCK_SIZE, p: SCRYPT_PARALLELISM };
+  const salt = crypto.randomBytes(SALT_LENGTH);
+  scrypt(password, salt, params, (err, key) => {
+    if (err) {
+      return cb(err);
+    }
+    cb(null, ['scrypt', params.N, params.r, params.p, salt.toString('base64'), key.toString('base64')].join('$'));
+  });
+}
+
+// `cb(err, matches, needsRehash)`; needsRehash when the hash was made with a
+// lower cost than `cost`.
+function verifyPassword(password, encoded, cost, cb) {
+  const [scheme, N, r, p, salt, hash] = String(encoded).split('$');
+  if (scheme !== 'scrypt' || !hash) {
+    return cb(new Error('Unrecognised password hash'));
+  }
+  const params = { N: Number(N), r: Number(r), p: Number(p) };
+  const expected = Buffer.from(hash, 'base64');
+  scrypt(password, Buffer.from(salt, 'base64'), params, (err, key) => {
+    if (err) {
+      return cb(err);
+    }
+    const matches = key.length === expected.length && crypto.timingSafeEqual(key, expected);
+    cb(null, matches, matches && params.N < cost);
+  });
+}
+
+// Migration step: stores DEFAULT_USERS with hashed passwords.
+function seedUsers(conn, cb) {
+  const { cost } = resolveAuthOptions();
+  let pending = DEFAULT_USERS.length;
+  let failed = false;
+  DEFAULT_USERS.forEach(({ username, password }) => {
+    hashPassword(password, cost, (err, hash) => {
+      if (failed) return;
+      if (err) {
+        failed = true;
+        return cb(err);
+      }
+      conn.run('INSERT OR IGNORE INTO users (username, password_hash) VALUES (?, ?)', [username, hash], err => {
+        if (failed) return;
+        if (err) {
+          failed = true;
+          return cb(err);
+        }
+        if (--pending === 0) cb();
+      });
+    });
+  });
+}
+
+// Issues and verifies session tokens. Returns { issue, verify, stats }.
+function createSessions({
+  secret,
+  ttlSeconds = DEFAULT_SESSION_TTL_SECONDS,
+  cacheSize = DEFAULT_SESSION_CACHE_SIZE
+}) {
+  const key = secret ? Buffer.from(secret) : crypto.randomBytes(32);
+  // token -> payload, in least-recently-used order
+  const verified = new Map();
+  const counters = { hits: 0, misses: 0, rejected: 0 };
+
+  const sign = body => crypto.createHmac('sha256', key).update(body).digest();
+
+  function remember(token, payload) {
+    verified.set(token, payload);
+    if (verified.size > cacheSize) {
+      verified.delete(verified.keys().next().value);
+    }
+  }
+
+  return {
+    // Returns { token, username, expiresAt } for a freshly signed session
+    issue(username) {
+      const iat = Math.floor(Date.now() / 1000);
+      const payload = { sub: username, iat, exp: iat + ttlSeconds };
+      const body = Buffer.from(JSON.stringify(payload)).toString('base64url');
+      const token = `${body}.${sign(body).toString('base64url')}`;
+      remember(token, payload);
+      return { token, username, expiresAt: new Date(payload.exp * 1000).toISOString() };
+    },
+
+    // Returns the token's { sub, iat, exp }, or null if it is forged,
+    // malformed or expired
+    verify(token) {
+      const now = Date.now() / 1000;
+      const cached = verified.get(token);
+      if (cached) {
+        verified.delete(token);
+        if (cached.exp <= now) {
+          counters.rejected++;
+          return null;
+        }
+        counters.hits++;
+        verified.set(token, cached);
+        return cached;
+      }
+
+      counters.misses++;
+      const dot = token.indexOf('.');
+      if (dot < 1) {
+        counters.rejected++;
+        return null;
+      }
+      const body = token.slice(0, dot);
+      // Compared as text so only the canonical encoding of a signature passes
+      const signature = Buffer.from(token.slice(dot + 1));
+      const expected = Buffer.from(sign(body).toString('base64url'));
+      if (signature.length !== expected.length || !crypto.timingSafeEqual(signature, expected)) {
+        counters.rejected++;
+        return null;
+      }
+      let payload;
+      try {
+        payload = JSON.parse(Buffer.from(body, 'base64url').toString());
+      } catch {
+        payload = null;
+      }
+      if (!payload || typeof payload.sub !== 'string' || !(payload.exp > now)) {
+        counters.rejected++;
+        return null;
+      }
+      remember(token, payload);
+      return payload;
+    },
+
+    stats() {
+      return { cached: verified.size, maxCached: cacheSize, ...counters };
+    }
+  };
+}
+
+// Checks credentials against the users table. `login(username, password,
+// cb)` calls back with a session from `sessions.issue`, or null.
+function createAuthenticator(db, sessions, { cost = DEFAULT_SCRYPT_COST, log = console.error } = {}) {
+  // Hashed in place of a missing user's password, so an unknown username
+  // takes as long to reject as a wrong password
+  const decoySalt = crypto.randomBytes(SALT_LENGTH);
+  const decoyParams = { N: cost, r: SCRYPT_BLOCK_SIZE, p: SCRYPT_PARALLELISM };
+
+  return {
+    login(username, password, cb) {
+      db.get('SELECT password_hash FROM users WHERE username = ?', [username], (err, row) => {
+        if (err) {
+          return cb(err);
+        }
+        if (!row) {
+          return scrypt(password, decoySalt, decoyParams, err => cb(err, null));
+        }
+        verifyPassword(password, row.password_hash, cost, (err, matches, needsRehash) => {
+          if (err || !matches) {
+            return cb(err, null);
+          }
+          // The login succeeds either way; a failed upgrade is retried on
+          // the next one
+          if (needsRehash) {
+            hashPassword(password, cost, (err, hash) => {
+              if (err) {
+                return log(`Could not rehash the password of ${username}: ${err.message}`);
+              }
+              db.run('UPDATE users SET password_hash = ? WHERE username = ?', [hash, username], (err) => {
+                if (err) {
+                  log(`Could not store the rehashed password of ${username}: ${err.message}`);
+                }
+              });
+            });
+          }
+          cb(null, sessions.issue(username));
+        });
+      });
+    }
+  };
+}
+
+// Express middleware: 401 unless the request carries a valid session token.
+// The session's username is available as req.user.username.
+function requireSession(sessions) {
+  return (req, res, next) => {
+    const header = req.get('Authorization') || '';
+    const token = header.startsWith('Bearer ') ? header.slice(7).trim() : '';
+    if (!token) {
+      res.set('WWW-Authenticate', 'Bearer');
+      return res.status(401).json({ error: 'Authentication required' });
+    }
+    const session = sessions.verify(token);
+    if (!session) {
+      res.set('WWW-Authenticate', 'Bearer error="invalid_token"');
+      return res.status(401).json({ error: 'Invalid or expired session' });
+    }
+    req.user = { username: session.sub };
+    next();
+  };
+}
+
+module.exports = {
+  DEFAULT_SCRYPT_COST,
+  DEFAULT_USERS,
+  SCHEMA,
+  createAuthenticator,
+  createSessions,
+  hashPassword,
+  requireSession,
+  resolveAuthOptions,
+  verifyPassword
+};
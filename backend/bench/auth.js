@@ -0,0 +1,91 @@
+// Measures the two halves of authentication:
+//
+// - login: scrypt password verification at several AUTH_SCRYPT_COST values,
+//   run CONCURRENCY at a time the way simultaneous logins share the libuv
+//   threadpool;
+// - session checks: verifying a token the first time (HMAC + JSON parse)
+//   against the cached path every later request takes.
+//
+// Usage: node bench/auth.js [costs] [iterations]
+//   e.g. node bench/auth.js 8192,16384,32768 200000
+
+const os = require('os');
+const { createSessions, hashPassword, verifyPassword } = require('../auth');
+
+const COSTS = process.argv[2] ? process.argv[2].split(',').map(Number) : [4096, 8192, 16384, 32768];
+const ITERATIONS = Number(process.argv[3]) || 200000;
+const CONCURRENCY = Number(process.env.UV_THREADPOOL_SIZE) || 4;
+const LOGIN_DURATION_MS = 3000;
+const TOKENS = 1000;
+
+const hash = (password, cost) => new Promise((resolve, reject) => {
+  hashPassword(password, cost, (err, encoded) => (err ? reject(err) : resolve(encoded)));
+});
+
+const verify = (password, encoded, cost) => new Promise((resolve, reject) => {
+  verifyPassword(password, encoded, cost, (err, matches) => (err ? reject(err) : resolve(matches)));
+});
+
+async function measureLogin(cost) {
+  const encoded = await hash('password', cost);
+  const latencies = [];
+  const deadline = Date.now() + LOGIN_DURATION_MS;
+  const startedAt = process.hrtime.bigint();
+
+  await Promise.all(Array.from({ length: CONCURRENCY }, async () => {
+    while (Date.now() < deadline) {
+      const start = process.hrtime.bigint();
+      if (!(await verify('password', encoded, cost))) {
+        throw new Error('Password did not verify');
+      }
+      latencies.push(Number(process.hrtime.bigint() - start) / 1e6);
+    }
+  }));
+
+  const seconds = Number(process.hrtime.bigint() - startedAt) / 1e9;
+  latencies.sort((a, b) => a - b);
+  return {
+    cost,
+    'memory MiB': (128 * cost * 8) / 2 ** 20,
+    'logins/s': Math.round(latencies.length / seconds),
+    'p50 ms': latencies[Math.floor(latencies.length * 0.5)].toFixed(1),
+    'p99 ms': latencies[Math.floor(latencies.length * 0.99)].toFixed(1)
+  };
+}
+
+function measureVerify(name, sessions, tokens) {
+  const startedAt = process.hrtime.bigint();
+  for (let i = 0; i < ITERATIONS; i++) {
+    if (!sessions.verify(tokens[i % tokens.length])) {
+      throw new Error('Token did not verify');
+    }
+  }
+  const ns = Number(process.hrtime.bigint() - startedAt) / ITERATIONS;
+  return { path: name, 'µs/verify': (ns / 1000).toFixed(2), 'verifies/s': Math.round(1e9 / ns) };
+}
+
+async function main() {
+  console.log(`${os.cpus().length} CPUs, ${CONCURRENCY} concurrent logins (UV_THREADPOOL_SIZE)`);
+  const logins = [];
+  for (const cost of COSTS) {
+    logins.push(await measureLogin(cost));
+  }
+  console.table(logins);
+
+  const issuer = createSessions({ secret: 'bench' });
+  const tokens = Array.from({ length: TOKENS }, (_, i) => issuer.issue(`user${i}`).token);
+  // A cache too small to hold anything forces the HMAC path every time
+  const uncached = createSessions({ secret: 'bench', cacheSize: 1 });
+  const cached = createSessions({ secret: 'bench', cacheSize: TOKENS });
+  tokens.forEach(token => cached.verify(token));
+  console.log(`${ITERATIONS} verifications over ${TOKENS} tokens`);
+  console.table([
+    measureVerify('HMAC (uncached)', uncached, tokens),
+    measureVerify('LRU cache hit', cached, tokens)
+  ]);
+}
+
+main().catch(err => {
+  console.error(err);
+  process.exit(1);
+});
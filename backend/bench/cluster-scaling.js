@@ -0,0 +1,180 @@
+// Measures how request throughput scales with the number of cluster workers.
+//
+// For each worker count the benchmark starts `node cluster.js` against a
+// scratch database seeded with ROWS employees, then drives GET /employees
+// pages from CONNECTIONS keep-alive connections for DURATION seconds. Each
+// request carries a unique query string so it misses the response cache and
+// pays for the SQL query and JSON serialisation, the per-request CPU work
+// that extra processes can spread over more cores. The load generator runs
+// in worker threads so it is not itself limited to one core.
+//
+// Usage: node bench/cluster-scaling.js [workerCounts] [seconds]
+//   e.g. node bench/cluster-scaling.js 1,2,4 10
+
+const { spawn } = require('child_process');
+const fs = require('fs');
+const http = require('http');
+const os = require('os');
+const path = require('path');
+const { Worker, isMainThread, parentPort, workerData } = require('worker_threads');
+
+const CPUS = os.availableParallelism ? os.availableParallelism() : os.cpus().length;
+const PORT = 4100;
+const ROWS = 20000;
+const PAGE_SIZE = 200;
+const CONNECTIONS = 64;
+const CLIENT_THREADS = Math.max(2, Math.floor(CPUS / 2));
+
+function defaultWorkerCounts() {
+  const counts = [];
+  for (let n = 1; n < CPUS; n *= 2) counts.push(n);
+  counts.push(CPUS);
+  return counts;
+}
+
+// Load generator thread: `connections` closed loops over keep-alive sockets
+function runClient({ port, connections, durationMs, offset, token }) {
+  const agent = new http.Agent({ keepAlive: true, maxSockets: connections });
+  const deadline = Date.now() + durationMs;
+  let completed = 0;
+  let errors = 0;
+  let sequence = offset;
+
+  const loop = () => new Promise(resolve => {
+    const next = () => {
+      if (Date.now() >= deadline) return resolve();
+      const req = http.get({
+        port,
+        agent,
+        path: `/employees?limit=${PAGE_SIZE}&sort=name&bench=${sequence++}`,
+        headers: { Authorization: `Bearer ${token}` }
+      }, res => {
+        res.resume();
+        res.on('end', () => {
+          if (res.statusCode === 200) completed++;
+          else errors++;
+          next();
+        });
+      });
+      req.on('error', () => {
+        errors++;
+        next();
+      });
+    };
+    next();
+  });
+
+  Promise.all(Array.from({ length: connections }, loop)).then(() => {
+    agent.destroy();
+    parentPort.postMessage({ completed, errors });
+  });
+}
+
+function request(method, urlPath, body, headers = {}) {
+  return new Promise((resolve, reject) => {
+    const req = http.request({ port: PORT, method, path: urlPath, headers }, res => {
+      let data = '';
+      res.on('data', chunk => { data += chunk; });
+      res.on('end', () => resolve({ status: res.statusCode, body: data }));
+    });
+    req.on('error', reject);
+    req.end(body);
+  });
+}
+
+async function waitUntilReady(timeoutMs = 30000) {
+  const deadline = Date.now() + timeoutMs;
+  while (Date.now() < deadline) {
+    try {
+      // The server only listens once its database is ready, so any answer
+      // (401 without a session) means it is up
+      await request('GET', '/metrics');
+      return;
+    } catch {
+      // not listening yet
+    }
+    await new Promise(resolve => setTimeout(resolve, 200));
+  }
+  throw new Error('Server did not start');
+}
+
+function startCluster(workers, dbFile) {
+  const child = spawn(process.execPath, [path.join(__dirname, '..', 'cluster.js')], {
+    env: { ...process.env, CLUSTER_WORKERS: String(workers), PORT: String(PORT), SQLITE_PATH: dbFile },
+    stdio: ['ignore', 'ignore', 'inherit']
+  });
+  const exited = new Promise(resolve => child.on('exit', resolve));
+  return { stop: () => { child.kill('SIGTERM'); return exited; } };
+}
+
+async function login() {
+  const res = await request('POST', '/login', JSON.stringify({ username: 'admin', password: 'password' }),
+    { 'Content-Type': 'application/json' });
+  if (res.status !== 200) throw new Error(`Login failed: ${res.body}`);
+  return JSON.parse(res.body).token;
+}
+
+async function seed(dbFile) {
+  const server = startCluster(1, dbFile);
+  await waitUntilReady();
+  const token = await login();
+  const lines = Array.from({ length: ROWS }, (_, i) => JSON.stringify({
+    name: `Employee ${i}`, email: `employee${i}@company.com`, position: 'Engineer'
+  })).join('\n');
+  const res = await request('POST', '/employees/bulk', lines,
+    { 'Content-Type': 'application/x-ndjson', Authorization: `Bearer ${token}` });
+  if (res.status !== 200) throw new Error(`Seeding failed: ${res.body}`);
+  await server.stop();
+}
+
+async function measure(workers, dbFile, durationMs) {
+  const server = startCluster(workers, dbFile);
+  await waitUntilReady();
+  const token = await login();
+  const perThread = Math.ceil(CONNECTIONS / CLIENT_THREADS);
+  const startedAt = process.hrtime.bigint();
+  const results = await Promise.all(Array.from({ length: CLIENT_THREADS }, (_, i) => new Promise((resolve, reject) => {
+    const worker = new Worker(__filename, {
+      workerData: { port: PORT, connections: perThread, durationMs, offset: i * 1e9, token }
+    });
+    worker.once('message', resolve);
+    worker.once('error', reject);
+  })));
+  const seconds = Number(process.hrtime.bigint() - startedAt) / 1e9;
+  await server.stop();
+
+  const completed = results.reduce((sum, r) => sum + r.completed, 0);
+  const errors = results.reduce((sum, r) => sum + r.errors, 0);
+  return { workers, requestsPerSecond: Math.round(completed / seconds), errors };
+}
+
+async function main() {
+  const counts = process.argv[2] ? process.argv[2].split(',').map(Number) : defaultWorkerCounts();
+  const durationMs = (Number(process.argv[3]) || 10) * 1000;
+  const dbFile = path.join(os.tmpdir(), `employee-cluster-bench-${process.pid}.sqlite`);
+
+  console.log(`${CPUS} CPUs; ${ROWS} rows, ${CONNECTIONS} connections from ${CLIENT_THREADS} client threads, ` +
+    `${durationMs / 1000}s per run`);
+  try {
+    await seed(dbFile);
+    const results = [];
+    for (const workers of counts) {
+      results.push(await measure(workers, dbFile, durationMs));
+    }
+    const baseline = results[0].requestsPerSecond;
+    console.table(results.map(row => ({ ...row, speedup: `${(row.requestsPerSecond / baseline).toFixed(2)}x` })));
+  } finally {
+    for (const suffix of ['', '-wal', '-shm']) {
+      fs.rmSync(dbFile + suffix, { force: true });
+    }
+  }
+}
+
+if (isMainThread) {
+  main().catch(err => {
+    console.error(err);
+    process.exit(1);
+  });
+} else {
+  runClient(workerData);
+}
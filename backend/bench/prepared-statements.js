@@ -0,0 +1,129 @@
+// Compares per-request CPU time of the CRUD statements when each call
+// prepares a fresh statement (Database#run/get/all) against reusing
+// statements from statement-cache.js.
+//
+// Usage: node bench/prepared-statements.js [iterations]
+
+const sqlite3 = require('sqlite3');
+const fs = require('fs');
+const os = require('os');
+const path = require('path');
+const { resolveTuning, applyTuning } = require('../db-tuning');
+const { createStatementCache } = require('../statement-cache');
+
+const ITERATIONS = Number(process.argv[2]) || 5000;
+
+// The statements the CRUD handlers and list page run
+const OPERATIONS = [
+  {
+    name: 'insert',
+    method: 'run',
+    sql: 'INSERT INTO employees (name, email, position) VALUES (?, ?, ?)',
+    params: i => [`Employee ${i}`, `employee${i}@company.com`, 'Engineer']
+  },
+  {
+    name: 'select by id',
+    method: 'get',
+    sql: 'SELECT id, name, email, position FROM employees WHERE id = ?',
+    params: i => [i + 1]
+  },
+  {
+    name: 'list page',
+    method: 'all',
+    sql: 'SELECT id, name, email, position FROM employees WHERE id > ? ORDER BY id LIMIT 50',
+    params: i => [i]
+  },
+  {
+    name: 'update',
+    method: 'run',
+    sql: 'UPDATE employees SET name = ?, email = ?, position = ? WHERE id = ?',
+    params: i => [`Employee ${i}`, `employee${i}@example.com`, 'Manager', i + 1]
+  },
+  {
+    name: 'delete',
+    method: 'run',
+    sql: 'DELETE FROM employees WHERE id = ?',
+    params: i => [i + 1]
+  }
+];
+
+function open(file) {
+  return new Promise((resolve, reject) => {
+    const db = new sqlite3.Database(file, err => (err ? reject(err) : resolve(db)));
+  });
+}
+
+function call(target, method, sql, params = []) {
+  return new Promise((resolve, reject) => {
+    target[method](sql, params, (err, result) => (err ? reject(err) : resolve(result)));
+  });
+}
+
+function tune(db, tuning) {
+  return new Promise((resolve, reject) => {
+    applyTuning(db, tuning, err => (err ? reject(err) : resolve()));
+  });
+}
+
+// process.cpuUsage includes the libuv threads that run the queries
+async function measure(target, { method, sql, params }) {
+  const cpuBefore = process.cpuUsage();
+  const startedAt = process.hrtime.bigint();
+  for (let i = 0; i < ITERATIONS; i++) {
+    await call(target, method, sql, params(i));
+  }
+  const cpu = process.cpuUsage(cpuBefore);
+  const wallMs = Number(process.hrtime.bigint() - startedAt) / 1e6;
+  return {
+    cpuUsPerOp: (cpu.user + cpu.system) / ITERATIONS,
+    opsPerSecond: Math.round(ITERATIONS / (wallMs / 1000))
+  };
+}
+
+async function runMode(name, useCache) {
+  const file = path.join(os.tmpdir(), `employee-bench-${process.pid}-${name}.sqlite`);
+  const db = await open(file);
+  await tune(db, resolveTuning());
+  await call(db, 'run', `CREATE TABLE employees (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    email TEXT NOT NULL,
+    position TEXT NOT NULL
+  )`);
+
+  const cache = useCache ? createStatementCache(db) : null;
+  const results = {};
+  // In order, so select/update/delete find the rows insert created
+  for (const operation of OPERATIONS) {
+    results[operation.name] = await measure(cache || db, operation);
+  }
+
+  if (cache) {
+    await new Promise(resolve => cache.clear(resolve));
+  }
+  await new Promise(resolve => db.close(resolve));
+  for (const suffix of ['', '-wal', '-shm']) {
+    fs.rmSync(file + suffix, { force: true });
+  }
+  return results;
+}
+
+async function main() {
+  const uncached = await runMode('uncached', false);
+  const cached = await runMode('cached', true);
+
+  console.log(`${ITERATIONS} iterations per operation`);
+  console.table(OPERATIONS.map(({ name }) => ({
+    operation: name,
+    'uncached µs/op': uncached[name].cpuUsPerOp.toFixed(1),
+    'cached µs/op': cached[name].cpuUsPerOp.toFixed(1),
+    'CPU saved': `${((1 - cached[name].cpuUsPerOp / uncached[name].cpuUsPerOp) * 100).toFixed(0)}%`,
+    'uncached ops/s': uncached[name].opsPerSecond,
+    'cached ops/s': cached[name].opsPerSecond
+  })));
+}
+
+main().catch(err => {
+  console.error(err);
+  process.exit(1);
+});
@@ -0,0 +1,86 @@
+// Compares read/write throughput of SQLite's defaults with the startup tuning
+// profile from db-tuning.js.
+//
+// Usage: node bench/sqlite-tuning.js [writes] [reads]
+
+const sqlite3 = require('sqlite3');
+const fs = require('fs');
+const os = require('os');
+const path = require('path');
+const { resolveTuning, applyTuning } = require('../db-tuning');
+
+const WRITES = Number(process.argv[2]) || 2000;
+const READS = Number(process.argv[3]) || 5000;
+
+function open(file) {
+  return new Promise((resolve, reject) => {
+    const db = new sqlite3.Database(file, err => (err ? reject(err) : resolve(db)));
+  });
+}
+
+function call(db, method, sql, params = []) {
+  return new Promise((resolve, reject) => {
+    db[method](sql, params, (err, result) => (err ? reject(err) : resolve(result)));
+  });
+}
+
+function tune(db, tuning) {
+  return new Promise((resolve, reject) => {
+    applyTuning(db, tuning, (err, effective) => (err ? reject(err) : resolve(effective)));
+  });
+}
+
+function opsPerSecond(count, startedAt) {
+  const seconds = Number(process.hrtime.bigint() - startedAt) / 1e9;
+  return Math.round(count / seconds);
+}
+
+async function runProfile(name, tuning) {
+  const file = path.join(os.tmpdir(), `employee-bench-${process.pid}-${name}.sqlite`);
+  const db = await open(file);
+  const effective = tuning ? await tune(db, tuning) : null;
+  await call(db, 'run', `CREATE TABLE employees (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    email TEXT NOT NULL,
+    position TEXT NOT NULL
+  )`);
+
+  // Autocommit inserts, one per call, the way POST /employees writes
+  let startedAt = process.hrtime.bigint();
+  for (let i = 0; i < WRITES; i++) {
+    await call(db, 'run', 'INSERT INTO employees (name, email, position) VALUES (?, ?, ?)',
+      [`Employee ${i}`, `employee${i}@company.com`, 'Engineer']);
+  }
+  const writes = opsPerSecond(WRITES, startedAt);
+
+  // Concurrent page reads, the way GET /employees reads
+  startedAt = process.hrtime.bigint();
+  await Promise.all(Array.from({ length: READS }, (_, i) =>
+    call(db, 'all', 'SELECT id, name, email, position FROM employees WHERE id > ? ORDER BY id LIMIT 50',
+      [i % WRITES])));
+  const reads = opsPerSecond(READS, startedAt);
+
+  await new Promise(resolve => db.close(resolve));
+  for (const suffix of ['', '-wal', '-shm']) {
+    fs.rmSync(file + suffix, { force: true });
+  }
+  return { profile: name, writesPerSecond: writes, readsPerSecond: reads, settings: effective || 'SQLite defaults' };
+}
+
+async function main() {
+  const results = [
+    await runProfile('default', null),
+    await runProfile('tuned', resolveTuning())
+  ];
+  console.table(results.map(({ settings, ...row }) => row));
+  console.log('Tuned settings:', results[1].settings);
+  const [before, after] = results;
+  console.log(`Writes: ${(after.writesPerSecond / before.writesPerSecond).toFixed(1)}x, ` +
+    `reads: ${(after.readsPerSecond / before.readsPerSecond).toFixed(1)}x`);
+}
+
+main().catch(err => {
+  console.error(err);
+  process.exit(1);
+});
@@ -0,0 +1,143 @@
+// Change log behind GET /employees/changes.
+//
+// Every insert, update and delete increments the data_version counter in
+// employees_meta and records the new version against the row id in
+// employee_versions; deletes leave a tombstone there. A client that knows the
+// version its data was read at can then fetch only the rows changed since,
+// with one index range scan over employee_versions.
+//
+// Live rows keep one entry each, but tombstones would pile up forever, so
+// each delete also drops the tombstones more than TOMBSTONE_RETENTION
+// versions old and records that point as pruned_version. A client syncing
+// from before it could miss deletes and is told to reload instead.
+
+const SCHEMA = [
+  `INSERT OR IGNORE INTO employees_meta (key, value) VALUES ('data_version', 0)`,
+  `CREATE TABLE IF NOT EXISTS employee_versions (
+    id INTEGER PRIMARY KEY,
+    version INTEGER NOT NULL,
+    deleted INTEGER NOT NULL DEFAULT 0
+  )`,
+  `CREATE INDEX IF NOT EXISTS idx_employee_versions_version ON employee_versions (version)`,
+  `CREATE TRIGGER IF NOT EXISTS employees_version_insert AFTER INSERT ON employees
+    BEGIN
+      UPDATE employees_meta SET value = value + 1 WHERE key = 'data_version';
+      INSERT OR REPLACE INTO employee_versions (id, version, deleted)
+        VALUES (new.id, (SELECT value FROM employees_meta WHERE key = 'data_version'), 0);
+    END`,
+  `CREATE TRIGGER IF NOT EXISTS employees_version_update AFTER UPDATE ON employees
+    BEGIN
+      UPDATE employees_meta SET value = value + 1 WHERE key = 'data_version';
+      INSERT OR REPLACE INTO employee_versions (id, version, deleted)
+        VALUES (new.id, (SELECT value FROM employees_meta WHERE key = 'data_version'), 0);
+    END`,
+  `CREATE TRIGGER IF NOT EXISTS employees_version_delete AFTER DELETE ON employees
+    BEGIN
+      UPDATE employees_meta SET value = value + 1 WHERE key = 'data_version';
+      INSERT OR REPLACE INTO employee_versions (id, version, deleted)
+        VALUES (old.id, (SELECT value FROM employees_meta WHERE key = 'data_version'), 1);
+    END`
+];
+
+const TOMBSTONE_RETENTION = 100000;
+
+// Added by migration 5; SCHEMA above shipped in the baseline
+const RETENTION_SCHEMA = [
+  `INSERT OR IGNORE INTO employees_meta (key, value) VALUES ('pruned_version', 0)`,
+  // Only tombstones, so pruning never walks the entries of live rows
+  `CREATE INDEX IF NOT EXISTS idx_employee_versions_tombstones
+    ON employee_versions (version) WHERE deleted = 1`,
+  `CREATE TRIGGER IF NOT EXISTS employees_version_prune AFTER DELETE ON employees
+    BEGIN
+      UPDATE employees_meta
+        SET value = MAX(value, (SELECT value FROM employees_meta WHERE key = 'data_version') - ${TOMBSTONE_RETENTION})
+        WHERE key = 'pruned_version';
+      DELETE FROM employee_versions
+        WHERE deleted = 1 AND version <= (SELECT value FROM employees_meta WHERE key = 'pruned_version');
+    END`
+];
+
+const DEFAULT_CHANGES_LIMIT = 1000;
+const MAX_CHANGES_LIMIT = 5000;
+
+const META_SQL = `SELECT
+  (SELECT value FROM employees_meta WHERE key = 'data_version') AS version,
+  (SELECT value FROM employees_meta WHERE key = 'row_count') AS total,
+  (SELECT value FROM employees_meta WHERE key = 'pruned_version') AS pruned`;
+
+const DATA_VERSION_SQL = `SELECT value AS version FROM employees_meta WHERE key = 'data_version'`;
+
+const CHANGES_SQL = `SELECT v.id, v.version, v.deleted, e.name, e.email, e.position
+  FROM employee_versions v
+  LEFT JOIN employees e ON e.id = v.id
+  WHERE v.version > ?
+  ORDER BY v.version
+  LIMIT ?`;
+
+// Validates the query string and returns either { error } or { since, limit }.
+function parseChangesQuery(query) {
+  const since = Number(query.since);
+  if (query.since === undefined || !Number.isInteger(since) || since < 0) {
+    return { error: 'since must be a non-negative integer' };
+  }
+
+  let limit = DEFAULT_CHANGES_LIMIT;
+  if (query.limit !== undefined) {
+    limit = Number(query.limit);
+    if (!Number.isInteger(limit) || limit < 1) {
+      return { error: 'limit must be a positive integer' };
+    }
+    limit = Math.min(limit, MAX_CHANGES_LIMIT);
+  }
+
+  return { since, limit };
+}
+
+// Fetches the changes after `since`. When there are more than `limit`, the
+// result has hasMore set and `version` is the point to continue from. A
+// `since` ahead of the database (e.g. after it was recreated) or behind the
+// pruned tombstones yields reset: true, telling the client to reload
+// everything.
+function fetchChanges(db, { since, limit }, callback) {
+  db.get(META_SQL, [], (err, meta) => {
+    if (err) {
+      return callback(err);
+    }
+    if (since > meta.version || since < meta.pruned) {
+      return callback(null, { reset: true, version: meta.version, total: meta.total });
+    }
+    db.all(CHANGES_SQL, [since, limit + 1], (err, rows) => {
+      if (err) {
+        return callback(err);
+      }
+      const hasMore = rows.length > limit;
+      const page = rows.slice(0, limit);
+      const upserts = [];
+      const deletes = [];
+      page.forEach(({ id, deleted, name, email, position }) => {
+        if (deleted) {
+          deletes.push(id);
+        } else {
+          upserts.push({ id, name, email, position });
+        }
+      });
+      callback(null, {
+        version: hasMore ? page[page.length - 1].version : Math.max(since, meta.version),
+        total: meta.total,
+        hasMore,
+        upserts,
+        deletes
+      });
+    });
+  });
+}
+
+module.exports = {
+  SCHEMA,
+  RETENTION_SCHEMA,
+  TOMBSTONE_RETENTION,
+  META_SQL,
+  DATA_VERSION_SQL,
+  parseChangesQuery,
+  fetchChanges
+};
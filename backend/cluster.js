@@ -0,0 +1,161 @@
+// Opt-in multi-process mode: `node cluster.js` instead of `node server.js`.
+//
+// The primary migrates the database once, then forks CLUSTER_WORKERS copies
+// of server.js (default: one per core) that share the listening port. Each
+// worker has its own connection pool; WAL mode and busy_timeout let several
+// processes read concurrently and queue their writes on the database lock.
+//
+// Response caches are per process, but their versions are the database's
+// data_version, which every worker reads from the same file. With one shared
+// cache id, an ETag issued by one worker is valid on all of them, and a write
+// through any worker invalidates every cache on its next request. Workers
+// also share one SESSION_SECRET (random unless set), so a session token
+// issued by one worker is accepted by all.
+//
+// Crashed workers are respawned. SIGINT/SIGTERM stop the workers gracefully:
+// each finishes its in-flight requests and closes its database connections.
+
+const cluster = require('cluster');
+const crypto = require('crypto');
+const os = require('os');
+const path = require('path');
+const sqlite3 = require('sqlite3');
+const { resolveTuning, applyTuning } = require('./db-tuning');
+const { migrate } = require('./migrations');
+
+const SHUTDOWN = 'shutdown';
+
+const SHUTDOWN_TIMEOUT_MS = 10000;
+// A worker that dies sooner than this after starting is respawned with a
+// growing delay instead of immediately, so a crash loop cannot spin the CPU
+const MIN_UPTIME_MS = 5000;
+const MAX_RESPAWN_DELAY_MS = 30000;
+
+function resolveWorkers(value = process.env.CLUSTER_WORKERS) {
+  if (value === undefined || value === '' || value === 'auto') {
+    return os.availableParallelism ? os.availableParallelism() : os.cpus().length;
+  }
+  const workers = Number(value);
+  if (!Number.isInteger(workers) || workers < 1) {
+    throw new Error(`CLUSTER_WORKERS must be a positive integer or "auto", got "${value}"`);
+  }
+  return workers;
+}
+
+function migrateOnce(filename, callback) {
+  const db = new sqlite3.Database(filename, err => {
+    if (err) return callback(err);
+    applyTuning(db, resolveTuning(), err => {
+      if (err) return db.close(() => callback(err));
+      migrate(db, err => db.close(() => callback(err)));
+    });
+  });
+}
+
+function startPrimary({ workers = resolveWorkers(), filename }) {
+  const cacheId = crypto.randomBytes(4).toString('hex');
+  // Every worker must verify the session tokens the others issue
+  const sessionSecret = process.env.SESSION_SECRET || crypto.randomBytes(32).toString('hex');
+  const startedAt = new Map();
+  let respawnDelay = 0;
+  let shuttingDown = false;
+
+  function broadcast(message) {
+    Object.values(cluster.workers).forEach(worker => worker.send(message));
+  }
+
+  function fork() {
+    const worker = cluster.fork({
+      RESPONSE_CACHE_ID: cacheId,
+      SESSION_SECRET: sessionSecret
+    });
+    startedAt.set(worker.id, Date.now());
+  }
+
+  cluster.on('exit', (worker, code, signal) => {
+    const uptime = Date.now() - startedAt.get(worker.id);
+    startedAt.delete(worker.id);
+    if (shuttingDown) {
+      if (Object.keys(cluster.workers).length === 0) {
+        console.log('All workers stopped');
+        process.exit(0);
+      }
+      return;
+    }
+    respawnDelay = uptime < MIN_UPTIME_MS ? Math.min(Math.max(respawnDelay * 2, 500), MAX_RESPAWN_DELAY_MS) : 0;
+    console.error(`Worker ${worker.process.pid} exited (${signal || code}); ` +
+      `respawning${respawnDelay ? ` in ${respawnDelay} ms` : ''}`);
+    setTimeout(fork, respawnDelay);
+  });
+
+  function shutdown(signal) {
+    if (shuttingDown) return;
+    shuttingDown = true;
+    console.log(`${signal} received, stopping ${Object.keys(cluster.workers).length} workers`);
+    broadcast({ type: SHUTDOWN });
+    setTimeout(() => {
+      console.error('Workers did not stop in time, killing them');
+      Object.values(cluster.workers).forEach(worker => worker.process.kill('SIGKILL'));
+      process.exit(1);
+    }, SHUTDOWN_TIMEOUT_MS).unref();
+  }
+  process.on('SIGINT', () => shutdown('SIGINT'));
+  process.on('SIGTERM', () => shutdown('SIGTERM'));
+
+  // Migrating here keeps the workers from racing each other to do it
+  migrateOnce(filename, err => {
+    if (err) {
+      console.error('Could not migrate database', err);
+      process.exit(1);
+    }
+    console.log(`Primary ${process.pid} starting ${workers} workers`);
+    cluster.setupPrimary({ exec: path.join(__dirname, 'server.js') });
+    for (let i = 0; i < workers; i++) {
+      fork();
+    }
+  });
+}
+
+// Response cache options for this process: the shared id when running as a
+// cluster worker, defaults otherwise.
+function workerCacheOptions(env = process.env) {
+  if (!cluster.isWorker) return {};
+  return { id: env.RESPONSE_CACHE_ID };
+}
+
+// Runs when the primary asks this worker to stop; replaced by
+// closeOnShutdown once the server is listening.
+let stopWorker = () => process.exit(0);
+
+// Listens for the primary's shutdown request. Called before the database is
+// ready so a shutdown during startup is not missed. A no-op outside cluster
+// mode.
+function connectWorker() {
+  if (!cluster.isWorker) return;
+
+  process.on('message', message => {
+    if (message && message.type === SHUTDOWN) {
+      stopWorker();
+    }
+  });
+  // Ctrl+C reaches the whole process group; let the primary coordinate
+  process.on('SIGINT', () => {});
+}
+
+// On shutdown, stop accepting connections, let in-flight requests finish,
+// then close the database.
+function closeOnShutdown(server, db) {
+  stopWorker = () => server.close(() => db.close(() => process.exit(0)));
+}
+
+if (require.main === module) {
+  startPrimary({ filename: process.env.SQLITE_PATH || path.resolve(__dirname, 'db.sqlite') });
+}
+
+module.exports = {
+  closeOnShutdown,
+  connectWorker,
+  resolveWorkers,
+  startPrimary,
+  workerCacheOptions
+};
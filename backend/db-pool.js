@@ -0,0 +1,250 @@
+// Connection pool with one writer and N read-only connections.
+//
+// The pool exposes the subset of the sqlite3.Database API the routes use, so
+// it can stand in for a single handle: all/get go to whichever reader is
+// free, while run/exec/prepare/serialize go to the writer. There is no each;
+// use all. With WAL enabled readers see the last committed data and never
+// wait for the writer.
+//
+// A transaction of several statements borrows the writer with acquireWriter()
+// so that no other write can land inside it: writes already running finish
+// first, and run() calls made while it is held wait until it is released.
+//
+// node-sqlite3 runs every query on the libuv threadpool (4 threads unless
+// UV_THREADPOOL_SIZE says otherwise), so more connections than threads adds
+// queueing rather than parallelism.
+//
+// Every connection has its own prepared-statement cache (statement-cache.js);
+// set statementCacheSize to 0 to prepare each statement per call instead.
+
+const sqlite3 = require('sqlite3').verbose();
+const { applyTuning } = require('./db-tuning');
+const { DEFAULT_STATEMENT_CACHE_SIZE, createStatementCache, isCacheable } = require('./statement-cache');
+
+const DEFAULT_READERS = 3;
+
+// Settings that are per-connection and valid on a read-only handle.
+const READER_TUNING = ['busy_timeout', 'cache_size', 'mmap_size', 'temp_store'];
+
+function openConnection(filename, mode) {
+  return new Promise((resolve, reject) => {
+    const conn = new sqlite3.Database(filename, mode, err => (err ? reject(err) : resolve(conn)));
+  });
+}
+
+function tuneConnection(conn, tuning) {
+  return new Promise((resolve, reject) => {
+    applyTuning(conn, tuning, (err, effective) => (err ? reject(err) : resolve(effective)));
+  });
+}
+
+// Opens the writer, applies `tuning`, runs `setup(writer, done)` (schema
+// creation) and then opens the readers. `callback(err, pool)` is called once
+// the pool is ready to serve queries.
+function createPool({
+  filename,
+  readers = DEFAULT_READERS,
+  tuning,
+  setup,
+  statementCacheSize = DEFAULT_STATEMENT_CACHE_SIZE
+}, callback) {
+  const connections = [];
+  const caches = new Map();
+  const idle = [];
+  const waiting = [];
+  const counters = {
+    acquired: 0,
+    waited: 0,
+    totalWaitMs: 0,
+    maxWaitMs: 0,
+    maxQueueDepth: 0,
+    pendingWrites: 0
+  };
+  let writer = null;
+  // Writes in arrival order, and acquireWriter() requests among them
+  const writeQueue = [];
+  let runningWrites = 0;
+  let writerHeld = false;
+
+  function acquire(cb) {
+    const conn = idle.pop();
+    if (conn) {
+      counters.acquired++;
+      return cb(conn);
+    }
+    waiting.push({ cb, enqueuedAt: process.hrtime.bigint() });
+    counters.maxQueueDepth = Math.max(counters.maxQueueDepth, waiting.length);
+  }
+
+  function release(conn) {
+    const next = waiting.shift();
+    if (!next) {
+      idle.push(conn);
+      return;
+    }
+    const waitMs = Number(process.hrtime.bigint() - next.enqueuedAt) / 1e6;
+    counters.acquired++;
+    counters.waited++;
+    counters.totalWaitMs += waitMs;
+    counters.maxWaitMs = Math.max(counters.maxWaitMs, waitMs);
+    next.cb(conn);
+  }
+
+  function addConnection(conn) {
+    connections.push(conn);
+    if (statementCacheSize > 0) {
+      caches.set(conn, createStatementCache(conn, statementCacheSize));
+    }
+  }
+
+  // Runs through the connection's statement cache when it has one
+  function execute(conn, method, sql, params, cb) {
+    const cache = caches.get(conn);
+    if (cache && isCacheable(sql)) {
+      return cache[method](sql, params, cb);
+    }
+    conn[method](sql, params, cb);
+  }
+
+  function read(method) {
+    return (sql, params, cb) => {
+      if (typeof params === 'function') {
+        cb = params;
+        params = [];
+      }
+      acquire(conn => {
+        execute(conn, method, sql, params, function (err, result) {
+          release(conn);
+          cb.call(this, err, result);
+        });
+      });
+    };
+  }
+
+  function runWrite({ sql, params, cb }) {
+    runningWrites++;
+    execute(writer, 'run', sql, params, function (err) {
+      runningWrites--;
+      counters.pendingWrites--;
+      if (cb) cb.call(this, err);
+      pumpWrites();
+    });
+  }
+
+  // Starts queued writes until one needs the writer to itself, which waits
+  // for the writes ahead of it to finish and holds back everything behind it
+  function pumpWrites() {
+    while (!writerHeld && writeQueue.length) {
+      const next = writeQueue[0];
+      if (!next.work) {
+        writeQueue.shift();
+        runWrite(next);
+        continue;
+      }
+      if (runningWrites > 0) return;
+      writeQueue.shift();
+      writerHeld = true;
+      let released = false;
+      next.work(writer, () => {
+        if (released) return;
+        released = true;
+        writerHeld = false;
+        counters.pendingWrites--;
+        pumpWrites();
+      });
+    }
+  }
+
+  function statementStats() {
+    const totals = { size: 0, hits: 0, misses: 0, evictions: 0 };
+    caches.forEach(cache => {
+      const stats = cache.stats();
+      Object.keys(totals).forEach(key => { totals[key] += stats[key]; });
+    });
+    return totals;
+  }
+
+  const pool = {
+    all: read('all'),
+    get: read('get'),
+
+    run(sql, params, cb) {
+      if (typeof params === 'function') {
+        cb = params;
+        params = [];
+      }
+      counters.pendingWrites++;
+      writeQueue.push({ sql, params, cb });
+      pumpWrites();
+    },
+    // `work(writer, release)` gets the writer connection to itself until it
+    // calls release(); statements inside must go to `writer`, not the pool
+    acquireWriter(work) {
+      counters.pendingWrites++;
+      writeQueue.push({ work });
+      pumpWrites();
+    },
+    exec: (sql, cb) => writer.exec(sql, cb),
+    prepare: (...args) => writer.prepare(...args),
+    serialize: (fn) => writer.serialize(fn),
+
+    get writer() {
+      return writer;
+    },
+
+    stats() {
+      return {
+        readers: {
+          size: connections.length - 1,
+          idle: idle.length,
+          busy: connections.length - 1 - idle.length,
+          queueDepth: waiting.length,
+          maxQueueDepth: counters.maxQueueDepth,
+          acquired: counters.acquired,
+          waited: counters.waited,
+          avgWaitMs: counters.waited ? counters.totalWaitMs / counters.waited : 0,
+          maxWaitMs: counters.maxWaitMs
+        },
+        writer: {
+          pendingWrites: counters.pendingWrites,
+          queued: writeQueue.length,
+          held: writerHeld
+        },
+        statements: statementStats()
+      };
+    },
+
+    close(cb) {
+      Promise.all(Array.from(caches.values(), cache => new Promise(resolve => cache.clear(resolve))))
+        .then(() => Promise.all(connections.map(conn => new Promise(resolve => conn.close(resolve)))))
+        .then(() => cb && cb());
+    }
+  };
+
+  (async () => {
+    writer = await openConnection(filename, sqlite3.OPEN_READWRITE | sqlite3.OPEN_CREATE);
+    addConnection(writer);
+    const effective = await tuneConnection(writer, tuning);
+    await new Promise((resolve, reject) => setup(writer, err => (err ? reject(err) : resolve())));
+
+    const readerTuning = {};
+    READER_TUNING.forEach(name => { readerTuning[name] = tuning[name]; });
+    for (let i = 0; i < readers; i++) {
+      const reader = await openConnection(filename, sqlite3.OPEN_READONLY);
+      await tuneConnection(reader, readerTuning);
+      addConnection(reader);
+      release(reader);
+    }
+    return effective;
+  })().then(
+    effective => callback(null, pool, effective),
+    err => callback(err)
+  );
+
+  return pool;
+}
+
+module.exports = {
+  DEFAULT_READERS,
+  createPool
+};
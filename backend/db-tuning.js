@@ -0,0 +1,107 @@
+// SQLite connection tuning applied at startup.
+//
+// Every setting can be overridden through an environment variable, e.g.
+// SQLITE_JOURNAL_MODE=DELETE to fall back to the rollback journal. PRAGMA
+// values cannot be bound as parameters, so each one is validated before it is
+// interpolated.
+
+const DEFAULT_TUNING = {
+  // Milliseconds a connection waits on a lock before failing with SQLITE_BUSY
+  busy_timeout: 5000,
+  // Readers no longer block on writers, and commits append to the WAL
+  journal_mode: 'WAL',
+  // In WAL mode NORMAL only fsyncs at checkpoints and is still corruption-safe
+  synchronous: 'NORMAL',
+  // Negative values are in KiB: 64 MiB of page cache
+  cache_size: -65536,
+  mmap_size: 268435456,
+  temp_store: 'MEMORY'
+};
+
+const SETTINGS = {
+  busy_timeout: { env: 'SQLITE_BUSY_TIMEOUT', type: 'integer' },
+  journal_mode: { env: 'SQLITE_JOURNAL_MODE', values: ['DELETE', 'TRUNCATE', 'PERSIST', 'MEMORY', 'WAL', 'OFF'] },
+  synchronous: { env: 'SQLITE_SYNCHRONOUS', values: ['OFF', 'NORMAL', 'FULL', 'EXTRA'] },
+  cache_size: { env: 'SQLITE_CACHE_SIZE', type: 'integer' },
+  mmap_size: { env: 'SQLITE_MMAP_SIZE', type: 'integer' },
+  temp_store: { env: 'SQLITE_TEMP_STORE', values: ['DEFAULT', 'FILE', 'MEMORY'] }
+};
+
+function validateSetting(name, value) {
+  const setting = SETTINGS[name];
+  if (setting.type === 'integer') {
+    const number = Number(value);
+    if (!Number.isInteger(number)) {
+      throw new Error(`${setting.env} must be an integer, got "${value}"`);
+    }
+    return number;
+  }
+  const upper = String(value).toUpperCase();
+  if (!setting.values.includes(upper)) {
+    throw new Error(`${setting.env} must be one of ${setting.values.join(', ')}, got "${value}"`);
+  }
+  return upper;
+}
+
+// Merges DEFAULT_TUNING, the given overrides and the environment, in that
+// order of precedence (environment wins).
+function resolveTuning(overrides = {}, env = process.env) {
+  const tuning = {};
+  for (const name of Object.keys(SETTINGS)) {
+    let value = name in overrides ? overrides[name] : DEFAULT_TUNING[name];
+    if (env[SETTINGS[name].env] !== undefined) {
+      value = env[SETTINGS[name].env];
+    }
+    tuning[name] = validateSetting(name, value);
+  }
+  return tuning;
+}
+
+// Applies the settings in order and calls back with the values SQLite reports
+// afterwards, which can differ from the requested ones (e.g. WAL is not
+// available for in-memory databases).
+function applyTuning(db, tuning, callback) {
+  const names = Object.keys(tuning);
+  const effective = {};
+  let failed = false;
+
+  // Every statement reports through here, so a rejected PRAGMA fails the
+  // callback once instead of surfacing as an unhandled 'error' event
+  const fail = (err) => {
+    failed = true;
+    callback(err);
+  };
+
+  if (names.length === 0) {
+    return callback(null, effective);
+  }
+
+  db.serialize(() => {
+    names.forEach(name => db.run(`PRAGMA ${name} = ${tuning[name]}`, err => {
+      if (err && !failed) fail(err);
+    }));
+    names.forEach((name, i) => {
+      db.get(`PRAGMA ${name}`, (err, row) => {
+        if (failed) return;
+        if (err) {
+          return fail(err);
+        }
+        // busy_timeout reports its value in a column named "timeout", and
+        // synchronous/temp_store report the index of the value in SETTINGS
+        const value = row ? Object.values(row)[0] : null;
+        effective[name] = SETTINGS[name].values && typeof value === 'number'
+          ? SETTINGS[name].values[value]
+          : value;
+        if (i === names.length - 1) {
+          callback(null, effective);
+        }
+      });
+    });
+  });
+}
+
+module.exports = {
+  DEFAULT_TUNING,
+  resolveTuning,
+  applyTuning
+};
@@ -0,0 +1,94 @@
+// Streaming NDJSON/CSV export for GET /employees/export.
+//
+// Rows are read in keyset batches only when the response asks for more data,
+// so a slow client pauses the reads instead of letting rows pile up in memory
+// (db.each would push every row as fast as SQLite can produce it). At most one
+// batch is held at a time regardless of the size of the table.
+
+const zlib = require('zlib');
+const { Readable, pipeline } = require('stream');
+
+const EXPORT_BATCH_SIZE = 500;
+const COLUMNS = ['id', 'name', 'email', 'position'];
+
+function csvField(value) {
+  const text = String(value);
+  return /[",\r\n]/.test(text) ? `"${text.replace(/"/g, '""')}"` : text;
+}
+
+const FORMATS = {
+  ndjson: {
+    contentType: 'application/x-ndjson; charset=utf-8',
+    extension: 'ndjson',
+    header: '',
+    formatRow: row => JSON.stringify(row) + '\n'
+  },
+  csv: {
+    contentType: 'text/csv; charset=utf-8',
+    extension: 'csv',
+    header: COLUMNS.join(',') + '\r\n',
+    formatRow: row => COLUMNS.map(column => csvField(row[column])).join(',') + '\r\n'
+  }
+};
+
+// A readable stream of formatted text, one database batch per chunk.
+function createExportStream(db, format, batchSize = EXPORT_BATCH_SIZE) {
+  let lastId = 0;
+  let headerSent = false;
+
+  return new Readable({
+    read() {
+      db.all(
+        'SELECT id, name, email, position FROM employees WHERE id > ? ORDER BY id LIMIT ?',
+        [lastId, batchSize],
+        (err, rows) => {
+          if (err) {
+            return this.destroy(err);
+          }
+          let chunk = headerSent ? '' : format.header;
+          headerSent = true;
+          for (const row of rows) {
+            chunk += format.formatRow(row);
+          }
+          if (rows.length > 0) {
+            lastId = rows[rows.length - 1].id;
+          }
+          if (chunk) {
+            this.push(chunk);
+          }
+          if (rows.length < batchSize) {
+            this.push(null);
+          }
+        }
+      );
+    }
+  });
+}
+
+function exportEmployees(db, req, res) {
+  const format = FORMATS[req.query.format || 'ndjson'];
+  if (!format) {
+    return res.status(400).json({ error: `format must be one of: ${Object.keys(FORMATS).join(', ')}` });
+  }
+
+  const streams = [createExportStream(db, format)];
+  res.set('Content-Type', format.contentType);
+  res.set('Content-Disposition', `attachment; filename="employees.${format.extension}"`);
+  res.vary('Accept-Encoding');
+  if (req.acceptsEncodings('gzip', 'identity') === 'gzip') {
+    res.set('Content-Encoding', 'gzip');
+    streams.push(zlib.createGzip());
+  }
+
+  pipeline(...streams, res, (err) => {
+    if (err && err.code !== 'ERR_STREAM_PREMATURE_CLOSE') {
+      console.error('Employee export failed', err);
+    }
+  });
+}
+
+module.exports = {
+  EXPORT_BATCH_SIZE,
+  createExportStream,
+  exportEmployees
+};
@@ -0,0 +1,177 @@
+// Batched employee import shared by POST /employees/bulk and add-sample-data.js.
+//
+// Rows are validated as they arrive and written in chunks, each chunk in its
+// own transaction through a single prepared INSERT, so a large import costs
+// one fsync per chunk instead of one per row.
+
+const DEFAULT_CHUNK_SIZE = 1000;
+const MAX_REPORTED_ERRORS = 1000;
+const EMAIL_PATTERN = /^[^\s@]+@[^\s@]+$/;
+const DUPLICATE_EMAIL_ERROR = 'An employee with this email already exists';
+
+// True for the error SQLite raises on the unique index over employees.email
+function isDuplicateEmail(err) {
+  return Boolean(err) && err.code === 'SQLITE_CONSTRAINT' && /employees\.email/.test(err.message);
+}
+
+// Returns an error message for an invalid row, or null when it can be inserted.
+function validateEmployee(row) {
+  if (!row || typeof row !== 'object' || Array.isArray(row)) {
+    return 'Row must be an object';
+  }
+  const { name, email, position } = row;
+  if (!name || !email || !position) {
+    return 'All fields are required';
+  }
+  if (typeof name !== 'string' || typeof email !== 'string' || typeof position !== 'string') {
+    return 'name, email and position must be strings';
+  }
+  if (!EMAIL_PATTERN.test(email)) {
+    return 'Invalid email address';
+  }
+  return null;
+}
+
+// Lends out the connection to write a transaction on. The pool hands over
+// its writer exclusively, so concurrent writes cannot run inside the
+// transaction; a plain sqlite3.Database (add-sample-data.js) has no other
+// users to wait for.
+function acquireWriter(db, work) {
+  if (typeof db.acquireWriter === 'function') {
+    return db.acquireWriter(work);
+  }
+  work(db, () => {});
+}
+
+// Inserts one chunk of { index, row } entries in a single transaction and
+// resolves with the indexes that were written and the per-row failures.
+function insertChunk(db, chunk) {
+  return new Promise((resolve) => {
+    acquireWriter(db, (conn, release) => {
+      const insertedIndexes = [];
+      const errors = [];
+      const done = (result) => {
+        release();
+        resolve(result);
+      };
+      const failChunk = (err) => chunk.map(({ index }) => ({ index, error: `Transaction failed: ${err.message}` }));
+
+      // IMMEDIATE takes the write lock up front, so with several processes
+      // writing (cluster mode) the chunk waits on busy_timeout instead of
+      // failing with SQLITE_BUSY halfway through
+      conn.run('BEGIN IMMEDIATE', (err) => {
+        if (err) {
+          return done({ insertedIndexes: [], errors: failChunk(err) });
+        }
+        conn.serialize(() => {
+          const stmt = conn.prepare('INSERT INTO employees (name, email, position) VALUES (?, ?, ?)');
+          chunk.forEach(({ index, row }) => {
+            stmt.run([row.name, row.email, row.position], (err) => {
+              if (err) {
+                errors.push({ index, error: isDuplicateEmail(err) ? DUPLICATE_EMAIL_ERROR : err.message });
+              } else {
+                insertedIndexes.push(index);
+              }
+            });
+          });
+          stmt.finalize();
+          conn.run('COMMIT', (err) => {
+            if (!err) {
+              return done({ insertedIndexes, errors });
+            }
+            // The whole chunk is lost if the commit fails, so report every row.
+            conn.run('ROLLBACK', () => {
+              insertedIndexes.forEach(index => errors.push({ index, error: `Transaction failed: ${err.message}` }));
+              done({ insertedIndexes: [], errors });
+            });
+          });
+        });
+      });
+    });
+  });
+}
+
+// Creates an importer that accepts rows one at a time. add() resolves once the
+// row is buffered, or once its chunk has been written when the buffer fills,
+// so callers reading from a stream naturally apply backpressure. onCommit is
+// called after each chunk that wrote at least one row.
+function createImporter(db, { chunkSize = DEFAULT_CHUNK_SIZE, onCommit } = {}) {
+  const startedAt = process.hrtime.bigint();
+  const errors = [];
+  let pending = [];
+  let received = 0;
+  let inserted = 0;
+  let failed = 0;
+
+  const recordError = (error) => {
+    failed++;
+    if (errors.length < MAX_REPORTED_ERRORS) {
+      errors.push(error);
+    }
+  };
+
+  const flush = async () => {
+    if (pending.length === 0) return;
+    const chunk = pending;
+    pending = [];
+    const result = await insertChunk(db, chunk);
+    inserted += result.insertedIndexes.length;
+    if (onCommit && result.insertedIndexes.length > 0) {
+      onCommit();
+    }
+    result.errors.forEach(recordError);
+  };
+
+  return {
+    // Rows that could not be parsed upstream are reported through addError.
+    addError(error) {
+      const index = received++;
+      recordError({ index, error });
+    },
+
+    async add(row) {
+      const index = received++;
+      const error = validateEmployee(row);
+      if (error) {
+        recordError({ index, error });
+        return;
+      }
+      pending.push({ index, row });
+      if (pending.length >= chunkSize) {
+        await flush();
+      }
+    },
+
+    async finish() {
+      await flush();
+      const durationMs = Number(process.hrtime.bigint() - startedAt) / 1e6;
+      errors.sort((a, b) => a.index - b.index);
+      return {
+        received,
+        inserted,
+        failed,
+        errors,
+        errorsTruncated: failed > errors.length,
+        durationMs: Math.round(durationMs * 100) / 100,
+        rowsPerSecond: durationMs > 0 ? Math.round(inserted / (durationMs / 1000)) : inserted
+      };
+    }
+  };
+}
+
+async function importEmployees(db, rows, options) {
+  const importer = createImporter(db, options);
+  for (const row of rows) {
+    await importer.add(row);
+  }
+  return importer.finish();
+}
+
+module.exports = {
+  DEFAULT_CHUNK_SIZE,
+  DUPLICATE_EMAIL_ERROR,
+  isDuplicateEmail,
+  validateEmployee,
+  createImporter,
+  importEmployees
+};
@@ -0,0 +1,49 @@
+// Headcount aggregates behind GET /employees/stats.
+//
+// Both breakdowns are GROUP BYs over an index: idx_employees_position for
+// positions, and the expression index below for email domains, so SQLite
+// walks each index in order and counts runs of equal keys instead of
+// scanning the table and sorting. The planner only matches an expression
+// index when the query spells the expression exactly the same way, hence
+// DOMAIN_SQL is shared by the index and the query.
+
+const DOMAIN_SQL = "lower(substr(email, instr(email, '@') + 1))";
+
+const SCHEMA = [
+  `CREATE INDEX IF NOT EXISTS idx_employees_email_domain ON employees (${DOMAIN_SQL})`
+];
+
+// One statement, so both breakdowns are read from the same snapshot
+const STATS_SQL = `SELECT 'position' AS dimension, position AS value, COUNT(*) AS count
+    FROM employees GROUP BY position
+  UNION ALL
+  SELECT 'domain', ${DOMAIN_SQL}, COUNT(*)
+    FROM employees GROUP BY ${DOMAIN_SQL}`;
+
+const byCount = (a, b) => b.count - a.count || (a.value < b.value ? -1 : a.value > b.value ? 1 : 0);
+
+// `callback(err, { total, totalPositions, totalDomains, positions: [{ position, count }],
+// domains: [{ domain, count }] })`, each list largest first.
+function fetchStats(db, callback) {
+  db.all(STATS_SQL, [], (err, rows) => {
+    if (err) {
+      return callback(err);
+    }
+    const positions = rows.filter(row => row.dimension === 'position').sort(byCount);
+    const domains = rows.filter(row => row.dimension === 'domain').sort(byCount);
+    callback(null, {
+      total: positions.reduce((sum, row) => sum + row.count, 0),
+      totalPositions: positions.length,
+      totalDomains: domains.length,
+      positions: positions.map(({ value, count }) => ({ position: value, count })),
+      domains: domains.map(({ value, count }) => ({ domain: value, count }))
+    });
+  });
+}
+
+module.exports = {
+  DOMAIN_SQL,
+  SCHEMA,
+  STATS_SQL,
+  fetchStats
+};
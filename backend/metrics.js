@@ -0,0 +1,181 @@
+// Request and SQL metrics in the Prometheus text exposition format.
+//
+// Everything is kept in plain counters and fixed-bucket histograms keyed by a
+// pre-rendered label string, so recording a sample is a Map lookup and a few
+// additions; the text is only built when /metrics is scraped.
+
+// Seconds; covers sub-millisecond cache hits up to multi-second exports
+const LATENCY_BUCKETS = [0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10];
+// Bytes
+const SIZE_BUCKETS = [256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216];
+
+const MAX_STATEMENT_LABELS = 200;
+
+function escapeLabel(value) {
+  return String(value).replace(/\\/g, '\\\\').replace(/"/g, '\\"').replace(/\n/g, '\\n');
+}
+
+function labelString(labels) {
+  return Object.keys(labels).map(name => `${name}="${escapeLabel(labels[name])}"`).join(',');
+}
+
+function withLabels(name, labels, extra) {
+  const all = [labels, extra].filter(Boolean).join(',');
+  return all ? `${name}{${all}}` : name;
+}
+
+function createCounter(name, help) {
+  const series = new Map();
+  return {
+    inc(labels, by = 1) {
+      series.set(labels, (series.get(labels) || 0) + by);
+    },
+    render() {
+      const lines = [`# HELP ${name} ${help}`, `# TYPE ${name} counter`];
+      series.forEach((value, labels) => lines.push(`${withLabels(name, labels)} ${value}`));
+      return lines.join('\n');
+    }
+  };
+}
+
+function createHistogram(name, help, buckets) {
+  const series = new Map();
+  return {
+    observe(labels, value) {
+      let entry = series.get(labels);
+      if (!entry) {
+        entry = { counts: new Array(buckets.length).fill(0), sum: 0, count: 0 };
+        series.set(labels, entry);
+      }
+      // Counts are per bucket here and made cumulative when rendered
+      for (let i = 0; i < buckets.length; i++) {
+        if (value <= buckets[i]) {
+          entry.counts[i]++;
+          break;
+        }
+      }
+      entry.sum += value;
+      entry.count++;
+    },
+    render() {
+      const lines = [`# HELP ${name} ${help}`, `# TYPE ${name} histogram`];
+      series.forEach((entry, labels) => {
+        let cumulative = 0;
+        buckets.forEach((bound, i) => {
+          cumulative += entry.counts[i];
+          lines.push(`${withLabels(`${name}_bucket`, labels, `le="${bound}"`)} ${cumulative}`);
+        });
+        lines.push(`${withLabels(`${name}_bucket`, labels, 'le="+Inf"')} ${entry.count}`);
+        lines.push(`${withLabels(`${name}_sum`, labels)} ${entry.sum}`);
+        lines.push(`${withLabels(`${name}_count`, labels)} ${entry.count}`);
+      });
+      return lines.join('\n');
+    }
+  };
+}
+
+function seconds(startedAt) {
+  return Number(process.hrtime.bigint() - startedAt) / 1e9;
+}
+
+// "SELECT ... FROM employees_fts ..." -> "SELECT employees_fts". Statement
+// text varies with sort/cursor options, so it is reduced to verb and table
+// to keep the number of series small.
+const STATEMENT_PATTERN = /^\s*(\w+)\b[\s\S]*?\b(?:FROM|INTO|UPDATE|TABLE)\s+(\w+)/i;
+
+function createMetrics() {
+  let inFlight = 0;
+  const gauges = [];
+  const statementLabels = new Map();
+
+  const requests = createCounter('http_requests_total', 'HTTP requests by method, route and status.');
+  const duration = createHistogram('http_request_duration_seconds',
+    'Time from receiving a request until its response is finished.', LATENCY_BUCKETS);
+  const responseSize = createHistogram('http_response_size_bytes',
+    'Response body size, for responses that set Content-Length.', SIZE_BUCKETS);
+  const sqlDuration = createHistogram('sqlite_statement_duration_seconds',
+    'SQL statement time including any wait for a pooled connection.', LATENCY_BUCKETS);
+  const sqlErrors = createCounter('sqlite_statement_errors_total', 'SQL statements that returned an error.');
+
+  function statementLabel(method, sql) {
+    let label = statementLabels.get(sql);
+    if (label === undefined) {
+      const match = STATEMENT_PATTERN.exec(sql);
+      const statement = match ? `${match[1].toUpperCase()} ${match[2]}` : sql.trim().split(/\s+/)[0].toUpperCase();
+      label = labelString({ method, statement });
+      if (statementLabels.size < MAX_STATEMENT_LABELS) {
+        statementLabels.set(sql, label);
+      }
+    }
+    return label;
+  }
+
+  // Records every request once its response has been sent. The route label
+  // is the matched Express path (e.g. /employees/:id), never the raw URL.
+  function middleware(req, res, next) {
+    const startedAt = process.hrtime.bigint();
+    inFlight++;
+    res.once('close', () => {
+      inFlight--;
+      const route = req.route ? req.baseUrl + req.route.path : 'unmatched';
+      const routeLabels = labelString({ method: req.method, route });
+      requests.inc(labelString({ method: req.method, route, status: res.statusCode }));
+      duration.observe(routeLabels, seconds(startedAt));
+      const length = Number(res.getHeader('Content-Length'));
+      if (length >= 0) {
+        responseSize.observe(routeLabels, length);
+      }
+    });
+    next();
+  }
+
+  // Replaces db.all/get/run with versions that time each statement
+  function instrumentDb(db) {
+    ['all', 'get', 'run'].forEach(method => {
+      const original = db[method];
+      db[method] = function (sql, params, cb) {
+        if (typeof params === 'function') {
+          cb = params;
+          params = [];
+        }
+        const labels = statementLabel(method, sql);
+        const startedAt = process.hrtime.bigint();
+        return original.call(this, sql, params, function (err, result) {
+          sqlDuration.observe(labels, seconds(startedAt));
+          if (err) {
+            sqlErrors.inc(labels);
+          }
+          if (cb) cb.call(this, err, result);
+        });
+      };
+    });
+    return db;
+  }
+
+  // `collect()` is called on every scrape and returns the current value
+  function gauge(name, help, collect) {
+    gauges.push({ name, help, collect });
+  }
+
+  gauge('http_requests_in_flight', 'Requests received but not yet answered.', () => inFlight);
+
+  function render() {
+    const sections = gauges.map(({ name, help, collect }) =>
+      `# HELP ${name} ${help}\n# TYPE ${name} gauge\n${name} ${collect()}`);
+    sections.push(requests.render(), duration.render(), responseSize.render(),
+      sqlDuration.render(), sqlErrors.render());
+    return sections.join('\n') + '\n';
+  }
+
+  function handler(req, res) {
+    res.type('text/plain; version=0.0.4').send(render());
+  }
+
+  return { middleware, instrumentDb, gauge, render, handler };
+}
+
+module.exports = {
+  LATENCY_BUCKETS,
+  SIZE_BUCKETS,
+  createMetrics
+};
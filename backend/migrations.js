@@ -0,0 +1,157 @@
+// Versioned schema migrations.
+//
+// The applied version is stored in the database header (PRAGMA user_version).
+// At startup every migration newer than that runs in order, all in a single
+// IMMEDIATE transaction together with the version bump: either the whole
+// upgrade lands or none of it does, and no other connection can write in
+// between. Building indexes inside one transaction also means each index is
+// written out once rather than committed statement by statement.
+//
+// Migrations are append-only. Change the schema by adding a new entry, never
+// by editing one that has shipped. A step is either an SQL string or a
+// function `(conn, cb)` for checks that need to inspect data first.
+
+const search = require('./search');
+const changes = require('./changes');
+const stats = require('./employee-stats');
+const auth = require('./auth');
+
+const MIGRATIONS = [
+  {
+    version: 1,
+    name: 'baseline',
+    // The schema server.js used to create inline with IF NOT EXISTS, so it is
+    // a no-op on databases created before migrations existed
+    steps: [
+      `CREATE TABLE IF NOT EXISTS employees (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        email TEXT NOT NULL,
+        position TEXT NOT NULL
+      )`,
+      // Row count kept up to date by triggers so list responses can report
+      // the total without a COUNT(*) scan of the table.
+      `CREATE TABLE IF NOT EXISTS employees_meta (
+        key TEXT PRIMARY KEY,
+        value INTEGER NOT NULL
+      )`,
+      `INSERT OR IGNORE INTO employees_meta (key, value)
+        SELECT 'row_count', COUNT(*) FROM employees`,
+      `CREATE TRIGGER IF NOT EXISTS employees_count_insert AFTER INSERT ON employees
+        BEGIN
+          UPDATE employees_meta SET value = value + 1 WHERE key = 'row_count';
+        END`,
+      `CREATE TRIGGER IF NOT EXISTS employees_count_delete AFTER DELETE ON employees
+        BEGIN
+          UPDATE employees_meta SET value = value - 1 WHERE key = 'row_count';
+        END`,
+      ...search.SCHEMA,
+      ...changes.SCHEMA
+    ]
+  },
+  {
+    version: 2,
+    name: 'employee indexes and unique email',
+    steps: [
+      checkDuplicateEmails,
+      'CREATE UNIQUE INDEX IF NOT EXISTS idx_employees_email ON employees (email)',
+      // SQLite appends the rowid to every index entry, so these also serve
+      // the (name, id) / (position, id) keyset pagination order
+      'CREATE INDEX IF NOT EXISTS idx_employees_name ON employees (name)',
+      'CREATE INDEX IF NOT EXISTS idx_employees_position ON employees (position)'
+    ]
+  },
+  {
+    version: 3,
+    name: 'email domain index',
+    steps: stats.SCHEMA
+  },
+  {
+    version: 4,
+    name: 'users with hashed passwords',
+    steps: auth.SCHEMA
+  },
+  {
+    version: 5,
+    name: 'change log tombstone retention',
+    steps: changes.RETENTION_SCHEMA
+  }
+];
+
+const LATEST_VERSION = MIGRATIONS[MIGRATIONS.length - 1].version;
+
+// Refuses to build the unique index over duplicate emails rather than
+// silently dropping rows; the error names the duplicates to clean up.
+function checkDuplicateEmails(conn, cb) {
+  conn.all(`SELECT email, COUNT(*) AS count FROM employees
+    GROUP BY email HAVING COUNT(*) > 1
+    ORDER BY count DESC LIMIT 10`, [], (err, rows) => {
+    if (err || rows.length === 0) {
+      return cb(err);
+    }
+    const examples = rows.map(row => `${row.email} (${row.count} rows)`).join(', ');
+    cb(new Error(`Cannot add a unique index on employees.email: duplicate emails exist, e.g. ${examples}. ` +
+      'Remove or change the duplicates and restart.'));
+  });
+}
+
+function run(conn, sql) {
+  return new Promise((resolve, reject) => {
+    conn.run(sql, err => (err ? reject(err) : resolve()));
+  });
+}
+
+function runStep(conn, step) {
+  if (typeof step === 'function') {
+    return new Promise((resolve, reject) => step(conn, err => (err ? reject(err) : resolve())));
+  }
+  return run(conn, step);
+}
+
+function schemaVersion(conn) {
+  return new Promise((resolve, reject) => {
+    conn.get('PRAGMA user_version', [], (err, row) => (err ? reject(err) : resolve(row.user_version)));
+  });
+}
+
+async function applyMigrations(conn, migrations, log) {
+  const current = await schemaVersion(conn);
+  const pending = migrations.filter(migration => migration.version > current);
+  if (pending.length === 0) {
+    return { from: current, to: current, applied: [] };
+  }
+
+  const target = pending[pending.length - 1].version;
+  const startedAt = process.hrtime.bigint();
+  await run(conn, 'BEGIN IMMEDIATE');
+  try {
+    for (const migration of pending) {
+      log(`Applying migration ${migration.version}: ${migration.name}`);
+      for (const step of migration.steps) {
+        await runStep(conn, step);
+      }
+    }
+    // user_version lives in the database header, which is part of the
+    // transaction, so it only moves if the migrations commit
+    await run(conn, `PRAGMA user_version = ${target}`);
+    await run(conn, 'COMMIT');
+  } catch (err) {
+    await run(conn, 'ROLLBACK').catch(() => {});
+    throw err;
+  }
+  const ms = Number(process.hrtime.bigint() - startedAt) / 1e6;
+  log(`Schema migrated from version ${current} to ${target} in ${ms.toFixed(0)} ms`);
+  return { from: current, to: target, applied: pending.map(migration => migration.version) };
+}
+
+// Brings the database at `conn` up to the latest schema version.
+// `callback(err, { from, to, applied })`.
+function migrate(conn, callback, { migrations = MIGRATIONS, log = console.log } = {}) {
+  applyMigrations(conn, migrations, log).then(result => callback(null, result), callback);
+}
+
+module.exports = {
+  LATEST_VERSION,
+  MIGRATIONS,
+  migrate
+};
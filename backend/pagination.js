@@ -0,0 +1,104 @@
+// Keyset pagination helpers for GET /employees.
+//
+// Cursors are opaque base64url strings holding the sort key of the last row
+// of the previous page ([id] when sorting by id, [value, id] otherwise), so
+// every page is an index range scan instead of an OFFSET walk.
+
+const SORTABLE_COLUMNS = ['id', 'name', 'email', 'position'];
+const DEFAULT_LIMIT = 50;
+const MAX_LIMIT = 500;
+
+function encodeCursor(row, sort) {
+  const key = sort === 'id' ? [row.id] : [row[sort], row.id];
+  return Buffer.from(JSON.stringify(key)).toString('base64url');
+}
+
+function decodeCursor(cursor, sort) {
+  let key;
+  try {
+    key = JSON.parse(Buffer.from(cursor, 'base64url').toString('utf8'));
+  } catch {
+    return null;
+  }
+  const expectedLength = sort === 'id' ? 1 : 2;
+  if (!Array.isArray(key) || key.length !== expectedLength) {
+    return null;
+  }
+  if (!Number.isInteger(key[key.length - 1])) {
+    return null;
+  }
+  if (sort !== 'id' && typeof key[0] !== 'string') {
+    return null;
+  }
+  return key;
+}
+
+// Validates the query string and returns either { error } or the normalised
+// { limit, sort, order, cursor } options.
+function parseListQuery(query) {
+  const sort = query.sort || 'id';
+  if (!SORTABLE_COLUMNS.includes(sort)) {
+    return { error: `sort must be one of: ${SORTABLE_COLUMNS.join(', ')}` };
+  }
+
+  const order = String(query.order || 'asc').toLowerCase();
+  if (order !== 'asc' && order !== 'desc') {
+    return { error: 'order must be asc or desc' };
+  }
+
+  let limit = DEFAULT_LIMIT;
+  if (query.limit !== undefined) {
+    limit = Number(query.limit);
+    if (!Number.isInteger(limit) || limit < 1) {
+      return { error: 'limit must be a positive integer' };
+    }
+    limit = Math.min(limit, MAX_LIMIT);
+  }
+
+  let cursor = null;
+  if (query.cursor) {
+    cursor = decodeCursor(String(query.cursor), sort);
+    if (!cursor) {
+      return { error: 'Invalid cursor' };
+    }
+  }
+
+  return { limit, sort, order, cursor };
+}
+
+// Builds the page query. One extra row is fetched so the caller can tell
+// whether another page exists without a second round trip.
+function buildListQuery({ limit, sort, order, cursor }) {
+  const direction = order === 'desc' ? 'DESC' : 'ASC';
+  const comparison = order === 'desc' ? '<' : '>';
+  const orderBy = sort === 'id' ? `id ${direction}` : `${sort} ${direction}, id ${direction}`;
+
+  const clauses = ['SELECT id, name, email, position FROM employees'];
+  const params = [];
+  if (cursor) {
+    clauses.push(sort === 'id'
+      ? `WHERE id ${comparison} ?`
+      : `WHERE (${sort}, id) ${comparison} (?, ?)`);
+    params.push(...cursor);
+  }
+  clauses.push(`ORDER BY ${orderBy}`, 'LIMIT ?');
+  params.push(limit + 1);
+
+  return { sql: clauses.join(' '), params };
+}
+
+// Splits the over-fetched rows into the page and the cursor for the next one.
+function paginate(rows, { limit, sort }) {
+  const page = rows.slice(0, limit);
+  const nextCursor = rows.length > limit ? encodeCursor(page[page.length - 1], sort) : null;
+  return { page, nextCursor };
+}
+
+module.exports = {
+  SORTABLE_COLUMNS,
+  DEFAULT_LIMIT,
+  MAX_LIMIT,
+  parseListQuery,
+  buildListQuery,
+  paginate
+};
@@ -0,0 +1,35 @@
+// Alternative JSON layouts for the employee list routes (?shape=).
+//
+// "objects" (the default) is an array of { id, name, email, position }.
+// "columns" names each field once and sends the values as parallel arrays,
+// { fields: ['id', ...], values: [[1, 2, ...], ['Jane', 'John', ...], ...] },
+// which removes the repeated keys that make up most of a large page.
+
+const SHAPES = ['objects', 'columns'];
+const EMPLOYEE_FIELDS = ['id', 'name', 'email', 'position'];
+
+// Validates ?shape= and returns either { error } or { shape }.
+function parseShape(query) {
+  const shape = query.shape === undefined ? 'objects' : String(query.shape);
+  if (!SHAPES.includes(shape)) {
+    return { error: `shape must be one of: ${SHAPES.join(', ')}` };
+  }
+  return { shape };
+}
+
+function shapeRows(rows, shape, fields = EMPLOYEE_FIELDS) {
+  if (shape !== 'columns') {
+    return rows;
+  }
+  return {
+    fields,
+    values: fields.map(field => rows.map(row => row[field]))
+  };
+}
+
+module.exports = {
+  EMPLOYEE_FIELDS,
+  SHAPES,
+  parseShape,
+  shapeRows
+};
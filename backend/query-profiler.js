@@ -0,0 +1,155 @@
+// Opt-in SQL profiler: aggregates timings per statement, and logs statements
+// slower than a threshold together with their parameters and query plan.
+//
+// Enabled by setting SLOW_QUERY_MS (e.g. SLOW_QUERY_MS=50). The plan is
+// fetched with EXPLAIN QUERY PLAN the first time a statement is slow and
+// then reused, so a steady stream of slow queries costs one extra lookup
+// per distinct statement, not per execution.
+
+const DEFAULT_TOP = 20;
+const MAX_STATEMENTS = 500;
+const SORT_KEYS = ['totalMs', 'maxMs', 'avgMs', 'calls', 'slowCalls'];
+// Statements on these tables bind usernames and password hashes; their
+// parameters are neither logged nor kept for /admin/queries
+const REDACTED_TABLES = /\busers\b/i;
+const REDACTED = '[redacted]';
+
+// Whitespace-normalised so the same statement built on different lines of
+// code aggregates into one entry
+function normalize(sql) {
+  return sql.replace(/\s+/g, ' ').trim();
+}
+
+// "SCAN employees" is a full table scan; "SCAN employees USING INDEX ..."
+// and "SEARCH ..." are not.
+function fullScans(plan) {
+  return plan
+    .map(step => /^SCAN (\w+)$/.exec(step.detail))
+    .filter(Boolean)
+    .map(match => match[1]);
+}
+
+function redactParams(sql, params) {
+  return REDACTED_TABLES.test(sql) ? params.map(() => REDACTED) : params;
+}
+
+function resolveThreshold(env = process.env) {
+  if (env.SLOW_QUERY_MS === undefined || env.SLOW_QUERY_MS === '') {
+    return null;
+  }
+  const threshold = Number(env.SLOW_QUERY_MS);
+  if (!Number.isFinite(threshold) || threshold < 0) {
+    throw new Error(`Invalid SLOW_QUERY_MS: ${env.SLOW_QUERY_MS} (expected a number of milliseconds)`);
+  }
+  return threshold;
+}
+
+function createQueryProfiler({ thresholdMs = resolveThreshold(), log = console.warn } = {}) {
+  const enabled = thresholdMs !== null;
+  const statements = new Map();
+  let explain = null;
+
+  function entryFor(sql) {
+    let entry = statements.get(sql);
+    if (!entry && statements.size < MAX_STATEMENTS) {
+      entry = { sql, calls: 0, errors: 0, totalMs: 0, maxMs: 0, slowCalls: 0, slowest: null, plan: null };
+      statements.set(sql, entry);
+    }
+    return entry;
+  }
+
+  function withPlan(entry, cb) {
+    if (entry.plan || !explain) {
+      return cb(entry.plan);
+    }
+    explain(`EXPLAIN QUERY PLAN ${entry.sql}`, entry.slowest.params, (err, rows) => {
+      // Statements that cannot be explained (e.g. PRAGMA) still get logged
+      entry.plan = err ? [] : rows.map(row => ({ id: row.id, parent: row.parent, detail: row.detail }));
+      cb(entry.plan);
+    });
+  }
+
+  function record(sql, params, ms, err) {
+    const entry = entryFor(normalize(sql));
+    if (!entry) return;
+    entry.calls++;
+    entry.totalMs += ms;
+    entry.maxMs = Math.max(entry.maxMs, ms);
+    if (err) entry.errors++;
+    if (ms < thresholdMs) return;
+
+    entry.slowCalls++;
+    params = redactParams(entry.sql, params);
+    if (!entry.slowest || ms >= entry.slowest.ms) {
+      entry.slowest = { ms, params, at: new Date().toISOString() };
+    }
+    withPlan(entry, plan => {
+      const scans = plan && fullScans(plan);
+      log(`[slow query] ${ms.toFixed(1)} ms: ${entry.sql}\n` +
+        `  params: ${JSON.stringify(params)}\n` +
+        `  plan: ${plan && plan.length ? plan.map(step => step.detail).join(' | ') : 'n/a'}` +
+        (scans && scans.length ? `\n  full scan of: ${scans.join(', ')}` : ''));
+    });
+  }
+
+  // Wraps db.all/get/run in place. `db` keeps its original methods for the
+  // plan lookups, so they are neither profiled nor counted in other wrappers
+  // installed afterwards.
+  function instrumentDb(db) {
+    if (!enabled) return db;
+    explain = db.all.bind(db);
+    ['all', 'get', 'run'].forEach(method => {
+      const original = db[method];
+      db[method] = function (sql, params, cb) {
+        if (typeof params === 'function') {
+          cb = params;
+          params = [];
+        }
+        const startedAt = process.hrtime.bigint();
+        return original.call(this, sql, params, function (err, result) {
+          record(sql, params, Number(process.hrtime.bigint() - startedAt) / 1e6, err);
+          if (cb) cb.call(this, err, result);
+        });
+      };
+    });
+    return db;
+  }
+
+  // Most expensive statements first, by `sort` (default total time)
+  function top({ limit = DEFAULT_TOP, sort = 'totalMs' } = {}) {
+    const key = SORT_KEYS.includes(sort) ? sort : 'totalMs';
+    const rows = Array.from(statements.values(), entry => ({
+      sql: entry.sql,
+      calls: entry.calls,
+      errors: entry.errors,
+      totalMs: Number(entry.totalMs.toFixed(3)),
+      avgMs: Number((entry.totalMs / entry.calls).toFixed(3)),
+      maxMs: Number(entry.maxMs.toFixed(3)),
+      slowCalls: entry.slowCalls,
+      slowest: entry.slowest,
+      plan: entry.plan,
+      fullScans: entry.plan ? fullScans(entry.plan) : null
+    }));
+    rows.sort((a, b) => b[key] - a[key]);
+    return {
+      enabled,
+      thresholdMs,
+      sort: key,
+      statements: rows.slice(0, limit)
+    };
+  }
+
+  function reset() {
+    statements.clear();
+  }
+
+  return { enabled, thresholdMs, instrumentDb, top, reset };
+}
+
+module.exports = {
+  SORT_KEYS,
+  createQueryProfiler,
+  fullScans,
+  redactParams,
+  resolveThreshold
+};
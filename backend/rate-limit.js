@@ -0,0 +1,220 @@
+// Fixed-memory sliding-window rate limiting for POST /login.
+//
+// Each key (an IP address or a username) gets a ring of `buckets` counters
+// covering one window; the count for a key is the sum of its ring, and
+// buckets are zeroed as time moves past them, so the window slides in
+// windowMs / buckets steps without storing a timestamp per attempt. Keys live
+// in a Map in least-recently-used order and the oldest is dropped beyond
+// maxKeys, which bounds memory at roughly maxKeys * (buckets * 4 + ~100) bytes
+// however many clients show up.
+//
+// Every login costs an scrypt hash, so attempts are limited per IP to cap the
+// CPU one client can take, and failed attempts per username to slow down
+// password guessing against one account from many addresses. Limits are per
+// process: in cluster mode each worker keeps its own counts.
+
+const DEFAULT_WINDOW_SECONDS = 60;
+const DEFAULT_BUCKETS = 6;
+const DEFAULT_MAX_KEYS = 10000;
+const DEFAULT_PER_IP = 100;
+const DEFAULT_PER_USER = 10;
+
+function nonNegativeInteger(env, name, fallback) {
+  if (env[name] === undefined || env[name] === '') {
+    return fallback;
+  }
+  const value = Number(env[name]);
+  if (!Number.isInteger(value) || value < 0) {
+    throw new Error(`${name} must be a non-negative integer, got "${env[name]}"`);
+  }
+  return value;
+}
+
+// Reads LOGIN_RATE_LIMIT_PER_IP, LOGIN_RATE_LIMIT_PER_USER (0 disables
+// either), LOGIN_RATE_LIMIT_WINDOW_SECONDS and LOGIN_RATE_LIMIT_MAX_KEYS.
+function resolveLoginLimits(env = process.env) {
+  const windowSeconds = nonNegativeInteger(env, 'LOGIN_RATE_LIMIT_WINDOW_SECONDS', DEFAULT_WINDOW_SECONDS);
+  const maxKeys = nonNegativeInteger(env, 'LOGIN_RATE_LIMIT_MAX_KEYS', DEFAULT_MAX_KEYS);
+  if (windowSeconds < 1 || maxKeys < 1) {
+    throw new Error('LOGIN_RATE_LIMIT_WINDOW_SECONDS and LOGIN_RATE_LIMIT_MAX_KEYS must be at least 1');
+  }
+  return {
+    perIp: nonNegativeInteger(env, 'LOGIN_RATE_LIMIT_PER_IP', DEFAULT_PER_IP),
+    perUser: nonNegativeInteger(env, 'LOGIN_RATE_LIMIT_PER_USER', DEFAULT_PER_USER),
+    windowMs: windowSeconds * 1000,
+    maxKeys
+  };
+}
+
+// Allows `limit` hits per key in any `windowMs`. Returns
+// { check, hit, consume, reset, stats }; check and consume report
+// { allowed, remaining, retryAfterMs }.
+function createRateLimiter({
+  limit,
+  windowMs,
+  buckets = DEFAULT_BUCKETS,
+  maxKeys = DEFAULT_MAX_KEYS,
+  now = Date.now
+}) {
+  const bucketMs = windowMs / buckets;
+  // key -> { counts, bucket }: counts[b % buckets] holds the hits in bucket
+  // number b, and `bucket` is the newest bucket number written
+  const entries = new Map();
+  const counters = { allowed: 0, limited: 0, evictions: 0 };
+
+  // Zeroes the buckets that have slid out of the window since last use
+  function advance(entry, current) {
+    const gap = current - entry.bucket;
+    if (gap >= buckets) {
+      entry.counts.fill(0);
+    } else {
+      for (let b = entry.bucket + 1; b <= current; b++) {
+        entry.counts[b % buckets] = 0;
+      }
+    }
+    entry.bucket = current;
+  }
+
+  function lookup(key, current, create) {
+    let entry = entries.get(key);
+    if (entry) {
+      // Re-insert to keep the Map in least-recently-used order
+      entries.delete(key);
+      entries.set(key, entry);
+      advance(entry, current);
+      return entry;
+    }
+    if (!create) {
+      return null;
+    }
+    entry = { counts: new Uint32Array(buckets), bucket: current };
+    entries.set(key, entry);
+    if (entries.size > maxKeys) {
+      entries.delete(entries.keys().next().value);
+      counters.evictions++;
+    }
+    return entry;
+  }
+
+  function total(entry) {
+    let sum = 0;
+    for (let i = 0; i < buckets; i++) sum += entry.counts[i];
+    return sum;
+  }
+
+  // Time until enough of the oldest hits leave the window to allow one more
+  function retryAfter(entry, count, nowMs) {
+    const excess = count - limit + 1;
+    let dropped = 0;
+    for (let b = entry.bucket - buckets + 1; b <= entry.bucket; b++) {
+      dropped += entry.counts[((b % buckets) + buckets) % buckets];
+      if (dropped >= excess) {
+        return Math.max(0, (b + buckets) * bucketMs - nowMs);
+      }
+    }
+    return windowMs;
+  }
+
+  function check(key, nowMs = now()) {
+    const entry = lookup(key, Math.floor(nowMs / bucketMs), false);
+    const count = entry ? total(entry) : 0;
+    if (count < limit) {
+      return { allowed: true, remaining: limit - count, retryAfterMs: 0 };
+    }
+    return { allowed: false, remaining: 0, retryAfterMs: retryAfter(entry, count, nowMs) };
+  }
+
+  function hit(key, nowMs = now()) {
+    const current = Math.floor(nowMs / bucketMs);
+    const entry = lookup(key, current, true);
+    entry.counts[current % buckets]++;
+  }
+
+  return {
+    check,
+    hit,
+
+    // Counts a hit if the key is under its limit
+    consume(key) {
+      const nowMs = now();
+      const result = check(key, nowMs);
+      if (result.allowed) {
+        hit(key, nowMs);
+        result.remaining--;
+        counters.allowed++;
+      } else {
+        counters.limited++;
+      }
+      return result;
+    },
+
+    reset(key) {
+      entries.delete(key);
+    },
+
+    stats() {
+      return { limit, windowMs, buckets, keys: entries.size, maxKeys, ...counters };
+    }
+  };
+}
+
+// Login limits: `middleware` answers 429 with Retry-After when the client's
+// IP is over its attempt limit or the username over its failure limit. Each
+// attempt on a username is counted as a failure before the password is
+// hashed, so concurrent guesses cannot all slip under the limit while their
+// hashes run; the handler clears the count with `succeeded(req)`.
+function createLoginLimiter({ perIp, perUser, windowMs, maxKeys }) {
+  const byIp = perIp > 0 ? createRateLimiter({ limit: perIp, windowMs, maxKeys }) : null;
+  const byUser = perUser > 0 ? createRateLimiter({ limit: perUser, windowMs, maxKeys }) : null;
+  // No key for a missing or non-string username: the handler rejects those
+  // with 400, and counting them together would lock every such request out
+  const userKey = (req) => {
+    const username = req.body && req.body.username;
+    return typeof username === 'string' && username ? username.toLowerCase() : null;
+  };
+
+  function reject(res, retryAfterMs) {
+    res.set('Retry-After', String(Math.max(1, Math.ceil(retryAfterMs / 1000))));
+    res.status(429).json({
+      success: false,
+      error: 'Too many login attempts. Please try again later.'
+    });
+  }
+
+  return {
+    middleware(req, res, next) {
+      if (byIp) {
+        const result = byIp.consume(req.ip);
+        if (!result.allowed) {
+          return reject(res, result.retryAfterMs);
+        }
+      }
+      const key = byUser && userKey(req);
+      if (key) {
+        const result = byUser.consume(key);
+        if (!result.allowed) {
+          return reject(res, result.retryAfterMs);
+        }
+      }
+      next();
+    },
+
+    succeeded(req) {
+      const key = byUser && userKey(req);
+      if (key) byUser.reset(key);
+    },
+
+    stats() {
+      return {
+        ip: byIp ? byIp.stats() : null,
+        user: byUser ? byUser.stats() : null
+      };
+    }
+  };
+}
+
+module.exports = {
+  createLoginLimiter,
+  createRateLimiter,
+  resolveLoginLimits
+};
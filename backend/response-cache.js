@@ -0,0 +1,168 @@
+// Versioned response cache with strong ETags for the read-only list routes.
+//
+// Cached bodies and ETags are keyed on the database's data version, which the
+// change-log triggers (changes.js) increment on every insert, update and
+// delete, whichever process or tool makes it. Each request first reads that
+// version, a single-row lookup: if it moved, every cached body is dropped, and
+// a conditional request for unchanged data is answered with 304 without
+// running the route's query. The boot id keeps ETags from a previous process
+// (or a recreated database, whose version restarts) from ever matching.
+//
+// bump() drops the cache straight away after a write by this process. In
+// cluster mode every worker is created with the same id, so their ETags for
+// the same data version match (see cluster.js).
+//
+// Bodies of COMPRESSION_THRESHOLD bytes or more are sent brotli- or
+// gzip-compressed when the client accepts it. Each encoding is compressed at
+// most once per cached entry and has its own ETag, since the bytes differ.
+
+const crypto = require('crypto');
+const zlib = require('zlib');
+
+const DEFAULT_MAX_ENTRIES = 200;
+const COMPRESSION_THRESHOLD = 1024;
+
+// Brotli's default quality (11) is far too slow for responses built on
+// demand; 5 still compresses repetitive JSON better than gzip.
+const ENCODERS = {
+  br: (body, cb) => zlib.brotliCompress(body, {
+    params: {
+      [zlib.constants.BROTLI_PARAM_QUALITY]: 5,
+      [zlib.constants.BROTLI_PARAM_SIZE_HINT]: body.length
+    }
+  }, cb),
+  gzip: (body, cb) => zlib.gzip(body, cb)
+};
+
+function negotiateEncoding(req, body) {
+  if (body.length < COMPRESSION_THRESHOLD) return 'identity';
+  const encoding = req.acceptsEncodings('br', 'gzip', 'identity');
+  return ENCODERS[encoding] ? encoding : 'identity';
+}
+
+// Returns the tag in the If-None-Match header that matches one of `etags`
+function matchingEtag(header, etags) {
+  if (!header) return null;
+  if (header.trim() === '*') return etags[0];
+  const tags = header.split(',').map(tag => tag.trim().replace(/^W\//, ''));
+  return etags.find(etag => tags.includes(etag)) || null;
+}
+
+// `readVersion(cb)` calls back with the database's current data version.
+function createResponseCache({
+  readVersion,
+  maxEntries = DEFAULT_MAX_ENTRIES,
+  id = crypto.randomBytes(4).toString('hex')
+} = {}) {
+  const bootId = id;
+  const entries = new Map();
+  // Database version the cached entries were built at
+  let version = null;
+  // Local writes, so a result produced across one is not cached
+  let generation = 0;
+
+  function clear() {
+    generation++;
+    entries.clear();
+  }
+
+  const etagFor = (v, encoding = 'identity') =>
+    (encoding === 'identity' ? `"${bootId}-${v}"` : `"${bootId}-${v}-${encoding}"`);
+
+  function respond(res, entry, encoding, body) {
+    res.set(entry.headers);
+    res.vary('Accept-Encoding');
+    res.set('ETag', etagFor(entry.version, encoding));
+    res.set('Cache-Control', 'no-cache');
+    if (encoding !== 'identity') {
+      res.set('Content-Encoding', encoding);
+    }
+    res.type('json').send(body);
+  }
+
+  function send(req, res, entry) {
+    const encoding = negotiateEncoding(req, entry.body);
+    if (encoding === 'identity') {
+      return respond(res, entry, encoding, entry.body);
+    }
+    const encoded = entry.encoded[encoding];
+    if (encoded) {
+      return respond(res, entry, encoding, encoded);
+    }
+    ENCODERS[encoding](entry.body, (err, compressed) => {
+      if (err) {
+        return respond(res, entry, 'identity', entry.body);
+      }
+      entry.encoded[encoding] = compressed;
+      respond(res, entry, encoding, compressed);
+    });
+  }
+
+  return {
+    get version() {
+      return version;
+    },
+
+    bump() {
+      clear();
+    },
+
+    // Serves the response for req.originalUrl from the cache, or calls
+    // produce(done) to build it; done(err, { headers, body }) caches and sends.
+    serve(req, res, produce) {
+      readVersion((err, current) => {
+        if (err) {
+          return res.status(500).json({ error: err.message });
+        }
+        if (current !== version) {
+          version = current;
+          clear();
+        }
+        const startGeneration = generation;
+        const etag = matchingEtag(req.get('If-None-Match'),
+          ['identity', ...Object.keys(ENCODERS)].map(encoding => etagFor(current, encoding)));
+        if (etag) {
+          res.vary('Accept-Encoding');
+          res.set('ETag', etag);
+          res.set('Cache-Control', 'no-cache');
+          return res.status(304).end();
+        }
+
+        const key = req.originalUrl;
+        const cached = entries.get(key);
+        if (cached) {
+          // Re-insert to keep the Map in least-recently-used order
+          entries.delete(key);
+          entries.set(key, cached);
+          return send(req, res, cached);
+        }
+
+        produce((err, result) => {
+          if (err) {
+            return res.status(500).json({ error: err.message });
+          }
+          const entry = {
+            version: current,
+            headers: result.headers || {},
+            body: Buffer.from(JSON.stringify(result.body)),
+            // Compressed copies of body, by encoding, made on first use
+            encoded: {}
+          };
+          // A write that landed while the query ran makes this result stale
+          if (version === current && generation === startGeneration) {
+            entries.set(key, entry);
+            if (entries.size > maxEntries) {
+              entries.delete(entries.keys().next().value);
+            }
+          }
+          send(req, res, entry);
+        });
+      });
+    }
+  };
+}
+
+module.exports = {
+  COMPRESSION_THRESHOLD,
+  createResponseCache
+};
@@ -0,0 +1,80 @@
+// Full-text search over employees backed by the employees_fts FTS5 table.
+//
+// The FTS table is an external-content index over employees, so the rows
+// themselves are stored once and the triggers below keep the index in sync
+// with every INSERT, UPDATE and DELETE.
+
+const { DEFAULT_LIMIT, MAX_LIMIT } = require('./pagination');
+
+const SCHEMA = [
+  `CREATE VIRTUAL TABLE IF NOT EXISTS employees_fts USING fts5(
+    name, email, position,
+    content='employees', content_rowid='id', prefix='2 3'
+  )`,
+  `CREATE TRIGGER IF NOT EXISTS employees_fts_insert AFTER INSERT ON employees
+    BEGIN
+      INSERT INTO employees_fts (rowid, name, email, position)
+        VALUES (new.id, new.name, new.email, new.position);
+    END`,
+  `CREATE TRIGGER IF NOT EXISTS employees_fts_delete AFTER DELETE ON employees
+    BEGIN
+      INSERT INTO employees_fts (employees_fts, rowid, name, email, position)
+        VALUES ('delete', old.id, old.name, old.email, old.position);
+    END`,
+  `CREATE TRIGGER IF NOT EXISTS employees_fts_update AFTER UPDATE OF name, email, position ON employees
+    BEGIN
+      INSERT INTO employees_fts (employees_fts, rowid, name, email, position)
+        VALUES ('delete', old.id, old.name, old.email, old.position);
+      INSERT INTO employees_fts (rowid, name, email, position)
+        VALUES (new.id, new.name, new.email, new.position);
+    END`,
+  // Index rows that existed before the FTS table did, exactly once.
+  `INSERT OR IGNORE INTO employees_meta (key, value) VALUES ('fts_built', 0)`,
+  `INSERT INTO employees_fts (employees_fts)
+    SELECT 'rebuild' WHERE (SELECT value FROM employees_meta WHERE key = 'fts_built') = 0`,
+  `UPDATE employees_meta SET value = 1 WHERE key = 'fts_built'`
+];
+
+const SEARCH_SQL = `SELECT e.id, e.name, e.email, e.position
+  FROM employees_fts
+  JOIN employees e ON e.id = employees_fts.rowid
+  WHERE employees_fts MATCH ?
+  ORDER BY rank
+  LIMIT ?`;
+
+// Turns free text into an FTS5 query where every word is a quoted prefix
+// term, so user input can never be parsed as FTS5 syntax.
+function buildMatchQuery(text) {
+  const terms = String(text).match(/[\p{L}\p{N}]+/gu) || [];
+  return terms.map(term => `"${term}"*`).join(' ');
+}
+
+// Validates the query string and returns either { error } or the { sql, params }
+// to run. Input without any searchable words yields { sql: null }: nothing can
+// match it, so there is no need to touch the index.
+function buildSearchQuery(query) {
+  if (typeof query.q !== 'string' || !query.q.trim()) {
+    return { error: 'Search query (q) is required' };
+  }
+
+  let limit = DEFAULT_LIMIT;
+  if (query.limit !== undefined) {
+    limit = Number(query.limit);
+    if (!Number.isInteger(limit) || limit < 1) {
+      return { error: 'limit must be a positive integer' };
+    }
+    limit = Math.min(limit, MAX_LIMIT);
+  }
+
+  const match = buildMatchQuery(query.q);
+  if (!match) {
+    return { sql: null, params: [] };
+  }
+  return { sql: SEARCH_SQL, params: [match, limit] };
+}
+
+module.exports = {
+  SCHEMA,
+  buildMatchQuery,
+  buildSearchQuery
+};
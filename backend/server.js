@@ -1,36 +1,108 @@
 const express = require('express');
 const cors = require('cors');
-const sqlite3 = require('sqlite3').verbose();
 const path = require('path');
+const readline = require('readline');
+const { parseListQuery, buildListQuery, paginate } = require('./pagination');
+const search = require('./search');
+const { parseShape, shapeRows } = require('./payload-shape');
+const changes = require('./changes');
+const stats = require('./employee-stats');
+const { createImporter, isDuplicateEmail, DUPLICATE_EMAIL_ERROR } = require('./employee-import');
+const { exportEmployees } = require('./employee-export');
+const { resolveTuning } = require('./db-tuning');
+const { createPool, DEFAULT_READERS } = require('./db-pool');
+const { DEFAULT_STATEMENT_CACHE_SIZE } = require('./statement-cache');
+const { createResponseCache } = require('./response-cache');
+const { createMetrics } = require('./metrics');
+const { createQueryProfiler } = require('./query-profiler');
+const { migrate } = require('./migrations');
+const { createAuthenticator, createSessions, requireSession, resolveAuthOptions } = require('./auth');
+const { createLoginLimiter, resolveLoginLimits } = require('./rate-limit');
+const { closeOnShutdown, connectWorker, workerCacheOptions } = require('./cluster');
 
 const app = express();
-const PORT = 4000;
+const PORT = Number(process.env.PORT) || 4000;
+const BULK_JSON_LIMIT = '50mb';
+const BULK_MAX_CHUNK_SIZE = 10000;
+const NDJSON_TYPES = ['application/x-ndjson', 'application/ndjson'];
 
 // Middleware
-app.use(cors());
-app.use(express.json());
+const metrics = createMetrics();
+app.use(metrics.middleware);
+app.use(cors({ exposedHeaders: ['ETag', 'X-Total-Count', 'X-Next-Cursor', 'X-Data-Version'] }));
+
+// Signed session tokens from /login; checked before any body is parsed. The
+// admin and metrics routes reveal SQL, sessions and limiter state, so they
+// need a session too.
+const authOptions = resolveAuthOptions();
+const sessions = createSessions(authOptions);
+app.use(['/employees', '/admin', '/metrics'], requireSession(sessions));
+
+const jsonBody = express.json();
+app.use((req, res, next) => {
+  // The bulk import route parses its own (much larger, possibly streamed) body
+  if (req.path === '/employees/bulk') {
+    return next();
+  }
+  jsonBody(req, res, next);
+});
+
+// Off unless SLOW_QUERY_MS is set
+const profiler = createQueryProfiler();
+
+// Serialized list/search responses, keyed on the database's data version so
+// writes from any process or tool invalidate them
+const responseCache = createResponseCache({
+  ...workerCacheOptions(),
+  readVersion: (cb) => db.get(changes.DATA_VERSION_SQL, [], (err, row) => cb(err, row && row.version))
+});
+// Lets cluster.js stop this worker gracefully
+connectWorker();
 
 // SQLite DB setup
-const dbPath = path.resolve(__dirname, 'db.sqlite');
-const db = new sqlite3.Database(dbPath, (err) => {
+const dbPath = process.env.SQLITE_PATH || path.resolve(__dirname, 'db.sqlite');
+
+// Reads are spread over a pool of read-only connections, writes go through
+// a single writer connection. Pending schema migrations run on the writer
+// before the readers open.
+const db = createPool({
+  filename: dbPath,
+  readers: Number(process.env.SQLITE_READERS) || DEFAULT_READERS,
+  // Prepared statements kept per connection; 0 prepares on every call
+  statementCacheSize: process.env.SQLITE_STATEMENT_CACHE === undefined
+    ? DEFAULT_STATEMENT_CACHE_SIZE
+    : Number(process.env.SQLITE_STATEMENT_CACHE),
+  tuning: resolveTuning(),
+  setup: migrate
+}, (err, pool, settings) => {
   if (err) {
     console.error('Could not connect to database', err);
-  } else {
-    console.log('Connected to SQLite database');
+    process.exit(1);
   }
+  // The profiler wraps first so its EXPLAIN QUERY PLAN lookups bypass metrics
+  profiler.instrumentDb(pool);
+  metrics.instrumentDb(pool);
+  console.log('Connected to SQLite database');
+  console.log('SQLite settings:', settings);
+  if (!authOptions.secret) {
+    console.log('SESSION_SECRET is not set; sessions will not survive a restart');
+  }
+  if (profiler.enabled) {
+    console.log(`Logging SQL statements slower than ${profiler.thresholdMs} ms`);
+  }
+  const server = app.listen(PORT, () => {
+    console.log(`Server running on http://localhost:${PORT} (pid ${process.pid})`);
+  });
+  closeOnShutdown(server, pool);
 });
 
-db.serialize(() => {
-  db.run(`CREATE TABLE IF NOT EXISTS employees (
-    id INTEGER PRIMARY KEY AUTOINCREMENT,
-    name TEXT NOT NULL,
-    email TEXT NOT NULL,
-    position TEXT NOT NULL
-  )`);
-});
+const authenticator = createAuthenticator(db, sessions, authOptions);
+// Attempts per IP and failed attempts per username, over a sliding window
+const loginLimiter = createLoginLimiter(resolveLoginLimits());
 
-// Login endpoint with proper validation
-app.post('/login', (req, res) => {
+// Login endpoint: checks the hashed credentials and returns a session token
+// to send as "Authorization: Bearer <token>"
+app.post('/login', loginLimiter.middleware, (req, res) => {
   const { username, password } = req.body;
   
   // Validate required fields
@@ -41,42 +113,104 @@ app.post('/login', (req, res) => {
     });
   }
   
-  // Simple authentication (in production, use proper password hashing)
-  const validCredentials = [
-    { username: 'admin', password: 'password' },
-    { username: 'user', password: '123456' },
-    { username: 'test', password: 'test123' }
-  ];
-  
-  const user = validCredentials.find(
-    cred => cred.username === username && cred.password === password
-  );
-  
-  if (user) {
+  authenticator.login(String(username), String(password), (err, session) => {
+    if (err) {
+      return res.status(500).json({ success: false, error: err.message });
+    }
+    if (!session) {
+      return res.status(401).json({ 
+        success: false, 
+        error: 'Invalid username or password' 
+      });
+    }
+    loginLimiter.succeeded(req);
     res.json({ 
       success: true, 
       message: 'Login successful',
-      user: { username: user.username }
+      user: { username: session.username },
+      token: session.token,
+      expiresAt: session.expiresAt
     });
-  } else {
-    res.status(401).json({ 
-      success: false, 
-      error: 'Invalid username or password' 
+  });
+});
+
+// List employees, one page at a time (?limit=&cursor=&sort=&order=&shape=)
+app.get('/employees', (req, res) => {
+  const options = parseListQuery(req.query);
+  if (options.error) {
+    return res.status(400).json({ error: options.error });
+  }
+  const { shape, error } = parseShape(req.query);
+  if (error) {
+    return res.status(400).json({ error });
+  }
+  const { sql, params } = buildListQuery(options);
+  responseCache.serve(req, res, (done) => {
+    // The version is read before the rows, so syncing from it can only
+    // repeat a change the page already contains, never miss one.
+    db.get(changes.META_SQL, [], (err, meta) => {
+      if (err) {
+        return done(err);
+      }
+      db.all(sql, params, (err, rows) => {
+        if (err) {
+          return done(err);
+        }
+        const { page, nextCursor } = paginate(rows, options);
+        const headers = {
+          'X-Total-Count': String(meta.total),
+          'X-Data-Version': String(meta.version)
+        };
+        if (nextCursor) {
+          headers['X-Next-Cursor'] = nextCursor;
+        }
+        done(null, { headers, body: shapeRows(page, shape) });
+      });
     });
+  });
+});
+
+// Full-text search by name, email or position (?q=&limit=&shape=), best matches first
+app.get('/employees/search', (req, res) => {
+  const query = search.buildSearchQuery(req.query);
+  if (query.error) {
+    return res.status(400).json({ error: query.error });
+  }
+  const { shape, error } = parseShape(req.query);
+  if (error) {
+    return res.status(400).json({ error });
+  }
+  if (!query.sql) {
+    return res.json(shapeRows([], shape));
+  }
+  responseCache.serve(req, res, (done) => {
+    db.all(query.sql, query.params, (err, rows) => done(err, { body: err ? null : shapeRows(rows, shape) }));
+  });
+});
+
+// Rows inserted, updated or deleted after a data version (?since=&limit=)
+app.get('/employees/changes', (req, res) => {
+  const options = changes.parseChangesQuery(req.query);
+  if (options.error) {
+    return res.status(400).json({ error: options.error });
   }
+  responseCache.serve(req, res, (done) => {
+    changes.fetchChanges(db, options, (err, result) => done(err, { body: result }));
+  });
 });
 
-// Get all employees
-app.get('/employees', (req, res) => {
-  db.all('SELECT * FROM employees', [], (err, rows) => {
-    if (err) {
-      res.status(500).json({ error: err.message });
-    } else {
-      res.json(rows);
-    }
+// Headcount in total, by position and by email domain
+app.get('/employees/stats', (req, res) => {
+  responseCache.serve(req, res, (done) => {
+    stats.fetchStats(db, (err, result) => done(err, { body: result }));
   });
 });
 
+// Stream every employee as NDJSON or CSV (?format=ndjson|csv), gzipped when accepted
+app.get('/employees/export', (req, res) => {
+  exportEmployees(db, req, res);
+});
+
 // Add new employee
 app.post('/employees', (req, res) => {
   const { name, email, position } = req.body;
@@ -87,15 +221,53 @@ app.post('/employees', (req, res) => {
     'INSERT INTO employees (name, email, position) VALUES (?, ?, ?)',
     [name, email, position],
     function (err) {
-      if (err) {
+      if (isDuplicateEmail(err)) {
+        res.status(409).json({ error: DUPLICATE_EMAIL_ERROR });
+      } else if (err) {
         res.status(500).json({ error: err.message });
       } else {
+        responseCache.bump();
         res.json({ id: this.lastID, name, email, position });
       }
     }
   );
 });
 
+// Bulk import from a JSON array or an NDJSON stream, written in chunked transactions
+app.post('/employees/bulk', express.json({ limit: BULK_JSON_LIMIT }), async (req, res) => {
+  let chunkSize;
+  if (req.query.chunkSize !== undefined) {
+    chunkSize = Number(req.query.chunkSize);
+    if (!Number.isInteger(chunkSize) || chunkSize < 1 || chunkSize > BULK_MAX_CHUNK_SIZE) {
+      return res.status(400).json({ error: `chunkSize must be between 1 and ${BULK_MAX_CHUNK_SIZE}` });
+    }
+  }
+
+  const importer = createImporter(db, { chunkSize, onCommit: () => responseCache.bump() });
+  if (req.is(NDJSON_TYPES)) {
+    const lines = readline.createInterface({ input: req, crlfDelay: Infinity });
+    for await (const line of lines) {
+      if (!line.trim()) continue;
+      let row;
+      try {
+        row = JSON.parse(line);
+      } catch {
+        importer.addError('Invalid JSON');
+        continue;
+      }
+      await importer.add(row);
+    }
+  } else if (Array.isArray(req.body)) {
+    for (const row of req.body) {
+      await importer.add(row);
+    }
+  } else {
+    return res.status(400).json({ error: 'Expected a JSON array or an NDJSON body' });
+  }
+
+  res.json(await importer.finish());
+});
+
 // Update employee
 app.put('/employees/:id', (req, res) => {
   const { name, email, position } = req.body;
@@ -107,12 +279,15 @@ app.put('/employees/:id', (req, res) => {
     'UPDATE employees SET name = ?, email = ?, position = ? WHERE id = ?',
     [name, email, position, id],
     function (err) {
-      if (err) {
+      if (isDuplicateEmail(err)) {
+        res.status(409).json({ error: DUPLICATE_EMAIL_ERROR });
+      } else if (err) {
         res.status(500).json({ error: err.message });
       } else if (this.changes === 0) {
         res.status(404).json({ error: 'Employee not found' });
       } else {
-        res.json({ id, name, email, position });
+        responseCache.bump();
+        res.json({ id: Number(id), name, email, position });
       }
     }
   );
@@ -127,11 +302,43 @@ app.delete('/employees/:id', (req, res) => {
     } else if (this.changes === 0) {
       res.status(404).json({ error: 'Employee not found' });
     } else {
+      responseCache.bump();
       res.json({ success: true });
     }
   });
 });
 
-app.listen(PORT, () => {
-  console.log(`Server running on http://localhost:${PORT}`);
-}); 
\ No newline at end of file
+// Session token verification cache size and hit rate
+app.get('/admin/sessions', (req, res) => {
+  res.json(sessions.stats());
+});
+
+// Login rate limiter keys, limits and rejections
+app.get('/admin/rate-limits', (req, res) => {
+  res.json(loginLimiter.stats());
+});
+
+// Connection pool utilisation: reader queue depth and wait times
+app.get('/admin/pool', (req, res) => {
+  res.json(db.stats());
+});
+
+// Most expensive SQL statements (?limit=&sort=totalMs|maxMs|avgMs|calls|slowCalls)
+app.get('/admin/queries', (req, res) => {
+  const limit = req.query.limit === undefined ? undefined : Number(req.query.limit);
+  if (limit !== undefined && !(Number.isInteger(limit) && limit > 0)) {
+    return res.status(400).json({ error: 'limit must be a positive integer' });
+  }
+  res.json(profiler.top({ limit, sort: req.query.sort }));
+});
+
+app.delete('/admin/queries', (req, res) => {
+  profiler.reset();
+  res.json({ success: true });
+});
+
+// Request, SQL and pool metrics in Prometheus text format
+metrics.gauge('sqlite_pool_readers_busy', 'Reader connections running a query.', () => db.stats().readers.busy);
+metrics.gauge('sqlite_pool_queue_depth', 'Reads waiting for a free reader connection.', () => db.stats().readers.queueDepth);
+metrics.gauge('sqlite_pending_writes', 'Writes queued on the writer connection.', () => db.stats().writer.pendingWrites);
+app.get('/metrics', metrics.handler);
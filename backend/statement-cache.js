@@ -0,0 +1,110 @@
+// Per-connection LRU cache of prepared statements.
+//
+// Database#run/all/get prepare, execute and finalize a fresh statement on
+// every call, so SQLite re-parses and re-plans the same handful of SQL
+// strings on every request. The cache keeps the most recently used
+// statements prepared and only rebinds their parameters. The SQL strings the
+// routes use are a small fixed set (list queries vary only by sort and
+// cursor), so a modest cache holds all of them.
+
+const DEFAULT_STATEMENT_CACHE_SIZE = 100;
+
+// Only plain DML/queries are cached. Transaction control (BEGIN/COMMIT) has
+// to keep its place in Database#serialize queues, and one-off statements
+// such as PRAGMA or EXPLAIN would only churn the cache.
+const CACHEABLE = /^\s*(SELECT|INSERT|UPDATE|DELETE|WITH)\b/i;
+
+function isCacheable(sql) {
+  return CACHEABLE.test(sql);
+}
+
+function createStatementCache(conn, maxSize = DEFAULT_STATEMENT_CACHE_SIZE) {
+  // sql -> { stmt, error }, least recently used first
+  const entries = new Map();
+  const counters = { hits: 0, misses: 0, evictions: 0 };
+
+  function finalize(entry, cb) {
+    // Queued behind any operation still running on the statement
+    entry.stmt.finalize(() => cb && cb());
+  }
+
+  function entryFor(sql) {
+    let entry = entries.get(sql);
+    if (entry) {
+      counters.hits++;
+      entries.delete(sql);
+      entries.set(sql, entry);
+      return entry;
+    }
+
+    counters.misses++;
+    entry = { stmt: null, error: null };
+    // Calls made before preparation finishes are queued by the statement
+    entry.stmt = conn.prepare(sql, err => {
+      if (err) {
+        entry.error = err;
+        if (entries.get(sql) === entry) entries.delete(sql);
+      }
+    });
+    entries.set(sql, entry);
+
+    if (entries.size > maxSize) {
+      const [oldestSql, oldest] = entries.entries().next().value;
+      entries.delete(oldestSql);
+      counters.evictions++;
+      finalize(oldest);
+    }
+    return entry;
+  }
+
+  // Calls queued on a statement that failed to prepare only see a generic
+  // "already finalized" error, so report the preparation error instead.
+  function callback(entry, cb) {
+    return function (err, result) {
+      if (cb) cb.call(this, err && entry.error ? entry.error : err, result);
+    };
+  }
+
+  return {
+    run(sql, params, cb) {
+      const entry = entryFor(sql);
+      // The statement is `this` in the callback, with lastID and changes
+      entry.stmt.run(params, callback(entry, cb));
+    },
+
+    all(sql, params, cb) {
+      const entry = entryFor(sql);
+      entry.stmt.all(params, callback(entry, cb));
+    },
+
+    get(sql, params, cb) {
+      const entry = entryFor(sql);
+      const done = callback(entry, cb);
+      entry.stmt.get(params, function (err, row) {
+        // get stops after the first row and leaves the statement, and with it
+        // the connection's read transaction, open until it is reset
+        if (err) return done.call(this, err);
+        entry.stmt.reset(() => done.call(this, null, row));
+      });
+    },
+
+    stats() {
+      return { size: entries.size, ...counters };
+    },
+
+    // Finalizes every cached statement; a connection cannot close while
+    // statements are still open.
+    clear(cb) {
+      const pending = Array.from(entries.values());
+      entries.clear();
+      Promise.all(pending.map(entry => new Promise(resolve => finalize(entry, resolve))))
+        .then(() => cb && cb());
+    }
+  };
+}
+
+module.exports = {
+  DEFAULT_STATEMENT_CACHE_SIZE,
+  createStatementCache,
+  isCacheable
+};
@@ -47,6 +47,8 @@ export default defineConfig({
     {
       command: 'cd ../backend && node server.js',
       url: 'http://localhost:4000',
+      // Every UI test logs in, more often than the default per-IP limit allows
+      env: { LOGIN_RATE_LIMIT_PER_IP: '1000' },
       reuseExistingServer: !process.env.CI,
       timeout: 120 * 1000,
     }
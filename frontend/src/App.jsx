@@ -1,16 +1,29 @@
-import React, { useState } from 'react';
+import React, { Suspense, lazy, useState } from 'react';
 import { BrowserRouter as Router, Routes, Route, Navigate } from 'react-router-dom';
-import Login from './components/Login';
-import EmployeeForm from './components/EmployeeForm';
-import EmployeeList from './components/EmployeeList';
 import MenuBar from './components/MenuBar';
 import { ThemeProvider } from '@mui/material/styles';
 import CssBaseline from '@mui/material/CssBaseline';
+import Box from '@mui/material/Box';
+import CircularProgress from '@mui/material/CircularProgress';
 import { themes } from './themes';
+import { hasSession } from './session';
+
+// Each page is its own chunk, so /login does not download the employee list
+// and its dependencies before it can render
+const Login = lazy(() => import('./components/Login'));
+const EmployeeForm = lazy(() => import('./components/EmployeeForm'));
+const EmployeeList = lazy(() => import('./components/EmployeeList'));
+// Development only; the ternary keeps the chunk out of production builds
+const RenderBenchmark = import.meta.env.DEV ? lazy(() => import('./components/RenderBenchmark')) : null;
+
+const PageFallback = () => (
+  <Box sx={{ display: 'flex', justifyContent: 'center', mt: 8 }}>
+    <CircularProgress />
+  </Box>
+);
 
 const PrivateRoute = ({ children }) => {
-  const loggedIn = localStorage.getItem('loggedIn') === 'true';
-  return loggedIn ? children : <Navigate to="/login" />;
+  return hasSession() ? children : <Navigate to="/login" />;
 };
 
 function App() {
@@ -34,13 +47,16 @@ function App() {
           minHeight: 'calc(100vh - 80px)' // Subtract approximate AppBar height
         }}>
           <div style={{ width: '100%', maxWidth: '1000px' }}>
-            <Routes>
-              <Route path="/login" element={<Login />} />
-              <Route path="/form" element={<PrivateRoute><EmployeeForm /></PrivateRoute>} />
-              <Route path="/list" element={<PrivateRoute><EmployeeList /></PrivateRoute>} />
-              <Route path="/" element={<PrivateRoute><Navigate to="/list" /></PrivateRoute>} />
-              <Route path="*" element={<Navigate to="/login" />} />
-            </Routes>
+            <Suspense fallback={<PageFallback />}>
+              <Routes>
+                <Route path="/login" element={<Login />} />
+                <Route path="/form" element={<PrivateRoute><EmployeeForm /></PrivateRoute>} />
+                <Route path="/list" element={<PrivateRoute><EmployeeList /></PrivateRoute>} />
+                {import.meta.env.DEV && <Route path="/benchmark" element={<RenderBenchmark />} />}
+                <Route path="/" element={<PrivateRoute><Navigate to="/list" /></PrivateRoute>} />
+                <Route path="*" element={<Navigate to="/login" />} />
+              </Routes>
+            </Suspense>
           </div>
         </main>
       </Router>
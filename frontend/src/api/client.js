@@ -0,0 +1,163 @@
+import axios from 'axios';
+import { endSession, getSessionToken, hasSession } from '../session';
+
+// Every backend call goes through this module. It owns:
+// - the base URL, from VITE_API_URL (default http://localhost:4000);
+// - the session token header, and the return to /login on a 401;
+// - per-endpoint timeouts, and retries with backoff for GETs that fail on the
+//   network, time out or hit a 429/502/503/504;
+// - conditional GETs: the last ETag and body per URL are remembered, so a
+//   repeat GET is answered 304 Not Modified instead of re-downloading;
+// - deduplication: an identical GET already in flight under the same
+//   `supersede` name (or under none) is shared, not resent;
+// - cancellation: a GET made with `supersede: 'name'` aborts the previous
+//   request made under that name, so a stale response can never land after
+//   a newer one. Superseded requests reject with an error for which
+//   isCancel(err) is true. Requests are only shared within one name, so
+//   cancelling a name never cancels a caller that did not use it.
+export const API_URL = import.meta.env.VITE_API_URL || 'http://localhost:4000';
+
+// Most specific prefix first
+const TIMEOUTS_MS = [
+  // Password hashing is deliberately slow
+  ['/login', 15000],
+  ['/employees/search', 5000],
+  ['/employees/changes', 5000],
+  ['/employees', 10000],
+];
+const DEFAULT_TIMEOUT_MS = 10000;
+
+const MAX_RETRIES = 2;
+const RETRY_BASE_DELAY_MS = 300;
+const MAX_RETRY_AFTER_MS = 5000;
+const RETRY_STATUSES = [429, 502, 503, 504];
+const MAX_ETAG_ENTRIES = 50;
+
+const http = axios.create({ baseURL: API_URL });
+
+http.interceptors.request.use(config => {
+  const token = getSessionToken();
+  if (token) {
+    config.headers.Authorization = `Bearer ${token}`;
+  }
+  return config;
+});
+
+// A 401 anywhere but /login means the session expired
+http.interceptors.response.use(res => res, err => {
+  if (err.response?.status === 401 && err.config?.url !== '/login' && hasSession()) {
+    endSession();
+    window.location.assign('/login');
+  }
+  return Promise.reject(err);
+});
+
+const inflight = new Map();
+const channels = new Map();
+const etags = new Map();
+
+export const isCancel = axios.isCancel;
+
+const timeoutFor = url => (TIMEOUTS_MS.find(([prefix]) => url.startsWith(prefix)) ?? [null, DEFAULT_TIMEOUT_MS])[1];
+
+const sleep = (ms, signal) => new Promise((resolve, reject) => {
+  const onAbort = () => {
+    clearTimeout(timer);
+    reject(new axios.CanceledError());
+  };
+  const timer = setTimeout(() => {
+    signal.removeEventListener('abort', onAbort);
+    resolve();
+  }, ms);
+  signal.addEventListener('abort', onAbort, { once: true });
+});
+
+// Milliseconds to wait before retrying, or null if the error is final
+const retryDelay = (err, attempt) => {
+  if (isCancel(err) || attempt >= MAX_RETRIES) return null;
+  const status = err.response?.status;
+  if (err.response && !RETRY_STATUSES.includes(status)) return null;
+  if (status === 429) {
+    const retryAfterMs = Number(err.response.headers['retry-after']) * 1000;
+    if (retryAfterMs > MAX_RETRY_AFTER_MS) return null;
+    if (retryAfterMs >= 0) return retryAfterMs;
+  }
+  // Exponential backoff with jitter, so clients that failed together do not
+  // all come back at the same moment
+  return RETRY_BASE_DELAY_MS * 2 ** attempt * (0.5 + Math.random());
+};
+
+const withRetry = async (send, signal) => {
+  for (let attempt = 0; ; attempt++) {
+    try {
+      return await send();
+    } catch (err) {
+      const delay = retryDelay(err, attempt);
+      if (delay === null) throw err;
+      await sleep(delay, signal);
+    }
+  }
+};
+
+const remember = (key, res) => {
+  etags.delete(key);
+  etags.set(key, { etag: res.headers.etag, data: res.data, headers: res.headers });
+  if (etags.size > MAX_ETAG_ENTRIES) {
+    etags.delete(etags.keys().next().value);
+  }
+};
+
+const get = (url, { params, supersede } = {}) => {
+  const key = http.getUri({ url, params });
+  const inflightKey = `${supersede ?? ''} ${key}`;
+  const pending = inflight.get(inflightKey);
+  if (pending) return pending;
+
+  const controller = new AbortController();
+  if (supersede) {
+    channels.get(supersede)?.abort();
+    channels.set(supersede, controller);
+  }
+  const cached = etags.get(key);
+
+  const request = withRetry(() => http.get(url, {
+    params,
+    signal: controller.signal,
+    timeout: timeoutFor(url),
+    headers: cached ? { 'If-None-Match': cached.etag } : {},
+    validateStatus: status => (status >= 200 && status < 300) || status === 304,
+  }), controller.signal)
+    .then(res => {
+      if (res.status === 304 && cached) {
+        return { ...res, status: 200, data: cached.data, headers: cached.headers };
+      }
+      if (res.headers.etag) {
+        remember(key, res);
+      }
+      return res;
+    })
+    .finally(() => {
+      if (inflight.get(inflightKey) === request) inflight.delete(inflightKey);
+      if (supersede && channels.get(supersede) === controller) channels.delete(supersede);
+    });
+
+  inflight.set(inflightKey, request);
+  return request;
+};
+
+const send = method => (url, data, config = {}) =>
+  http.request({ method, url, data, timeout: timeoutFor(url), ...config });
+
+// Aborts the request in flight under a `supersede` name, e.g. on unmount
+const cancel = (name) => {
+  channels.get(name)?.abort();
+  channels.delete(name);
+};
+
+export const api = {
+  get,
+  post: send('post'),
+  put: send('put'),
+  delete: (url, config = {}) => http.request({ method: 'delete', url, timeout: timeoutFor(url), ...config }),
+  cancel,
+};
@@ -0,0 +1,83 @@
+import React from 'react';
+import EmployeeForm from './EmployeeForm';
+import Typography from '@mui/material/Typography';
+import Button from '@mui/material/Button';
+import Dialog from '@mui/material/Dialog';
+import DialogTitle from '@mui/material/DialogTitle';
+import DialogContent from '@mui/material/DialogContent';
+import DialogActions from '@mui/material/DialogActions';
+import DialogContentText from '@mui/material/DialogContentText';
+
+// The add, view, edit and delete dialogs of the employee list. EmployeeList
+// loads this module on demand, so the dialogs and the form stay out of the
+// list page's initial download.
+const EmployeeDialogs = ({
+  showAdd,
+  viewEmp,
+  editEmp,
+  deleteEmp,
+  onAdd,
+  onUpdate,
+  onConfirmDelete,
+  onClose,
+  onCancelDelete
+}) => (
+  <>
+    {/* Add Employee Dialog */}
+    <Dialog open={showAdd} onClose={onClose} maxWidth="xs" fullWidth>
+      <DialogTitle>Add Employee</DialogTitle>
+      <DialogContent>
+        <EmployeeForm onSubmit={onAdd} />
+      </DialogContent>
+    </Dialog>
+
+    {/* View Employee Dialog */}
+    <Dialog open={!!viewEmp} onClose={onClose} maxWidth="xs" fullWidth>
+      <DialogTitle>Employee Details</DialogTitle>
+      <DialogContent>
+        {viewEmp && (
+          <>
+            <Typography><b>ID:</b> {viewEmp.id}</Typography>
+            <Typography><b>Name:</b> {viewEmp.name}</Typography>
+            <Typography><b>Email:</b> {viewEmp.email}</Typography>
+            <Typography><b>Position:</b> {viewEmp.position}</Typography>
+          </>
+        )}
+      </DialogContent>
+      <DialogActions>
+        <Button onClick={onClose} color="primary">Close</Button>
+      </DialogActions>
+    </Dialog>
+
+    {/* Edit Employee Dialog */}
+    <Dialog open={!!editEmp} onClose={onClose} maxWidth="xs" fullWidth>
+      <DialogTitle>Edit Employee</DialogTitle>
+      <DialogContent>
+        {editEmp && (
+          <EmployeeForm initialValues={editEmp} onSubmit={values => onUpdate(editEmp, values)} />
+        )}
+      </DialogContent>
+      <DialogActions>
+        <Button onClick={onClose} color="primary">Cancel</Button>
+      </DialogActions>
+    </Dialog>
+
+    {/* Delete Employee Dialog */}
+    <Dialog open={!!deleteEmp} onClose={onCancelDelete} maxWidth="xs" fullWidth>
+      <DialogTitle>Delete Employee</DialogTitle>
+      <DialogContent>
+        <DialogContentText>
+          Are you sure you want to delete employee <b>{deleteEmp?.name}</b>?
+        </DialogContentText>
+      </DialogContent>
+      <DialogActions>
+        <Button onClick={onCancelDelete} color="primary">Cancel</Button>
+        <Button onClick={onConfirmDelete} color="error" variant="contained">
+          Delete
+        </Button>
+      </DialogActions>
+    </Dialog>
+  </>
+);
+
+export default EmployeeDialogs;
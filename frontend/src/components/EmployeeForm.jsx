@@ -1,6 +1,5 @@
 import React, { useState } from 'react';
 import { useNavigate } from 'react-router-dom';
-import axios from 'axios';
 import Card from '@mui/material/Card';
 import CardContent from '@mui/material/CardContent';
 import Typography from '@mui/material/Typography';
@@ -8,8 +7,12 @@ import TextField from '@mui/material/TextField';
 import Button from '@mui/material/Button';
 import Alert from '@mui/material/Alert';
 import Snackbar from '@mui/material/Snackbar';
+import { api } from '../api/client';
 
-const EmployeeForm = ({ onSuccess, initialValues, onEdit }) => {
+// When `onSubmit` is given the form hands the values to the parent, which
+// applies the change optimistically and owns the request; otherwise the form
+// saves the employee itself.
+const EmployeeForm = ({ onSuccess, initialValues, onEdit, onSubmit }) => {
   const [name, setName] = useState(initialValues?.name || '');
   const [email, setEmail] = useState(initialValues?.email || '');
   const [position, setPosition] = useState(initialValues?.position || '');
@@ -18,23 +21,27 @@ const EmployeeForm = ({ onSuccess, initialValues, onEdit }) => {
   const [loading, setLoading] = useState(false);
   const navigate = useNavigate();
 
-  const isEdit = !!initialValues && !!onEdit;
+  const isEdit = !!initialValues && (!!onEdit || !!onSubmit);
 
   const handleSubmit = async (e) => {
     e.preventDefault();
+    if (onSubmit) {
+      onSubmit({ name, email, position });
+      return;
+    }
     setError('');
     setSuccess('');
     setLoading(true);
 
     try {
       if (isEdit) {
-        await axios.put(`http://localhost:4000/employees/${initialValues.id}`, { name, email, position });
+        await api.put(`/employees/${initialValues.id}`, { name, email, position });
         setSuccess('Employee updated successfully!');
         if (onEdit) {
           setTimeout(() => onEdit(), 1500);
         }
       } else {
-        await axios.post('http://localhost:4000/employees', { name, email, position });
+        await api.post('/employees', { name, email, position });
         setSuccess('Employee added successfully!');
         setName(''); setEmail(''); setPosition('');
         
@@ -112,7 +119,7 @@ const EmployeeForm = ({ onSuccess, initialValues, onEdit }) => {
   );
 
   // If used as a modal, don't wrap in Card
-  if (onSuccess || isEdit) {
+  if (onSuccess || onSubmit || isEdit) {
     return (
       <div style={{ minWidth: 350, maxWidth: 400 }}>
         <Typography variant="h5" color="primary" align="center" fontWeight="bold" mb={3}>
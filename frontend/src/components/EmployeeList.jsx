@@ -1,48 +1,132 @@
-import React, { useEffect, useState } from 'react';
-import axios from 'axios';
-import EmployeeForm from './EmployeeForm';
+import React, { Suspense, lazy, useEffect, useRef, useState } from 'react';
+import { api, isCancel } from '../api/client';
+import { COLUMNS, fromColumns } from '../payloadShape';
+import EmployeeTable from './EmployeeTable';
 import Card from '@mui/material/Card';
 import CardContent from '@mui/material/CardContent';
 import Typography from '@mui/material/Typography';
-import Table from '@mui/material/Table';
-import TableBody from '@mui/material/TableBody';
-import TableCell from '@mui/material/TableCell';
-import TableContainer from '@mui/material/TableContainer';
-import TableHead from '@mui/material/TableHead';
-import TableRow from '@mui/material/TableRow';
 import Button from '@mui/material/Button';
-import Dialog from '@mui/material/Dialog';
-import DialogTitle from '@mui/material/DialogTitle';
-import DialogContent from '@mui/material/DialogContent';
-import DialogActions from '@mui/material/DialogActions';
-import DialogContentText from '@mui/material/DialogContentText';
 import Grid from '@mui/material/Grid';
 import Box from '@mui/material/Box';
 import TextField from '@mui/material/TextField';
 import Alert from '@mui/material/Alert';
 import Snackbar from '@mui/material/Snackbar';
 
+// The dialogs and the employee form are only needed once the user acts on a
+// row, so they are a separate chunk
+const loadDialogs = () => import('./EmployeeDialogs');
+const EmployeeDialogs = lazy(loadDialogs);
+
+const PAGE_SIZE = 100;
+// Newest first, so a row just added is on the first page however many
+// there are
+const LIST_PARAMS = { limit: PAGE_SIZE, order: 'desc', shape: COLUMNS };
+const SEARCH_LIMIT = 100;
+const SEARCH_DEBOUNCE_MS = 250;
+
+// Rows added optimistically get negative ids until the server assigns one
+let nextTempId = -1;
+
+const newestFirst = (a, b) => b.id - a.id;
+
+const describeError = (err, action) => {
+  if (err.response) {
+    const message = err.response.data?.error || `Failed to ${action} employee`;
+    return `${message} (Status: ${err.response.status})`;
+  }
+  if (err.request) {
+    return 'Network error. Please check your connection.';
+  }
+  return `An unexpected error occurred while trying to ${action} employee.`;
+};
+
+// Applies a /employees/changes delta to the loaded rows, keeping them newest
+// first. While more pages remain, rows older than the last loaded id are left
+// for paging to bring in, so they are not shown early and then loaded again.
+const mergeChanges = (list, { upserts, deletes }, morePages) => {
+  const lastLoadedId = morePages ? list.reduce((min, emp) => Math.min(min, emp.id), Infinity) : -Infinity;
+  const deleted = new Set(deletes);
+  const updated = new Map(upserts.map(emp => [emp.id, emp]));
+  const merged = list
+    .filter(emp => !deleted.has(emp.id))
+    .map(emp => {
+      const next = updated.get(emp.id);
+      updated.delete(emp.id);
+      return next ?? emp;
+    });
+  const added = [...updated.values()].filter(emp => emp.id >= lastLoadedId);
+  if (added.length === 0) return merged;
+  return [...merged, ...added].sort(newestFirst);
+};
+
+// Search results only take updates and deletes; whether a new row matches
+// the query is for the next search to decide
+const refreshResults = (results, { upserts, deletes }) => {
+  const deleted = new Set(deletes);
+  const updated = new Map(upserts.map(emp => [emp.id, emp]));
+  return results
+    .filter(emp => !deleted.has(emp.id))
+    .map(emp => updated.get(emp.id) ?? emp);
+};
+
+// Swaps an optimistic row for the one the server created. A sync that ran
+// while the request was in flight may already have brought that row in.
+const replaceTempRow = (rows, tempId, row) => rows
+  .filter(emp => emp.id !== row.id)
+  .map(emp => emp.id === tempId ? row : emp);
+
 const EmployeeList = () => {
   const [employees, setEmployees] = useState([]);
+  const [totalCount, setTotalCount] = useState(0);
+  const [nextCursor, setNextCursor] = useState(null);
   const [loading, setLoading] = useState(true);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [showAdd, setShowAdd] = useState(false);
   const [viewEmp, setViewEmp] = useState(null);
   const [editEmp, setEditEmp] = useState(null);
   const [deleteEmp, setDeleteEmp] = useState(null);
-  const [deleting, setDeleting] = useState(false);
   const [search, setSearch] = useState('');
+  const [searchResults, setSearchResults] = useState(null);
   const [error, setError] = useState('');
   const [success, setSuccess] = useState('');
+  // Stays true after the first dialog opens so later ones can animate closed
+  const [dialogsLoaded, setDialogsLoaded] = useState(false);
+  const dataVersion = useRef(null);
+  // Read by syncChanges, which runs from a focus listener bound on mount
+  const morePages = useRef(false);
+  const fetchingMore = useRef(false);
+
+  const applyPage = (res, append) => {
+    const rows = fromColumns(res.data);
+    if (append) {
+      // Rows synced in since the first page may already be present
+      setEmployees(prev => {
+        const known = new Set(prev.map(emp => emp.id));
+        return [...prev, ...rows.filter(emp => !known.has(emp.id))];
+      });
+    } else {
+      setEmployees(rows);
+      dataVersion.current = Number(res.headers['x-data-version']);
+    }
+    setTotalCount(Number(res.headers['x-total-count']) || rows.length);
+    setNextCursor(res.headers['x-next-cursor'] || null);
+    morePages.current = Boolean(res.headers['x-next-cursor']);
+  };
 
   const fetchEmployees = () => {
     setLoading(true);
     setError('');
-    axios.get('http://localhost:4000/employees')
+    // A reload makes any older page or delta request stale
+    api.cancel('employees:more');
+    api.cancel('employees:changes');
+    api.get('/employees', { params: LIST_PARAMS, supersede: 'employees' })
       .then(res => {
-        setEmployees(res.data);
+        applyPage(res, false);
         setLoading(false);
       })
       .catch(err => {
+        // The reload that superseded this one owns the loading state
+        if (isCancel(err)) return;
         setLoading(false);
         if (err.response) {
           setError(`Failed to load employees (Status: ${err.response.status})`);
@@ -54,34 +138,169 @@ const EmployeeList = () => {
       });
   };
 
+  const fetchMore = () => {
+    // Scrolling near the end fires repeatedly; only one page load at a time
+    if (!nextCursor || fetchingMore.current) return;
+    fetchingMore.current = true;
+    setLoadingMore(true);
+    setError('');
+    api.get('/employees', {
+      params: { ...LIST_PARAMS, cursor: nextCursor },
+      supersede: 'employees:more'
+    })
+      .then(res => {
+        applyPage(res, true);
+        fetchingMore.current = false;
+        setLoadingMore(false);
+      })
+      .catch(err => {
+        fetchingMore.current = false;
+        setLoadingMore(false);
+        if (isCancel(err)) return;
+        if (err.response) {
+          setError(`Failed to load more employees (Status: ${err.response.status})`);
+        } else if (err.request) {
+          setError('Network error. Please check your connection.');
+        } else {
+          setError('An unexpected error occurred while loading employees.');
+        }
+      });
+  };
+
+  // Pulls only the rows changed since the loaded data version and merges
+  // them in, instead of reloading the whole list after every edit.
+  const syncChanges = () => {
+    if (!Number.isInteger(dataVersion.current)) {
+      fetchEmployees();
+      return;
+    }
+    api.get('/employees/changes', { params: { since: dataVersion.current }, supersede: 'employees:changes' })
+      .then(res => {
+        if (res.data.reset) {
+          fetchEmployees();
+          return;
+        }
+        dataVersion.current = res.data.version;
+        setEmployees(prev => mergeChanges(prev, res.data, morePages.current));
+        setSearchResults(prev => prev && refreshResults(prev, res.data));
+        setTotalCount(res.data.total);
+        if (res.data.hasMore) {
+          syncChanges();
+        }
+      })
+      .catch(err => {
+        if (!isCancel(err)) fetchEmployees();
+      });
+  };
+
   useEffect(() => {
     fetchEmployees();
   }, []);
 
-  const handleView = (emp) => setViewEmp(emp);
-  const handleEdit = (emp) => setEditEmp(emp);
-  const handleDelete = (emp) => setDeleteEmp(emp);
-  const confirmDelete = async () => {
+  // Fetch the dialogs chunk once the list is on screen and the browser is
+  // idle, so the first dialog opens without waiting on the network
+  useEffect(() => {
+    if (loading) return;
+    if (!window.requestIdleCallback) {
+      const timer = setTimeout(loadDialogs, 2000);
+      return () => clearTimeout(timer);
+    }
+    const handle = window.requestIdleCallback(loadDialogs, { timeout: 5000 });
+    return () => window.cancelIdleCallback(handle);
+  }, [loading]);
+
+  // Pick up changes made elsewhere when the user comes back to the tab
+  useEffect(() => {
+    window.addEventListener('focus', syncChanges);
+    return () => window.removeEventListener('focus', syncChanges);
+  }, []);
+
+  // Search runs on the server once typing pauses. Local edits are applied to
+  // the results directly, so they do not trigger another search.
+  useEffect(() => {
+    const q = search.trim();
+    if (!q) {
+      setSearchResults(null);
+      return;
+    }
+    let cancelled = false;
+    const timer = setTimeout(() => {
+      api.get('/employees/search', { params: { q, limit: SEARCH_LIMIT, shape: COLUMNS }, supersede: 'employees:search' })
+        .then(res => {
+          if (!cancelled) setSearchResults(fromColumns(res.data));
+        })
+        .catch(err => {
+          if (cancelled || isCancel(err)) return;
+          if (err.response) {
+            setError(`Failed to search employees (Status: ${err.response.status})`);
+          } else if (err.request) {
+            setError('Network error. Please check your connection.');
+          } else {
+            setError('An unexpected error occurred while searching employees.');
+          }
+        });
+    }, SEARCH_DEBOUNCE_MS);
+    return () => {
+      cancelled = true;
+      clearTimeout(timer);
+      api.cancel('employees:search');
+    };
+  }, [search]);
+
+  // Mutations update the rows on screen straight away, swap in the row the
+  // server returns, and roll back with an error if the request fails.
+  const updateRows = (fn) => {
+    setEmployees(fn);
+    setSearchResults(prev => prev && fn(prev));
+  };
+
+  const addEmployee = (values) => {
+    const tempId = nextTempId--;
+    closeModal();
+    updateRows(rows => [{ id: tempId, ...values }, ...rows]);
+    setTotalCount(count => count + 1);
+    api.post('/employees', values)
+      .then(res => {
+        updateRows(rows => replaceTempRow(rows, tempId, res.data));
+        setSuccess('Employee added successfully!');
+      })
+      .catch(err => {
+        updateRows(rows => rows.filter(emp => emp.id !== tempId));
+        setTotalCount(count => count - 1);
+        setError(describeError(err, 'add'));
+      });
+  };
+
+  const updateEmployee = (original, values) => {
+    closeModal();
+    updateRows(rows => rows.map(emp => emp.id === original.id ? { ...emp, ...values } : emp));
+    api.put(`/employees/${original.id}`, values)
+      .then(res => {
+        updateRows(rows => rows.map(emp => emp.id === original.id ? res.data : emp));
+        setSuccess('Employee updated successfully!');
+      })
+      .catch(err => {
+        updateRows(rows => rows.map(emp => emp.id === original.id ? original : emp));
+        setError(describeError(err, 'update'));
+      });
+  };
+
+  const confirmDelete = () => {
     if (!deleteEmp) return;
-    setDeleting(true);
+    const removed = deleteEmp;
+    setDeleteEmp(null);
     setError('');
-    
-    try {
-      await axios.delete(`http://localhost:4000/employees/${deleteEmp.id}`);
-      setDeleteEmp(null);
-      setSuccess('Employee deleted successfully!');
-      fetchEmployees();
-    } catch (err) {
-      setDeleting(false);
-      if (err.response) {
-        setError(`Failed to delete employee (Status: ${err.response.status})`);
-      } else if (err.request) {
-        setError('Network error. Please check your connection.');
-      } else {
-        setError('An unexpected error occurred while deleting employee.');
-      }
-    }
-    setDeleting(false);
+    updateRows(rows => rows.filter(emp => emp.id !== removed.id));
+    setTotalCount(count => count - 1);
+    api.delete(`/employees/${removed.id}`)
+      .then(() => setSuccess('Employee deleted successfully!'))
+      .catch(err => {
+        updateRows(rows => rows.some(emp => emp.id === removed.id)
+          ? rows
+          : [...rows, removed].sort(newestFirst));
+        setTotalCount(count => count + 1);
+        setError(describeError(err, 'delete'));
+      });
   };
   
   const closeModal = () => { 
@@ -91,15 +310,11 @@ const EmployeeList = () => {
     setError(''); // Clear errors when closing modals
   };
 
-  // Filter employees by search
-  const filteredEmployees = employees.filter(emp => {
-    const q = search.toLowerCase();
-    return (
-      emp.name.toLowerCase().includes(q) ||
-      emp.email.toLowerCase().includes(q) ||
-      emp.position.toLowerCase().includes(q)
-    );
-  });
+  const filteredEmployees = searchResults ?? employees;
+
+  if (!dialogsLoaded && (showAdd || viewEmp || editEmp || deleteEmp)) {
+    setDialogsLoaded(true);
+  }
 
   if (loading) return (
     <Box sx={{ display: 'flex', justifyContent: 'center', alignItems: 'center', minHeight: '60vh' }}>
@@ -138,96 +353,44 @@ const EmployeeList = () => {
             </Alert>
           )}
           
-          <TableContainer>
-            <Table size="small">
-              <TableHead>
-                <TableRow>
-                  <TableCell>ID</TableCell>
-                  <TableCell>Name</TableCell>
-                  <TableCell>Email</TableCell>
-                  <TableCell>Position</TableCell>
-                  <TableCell>Actions</TableCell>
-                </TableRow>
-              </TableHead>
-              <TableBody>
-                {filteredEmployees.map(emp => (
-                  <TableRow key={emp.id} hover>
-                    <TableCell>{emp.id}</TableCell>
-                    <TableCell>{emp.name}</TableCell>
-                    <TableCell>{emp.email}</TableCell>
-                    <TableCell>{emp.position}</TableCell>
-                    <TableCell>
-                      <Button size="small" variant="outlined" color="primary" sx={{ mr: 1 }} onClick={() => handleView(emp)}>View</Button>
-                      <Button size="small" variant="outlined" color="warning" sx={{ mr: 1 }} onClick={() => handleEdit(emp)}>Edit</Button>
-                      <Button size="small" variant="outlined" color="error" onClick={() => handleDelete(emp)}>Delete</Button>
-                    </TableCell>
-                  </TableRow>
-                ))}
-                {filteredEmployees.length === 0 && (
-                  <TableRow>
-                    <TableCell colSpan={5} align="center">No employees found.</TableCell>
-                  </TableRow>
-                )}
-              </TableBody>
-            </Table>
-          </TableContainer>
+          <EmployeeTable
+            rows={filteredEmployees}
+            onView={setViewEmp}
+            onEdit={setEditEmp}
+            onDelete={setDeleteEmp}
+            onEndReached={searchResults ? undefined : fetchMore}
+          />
+          <Box sx={{ display: 'flex', justifyContent: 'space-between', alignItems: 'center', mt: 2 }}>
+            <Typography variant="body2" color="text.secondary">
+              {searchResults
+                ? `${searchResults.length} matching employees`
+                : `Showing ${employees.length} of ${totalCount} employees`}
+            </Typography>
+            {!searchResults && nextCursor && (
+              <Button variant="outlined" onClick={fetchMore} disabled={loadingMore}>
+                {loadingMore ? 'Loading...' : 'Load more'}
+              </Button>
+            )}
+          </Box>
         </CardContent>
       </Card>
 
-      {/* Add Employee Dialog */}
-      <Dialog open={showAdd} onClose={closeModal} maxWidth="xs" fullWidth>
-        <DialogTitle>Add Employee</DialogTitle>
-        <DialogContent>
-          <EmployeeForm onSuccess={() => { closeModal(); fetchEmployees(); }} />
-        </DialogContent>
-      </Dialog>
-
-      {/* View Employee Dialog */}
-      <Dialog open={!!viewEmp} onClose={closeModal} maxWidth="xs" fullWidth>
-        <DialogTitle>Employee Details</DialogTitle>
-        <DialogContent>
-          {viewEmp && (
-            <>
-              <Typography><b>ID:</b> {viewEmp.id}</Typography>
-              <Typography><b>Name:</b> {viewEmp.name}</Typography>
-              <Typography><b>Email:</b> {viewEmp.email}</Typography>
-              <Typography><b>Position:</b> {viewEmp.position}</Typography>
-            </>
-          )}
-        </DialogContent>
-        <DialogActions>
-          <Button onClick={closeModal} color="primary">Close</Button>
-        </DialogActions>
-      </Dialog>
-
-      {/* Edit Employee Dialog */}
-      <Dialog open={!!editEmp} onClose={closeModal} maxWidth="xs" fullWidth>
-        <DialogTitle>Edit Employee</DialogTitle>
-        <DialogContent>
-          {editEmp && (
-            <EmployeeForm initialValues={editEmp} onEdit={() => { closeModal(); fetchEmployees(); }} />
-          )}
-        </DialogContent>
-        <DialogActions>
-          <Button onClick={closeModal} color="primary">Cancel</Button>
-        </DialogActions>
-      </Dialog>
-
-      {/* Delete Employee Dialog */}
-      <Dialog open={!!deleteEmp} onClose={() => setDeleteEmp(null)} maxWidth="xs" fullWidth>
-        <DialogTitle>Delete Employee</DialogTitle>
-        <DialogContent>
-          <DialogContentText>
-            Are you sure you want to delete employee <b>{deleteEmp?.name}</b>?
-          </DialogContentText>
-        </DialogContent>
-        <DialogActions>
-          <Button onClick={() => setDeleteEmp(null)} color="primary" disabled={deleting}>Cancel</Button>
-          <Button onClick={confirmDelete} color="error" variant="contained" disabled={deleting}>
-            {deleting ? 'Deleting...' : 'Delete'}
-          </Button>
-        </DialogActions>
-      </Dialog>
+      {/* Add/View/Edit/Delete dialogs, fetched the first time one opens */}
+      {dialogsLoaded && (
+        <Suspense fallback={null}>
+          <EmployeeDialogs
+            showAdd={showAdd}
+            viewEmp={viewEmp}
+            editEmp={editEmp}
+            deleteEmp={deleteEmp}
+            onAdd={addEmployee}
+            onUpdate={updateEmployee}
+            onConfirmDelete={confirmDelete}
+            onClose={closeModal}
+            onCancelDelete={() => setDeleteEmp(null)}
+          />
+        </Suspense>
+      )}
 
       {/* Success/Error Snackbar */}
       <Snackbar
@@ -0,0 +1,90 @@
+import React, { memo, useState } from 'react';
+import Table from '@mui/material/Table';
+import TableBody from '@mui/material/TableBody';
+import TableCell from '@mui/material/TableCell';
+import TableContainer from '@mui/material/TableContainer';
+import TableHead from '@mui/material/TableHead';
+import TableRow from '@mui/material/TableRow';
+import Button from '@mui/material/Button';
+
+// Every row has the same fixed height, so the visible slice can be computed
+// from the scroll offset alone.
+export const ROW_HEIGHT = 48;
+const VIEWPORT_HEIGHT = 600;
+const OVERSCAN = 10;
+// Below this many rows rendering everything is cheap enough
+export const VIRTUALIZE_THRESHOLD = 100;
+
+const cellSx = { whiteSpace: 'nowrap', overflow: 'hidden', textOverflow: 'ellipsis', maxWidth: 220 };
+
+const EmployeeRow = memo(({ emp, onView, onEdit, onDelete }) => {
+  const pending = emp.id < 0;
+  return (
+    <TableRow hover sx={{ height: ROW_HEIGHT, opacity: pending ? 0.6 : 1 }}>
+      <TableCell sx={cellSx}>{pending ? '…' : emp.id}</TableCell>
+      <TableCell sx={cellSx}>{emp.name}</TableCell>
+      <TableCell sx={cellSx}>{emp.email}</TableCell>
+      <TableCell sx={cellSx}>{emp.position}</TableCell>
+      <TableCell sx={{ whiteSpace: 'nowrap' }}>
+        <Button size="small" variant="outlined" color="primary" sx={{ mr: 1 }} disabled={pending} onClick={() => onView(emp)}>View</Button>
+        <Button size="small" variant="outlined" color="warning" sx={{ mr: 1 }} disabled={pending} onClick={() => onEdit(emp)}>Edit</Button>
+        <Button size="small" variant="outlined" color="error" disabled={pending} onClick={() => onDelete(emp)}>Delete</Button>
+      </TableCell>
+    </TableRow>
+  );
+});
+
+// Renders only the rows inside the scroll viewport plus OVERSCAN rows on
+// either side, with spacer rows standing in for the rest so the scrollbar
+// still reflects the full list. onEndReached fires when the last rows come
+// into view, e.g. to load the next page.
+const EmployeeTable = ({ rows, onView, onEdit, onDelete, onEndReached, virtualize = rows.length > VIRTUALIZE_THRESHOLD }) => {
+  const [scrollTop, setScrollTop] = useState(0);
+
+  let start = 0;
+  let end = rows.length;
+  if (virtualize) {
+    start = Math.max(0, Math.floor(scrollTop / ROW_HEIGHT) - OVERSCAN);
+    end = Math.min(rows.length, Math.ceil((scrollTop + VIEWPORT_HEIGHT) / ROW_HEIGHT) + OVERSCAN);
+  }
+
+  const handleScroll = (e) => {
+    const { scrollTop: top, scrollHeight, clientHeight } = e.currentTarget;
+    if (virtualize) {
+      setScrollTop(top);
+    }
+    if (onEndReached && scrollHeight - top - clientHeight < ROW_HEIGHT * OVERSCAN) {
+      onEndReached();
+    }
+  };
+
+  return (
+    <TableContainer sx={{ maxHeight: VIEWPORT_HEIGHT }} onScroll={handleScroll}>
+      <Table size="small" stickyHeader>
+        <TableHead>
+          <TableRow>
+            <TableCell>ID</TableCell>
+            <TableCell>Name</TableCell>
+            <TableCell>Email</TableCell>
+            <TableCell>Position</TableCell>
+            <TableCell>Actions</TableCell>
+          </TableRow>
+        </TableHead>
+        <TableBody>
+          {start > 0 && <TableRow style={{ height: start * ROW_HEIGHT }} aria-hidden="true" />}
+          {rows.slice(start, end).map(emp => (
+            <EmployeeRow key={emp.id} emp={emp} onView={onView} onEdit={onEdit} onDelete={onDelete} />
+          ))}
+          {end < rows.length && <TableRow style={{ height: (rows.length - end) * ROW_HEIGHT }} aria-hidden="true" />}
+          {rows.length === 0 && (
+            <TableRow>
+              <TableCell colSpan={5} align="center">No employees found.</TableCell>
+            </TableRow>
+          )}
+        </TableBody>
+      </Table>
+    </TableContainer>
+  );
+};
+
+export default EmployeeTable;
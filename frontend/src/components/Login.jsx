@@ -1,6 +1,5 @@
 import React, { useState } from 'react';
 import { useNavigate } from 'react-router-dom';
-import axios from 'axios';
 import Card from '@mui/material/Card';
 import CardContent from '@mui/material/CardContent';
 import Typography from '@mui/material/Typography';
@@ -15,6 +14,8 @@ import IconButton from '@mui/material/IconButton';
 import InputAdornment from '@mui/material/InputAdornment';
 import Alert from '@mui/material/Alert';
 import CircularProgress from '@mui/material/CircularProgress';
+import { api } from '../api/client';
+import { startSession } from '../session';
 
 const Login = () => {
   const [username, setUsername] = useState('');
@@ -30,11 +31,10 @@ const Login = () => {
     setIsLoading(true);
     
     try {
-      const response = await axios.post('http://localhost:4000/login', { username, password });
+      const response = await api.post('/login', { username, password });
       
       if (response.data.success) {
-        localStorage.setItem('loggedIn', 'true');
-        localStorage.setItem('username', username);
+        startSession(response.data);
         navigate('/list'); // Redirect to employee list instead of form
       } else {
         setError(response.data.error || 'Login failed');
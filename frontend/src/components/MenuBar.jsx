@@ -13,15 +13,16 @@ import PersonAddIcon from '@mui/icons-material/PersonAdd';
 import ListIcon from '@mui/icons-material/List';
 import ExpandMoreIcon from '@mui/icons-material/ExpandMore';
 import { themeNames, themeKeys } from '../themes';
+import { endSession, hasSession } from '../session';
 
 const MenuBar = ({ onThemeChange, currentTheme }) => {
   const navigate = useNavigate();
-  const loggedIn = localStorage.getItem('loggedIn') === 'true';
+  const loggedIn = hasSession();
   const [employeeMenuAnchor, setEmployeeMenuAnchor] = useState(null);
   const [themeMenuAnchor, setThemeMenuAnchor] = useState(null);
 
   const handleLogoff = () => {
-    localStorage.removeItem('loggedIn');
+    endSession();
     navigate('/login');
   };
 
@@ -0,0 +1,118 @@
+import React, { useEffect, useRef, useState } from 'react';
+import EmployeeTable from './EmployeeTable';
+import Card from '@mui/material/Card';
+import CardContent from '@mui/material/CardContent';
+import Typography from '@mui/material/Typography';
+import Button from '@mui/material/Button';
+import Box from '@mui/material/Box';
+import Table from '@mui/material/Table';
+import TableBody from '@mui/material/TableBody';
+import TableCell from '@mui/material/TableCell';
+import TableHead from '@mui/material/TableHead';
+import TableRow from '@mui/material/TableRow';
+
+const SIZES = [1000, 10000, 100000];
+const POSITIONS = ['Software Engineer', 'Product Manager', 'UX Designer', 'Data Analyst', 'DevOps Engineer'];
+const noop = () => {};
+
+const makeRows = (count) => Array.from({ length: count }, (_, i) => ({
+  id: i + 1,
+  name: `Employee ${i + 1}`,
+  email: `employee${i + 1}@company.com`,
+  position: POSITIONS[i % POSITIONS.length],
+}));
+
+// performance.memory is only available in Chromium-based browsers
+const heapMegabytes = () => (
+  performance.memory ? (performance.memory.usedJSHeapSize / 1048576).toFixed(1) : 'n/a'
+);
+
+// Development-only page that measures how long the employee table takes to
+// render 1k/10k/100k synthetic rows, with and without virtualization.
+const RenderBenchmark = () => {
+  const [rows, setRows] = useState([]);
+  const [virtualize, setVirtualize] = useState(true);
+  const [results, setResults] = useState([]);
+  const [running, setRunning] = useState(false);
+  const pending = useRef(null);
+
+  const run = (count, withVirtualization) => {
+    setRunning(true);
+    setRows([]);
+    // Let the empty table paint first so only the new rows are measured
+    requestAnimationFrame(() => {
+      const data = makeRows(count);
+      pending.current = { count, withVirtualization, start: performance.now() };
+      setVirtualize(withVirtualization);
+      setRows(data);
+    });
+  };
+
+  useEffect(() => {
+    const measurement = pending.current;
+    if (!measurement) return;
+    pending.current = null;
+    // The next frame runs after the browser has laid out and painted the rows
+    requestAnimationFrame(() => {
+      setResults(prev => [...prev, {
+        rows: measurement.count,
+        mode: measurement.withVirtualization ? 'virtualized' : 'all rows',
+        renderMs: (performance.now() - measurement.start).toFixed(1),
+        domNodes: document.getElementsByTagName('*').length,
+        heapMb: heapMegabytes(),
+      }]);
+      setRunning(false);
+    });
+  }, [rows]);
+
+  return (
+    <Box sx={{ width: '100%' }}>
+      <Card sx={{ width: '100%', boxShadow: 3, mb: 2 }}>
+        <CardContent>
+          <Typography variant="h5" color="primary" fontWeight="bold" mb={2}>Render Benchmark</Typography>
+          <Box sx={{ display: 'flex', flexWrap: 'wrap', gap: 1, mb: 2 }}>
+            {SIZES.map(size => (
+              <Button key={size} variant="contained" disabled={running} onClick={() => run(size, true)}>
+                {size.toLocaleString()} rows
+              </Button>
+            ))}
+            {SIZES.map(size => (
+              <Button key={`all-${size}`} variant="outlined" color="warning" disabled={running} onClick={() => run(size, false)}>
+                {size.toLocaleString()} rows, no virtualization
+              </Button>
+            ))}
+          </Box>
+          <Table size="small">
+            <TableHead>
+              <TableRow>
+                <TableCell>Rows</TableCell>
+                <TableCell>Mode</TableCell>
+                <TableCell>Render (ms)</TableCell>
+                <TableCell>DOM nodes</TableCell>
+                <TableCell>JS heap (MB)</TableCell>
+              </TableRow>
+            </TableHead>
+            <TableBody>
+              {results.map((result, i) => (
+                <TableRow key={i}>
+                  <TableCell>{result.rows.toLocaleString()}</TableCell>
+                  <TableCell>{result.mode}</TableCell>
+                  <TableCell>{result.renderMs}</TableCell>
+                  <TableCell>{result.domNodes.toLocaleString()}</TableCell>
+                  <TableCell>{result.heapMb}</TableCell>
+                </TableRow>
+              ))}
+            </TableBody>
+          </Table>
+        </CardContent>
+      </Card>
+      <Card sx={{ width: '100%', boxShadow: 3 }}>
+        <CardContent>
+          <EmployeeTable rows={rows} onView={noop} onEdit={noop} onDelete={noop} virtualize={virtualize} />
+        </CardContent>
+      </Card>
+    </Box>
+  );
+};
+
+export default RenderBenchmark;
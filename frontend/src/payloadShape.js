@@ -0,0 +1,20 @@
+// The list and search routes can send rows as parallel column arrays
+// (?shape=columns), which is much smaller for large pages. These helpers ask
+// for that shape and turn the response back into row objects.
+export const COLUMNS = 'columns';
+
+export const fromColumns = (data) => {
+  // Older servers, or requests without ?shape, return plain row objects
+  if (Array.isArray(data)) return data;
+  const { fields, values } = data;
+  const count = values.length ? values[0].length : 0;
+  const rows = new Array(count);
+  for (let i = 0; i < count; i++) {
+    const row = {};
+    for (let f = 0; f < fields.length; f++) {
+      row[fields[f]] = values[f][i];
+    }
+    rows[i] = row;
+  }
+  return rows;
+};
@@ -0,0 +1,19 @@
+// The backend's /employees routes need the session token /login returns. It
+// is kept in localStorage next to the loggedIn flag; the API client
+// (api/client.js) attaches it to every request and ends the session on a 401.
+const TOKEN_KEY = 'sessionToken';
+
+export const getSessionToken = () => localStorage.getItem(TOKEN_KEY);
+
+export const hasSession = () => localStorage.getItem('loggedIn') === 'true' && !!getSessionToken();
+
+export const startSession = ({ token, user }) => {
+  localStorage.setItem('loggedIn', 'true');
+  localStorage.setItem('username', user.username);
+  localStorage.setItem(TOKEN_KEY, token);
+};
+
+export const endSession = () => {
+  localStorage.removeItem('loggedIn');
+  localStorage.removeItem(TOKEN_KEY);
+};
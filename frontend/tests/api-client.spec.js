@@ -0,0 +1,61 @@
+import { test, expect } from '@playwright/test';
+
+const API_URL = 'http://localhost:4000';
+
+// Client-side navigation, so the app (and the API client's ETag cache) stays loaded
+const navigate = (page, path) => page.evaluate((to) => {
+  window.history.pushState({}, '', to);
+  window.dispatchEvent(new PopStateEvent('popstate'));
+}, path);
+
+const isListRequest = (response) =>
+  response.request().method() === 'GET' && response.url().startsWith(`${API_URL}/employees?`);
+
+test.describe('Shared API client', () => {
+  test('revalidates a repeated list request with If-None-Match', async ({ page }) => {
+    await page.goto('/login');
+    await page.getByLabel('Username').fill('admin');
+    await page.getByLabel('Password').fill('password');
+    const firstLoad = page.waitForResponse(isListRequest);
+    await page.getByRole('button', { name: 'Login' }).click();
+    const first = await firstLoad;
+    expect(first.status()).toBe(200);
+    const etag = first.headers()['etag'];
+    expect(etag).toBeTruthy();
+
+    // Remounting the list requests the same first page again
+    await navigate(page, '/form');
+    const reload = page.waitForResponse(isListRequest);
+    await navigate(page, '/list');
+    const second = await reload;
+    expect(second.request().headers()['if-none-match']).toBe(etag);
+    expect(second.status()).toBe(304);
+
+    // The 304 is answered from the client's copy of the first response
+    await expect(page.getByRole('columnheader', { name: 'Name' })).toBeVisible();
+    await expect(page.getByRole('alert')).toHaveCount(0);
+  });
+
+  test('sends the session token and no stale validator after a write', async ({ page }) => {
+    await page.goto('/login');
+    await page.getByLabel('Username').fill('admin');
+    await page.getByLabel('Password').fill('password');
+    const firstLoad = page.waitForResponse(isListRequest);
+    await page.getByRole('button', { name: 'Login' }).click();
+    const first = await firstLoad;
+    expect(first.request().headers()['authorization']).toMatch(/^Bearer /);
+
+    const token = await page.evaluate(() => window.localStorage.getItem('sessionToken'));
+    await page.request.post(`${API_URL}/employees`, {
+      headers: { Authorization: `Bearer ${token}` },
+      data: { name: 'Client Revalidate', email: `client.revalidate.${Date.now()}@company.com`, position: 'Tester' }
+    });
+
+    await navigate(page, '/form');
+    const reload = page.waitForResponse(isListRequest);
+    await navigate(page, '/list');
+    const second = await reload;
+    expect(second.status()).toBe(200);
+    expect(second.headers()['etag']).not.toBe(first.headers()['etag']);
+  });
+});
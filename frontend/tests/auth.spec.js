@@ -0,0 +1,68 @@
+import { test, expect } from './fixtures';
+
+const API_URL = 'http://localhost:4000';
+
+test.describe('Session tokens', () => {
+  let anonymous;
+
+  test.beforeEach(async ({ playwright }) => {
+    anonymous = await playwright.request.newContext();
+  });
+
+  test.afterEach(async () => {
+    await anonymous.dispose();
+  });
+
+  test('login returns a signed session token', async () => {
+    const res = await anonymous.post(`${API_URL}/login`, {
+      data: { username: 'admin', password: 'password' }
+    });
+    expect(res.status()).toBe(200);
+    const body = await res.json();
+    expect(body.success).toBe(true);
+    expect(body.user).toEqual({ username: 'admin' });
+    expect(body.token).toMatch(/^[\w-]+\.[\w-]+$/);
+    expect(Date.parse(body.expiresAt)).toBeGreaterThan(Date.now());
+  });
+
+  test('rejects a wrong password and an unknown user alike', async () => {
+    for (const data of [{ username: 'admin', password: 'wrong' }, { username: 'nobody', password: 'password' }]) {
+      const res = await anonymous.post(`${API_URL}/login`, { data });
+      expect(res.status()).toBe(401);
+      expect((await res.json()).error).toBe('Invalid username or password');
+    }
+  });
+
+  test('employee routes require a session', async () => {
+    const res = await anonymous.get(`${API_URL}/employees`);
+    expect(res.status()).toBe(401);
+    expect(res.headers()['www-authenticate']).toContain('Bearer');
+  });
+
+  test('admin and metrics routes require a session', async () => {
+    for (const [method, path] of [['get', '/admin/queries'], ['delete', '/admin/queries'], ['get', '/admin/sessions'],
+      ['get', '/admin/rate-limits'], ['get', '/admin/pool'], ['get', '/metrics']]) {
+      const res = await anonymous[method](`${API_URL}${path}`);
+      expect(res.status(), `${method.toUpperCase()} ${path}`).toBe(401);
+    }
+  });
+
+  test('a tampered token is rejected', async ({ sessionToken }) => {
+    const [body] = sessionToken.split('.');
+    const forged = Buffer.from(JSON.stringify({ sub: 'admin', exp: 4102444800 })).toString('base64url');
+    for (const token of [`${forged}.${sessionToken.split('.')[1]}`, `${body}.invalid`]) {
+      const res = await anonymous.get(`${API_URL}/employees`, {
+        headers: { Authorization: `Bearer ${token}` }
+      });
+      expect(res.status()).toBe(401);
+    }
+  });
+
+  test('verified tokens are served from the cache', async ({ request }) => {
+    const before = await (await request.get(`${API_URL}/admin/sessions`)).json();
+    await request.get(`${API_URL}/employees?limit=1`);
+    await request.get(`${API_URL}/employees?limit=1`);
+    const after = await (await request.get(`${API_URL}/admin/sessions`)).json();
+    expect(after.hits).toBeGreaterThanOrEqual(before.hits + 2);
+  });
+});
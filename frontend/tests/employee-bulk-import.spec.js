@@ -0,0 +1,49 @@
+import { test, expect } from './fixtures';
+
+const API_URL = 'http://localhost:4000';
+
+test.describe('Employee bulk import API', () => {
+  test('imports a JSON array and reports per-row errors', async ({ request }) => {
+    const stamp = Date.now();
+    const response = await request.post(`${API_URL}/employees/bulk?chunkSize=2`, {
+      data: [
+        { name: 'Bulk One', email: `bulk.one.${stamp}@company.com`, position: 'Analyst' },
+        { name: 'Bulk Two', email: `bulk.two.${stamp}@company.com`, position: 'Analyst' },
+        { name: 'Missing Position', email: `bulk.three.${stamp}@company.com` },
+        { name: 'Bad Email', email: 'not-an-email', position: 'Analyst' },
+        { name: 'Bulk Five', email: `bulk.five.${stamp}@company.com`, position: 'Analyst' }
+      ]
+    });
+    expect(response.ok()).toBeTruthy();
+
+    const report = await response.json();
+    expect(report.received).toBe(5);
+    expect(report.inserted).toBe(3);
+    expect(report.failed).toBe(2);
+    expect(report.errors.map(e => e.index)).toEqual([2, 3]);
+    expect(report.rowsPerSecond).toBeGreaterThan(0);
+  });
+
+  test('imports an NDJSON stream', async ({ request }) => {
+    const stamp = Date.now();
+    const lines = [
+      JSON.stringify({ name: 'Stream One', email: `stream.one.${stamp}@company.com`, position: 'Analyst' }),
+      '{not json',
+      JSON.stringify({ name: 'Stream Two', email: `stream.two.${stamp}@company.com`, position: 'Analyst' })
+    ];
+    const response = await request.post(`${API_URL}/employees/bulk`, {
+      headers: { 'Content-Type': 'application/x-ndjson' },
+      data: lines.join('\n') + '\n'
+    });
+    const report = await response.json();
+    expect(report.inserted).toBe(2);
+    expect(report.errors).toEqual([{ index: 1, error: 'Invalid JSON' }]);
+  });
+
+  test('rejects a body that is not a list of rows', async ({ request }) => {
+    const response = await request.post(`${API_URL}/employees/bulk`, {
+      data: { name: 'Not an array' }
+    });
+    expect(response.status()).toBe(400);
+  });
+});
@@ -0,0 +1,35 @@
+import { test, expect } from './fixtures';
+
+const API_URL = 'http://localhost:4000';
+
+test.describe('Employee list conditional requests', () => {
+  test('answers 304 until a write changes the data', async ({ request }) => {
+    const first = await request.get(`${API_URL}/employees`);
+    const etag = first.headers()['etag'];
+    expect(etag).toBeTruthy();
+
+    const unchanged = await request.get(`${API_URL}/employees`, {
+      headers: { 'If-None-Match': etag }
+    });
+    expect(unchanged.status()).toBe(304);
+
+    await request.post(`${API_URL}/employees`, {
+      data: { name: 'Cache Buster', email: `cache.buster.${Date.now()}@company.com`, position: 'Tester' }
+    });
+
+    const changed = await request.get(`${API_URL}/employees`, {
+      headers: { 'If-None-Match': etag }
+    });
+    expect(changed.status()).toBe(200);
+    expect(changed.headers()['etag']).not.toBe(etag);
+  });
+
+  test('search responses carry ETags too', async ({ request }) => {
+    const first = await request.get(`${API_URL}/employees/search?q=cache`);
+    const etag = first.headers()['etag'];
+    const again = await request.get(`${API_URL}/employees/search?q=cache`, {
+      headers: { 'If-None-Match': etag }
+    });
+    expect(again.status()).toBe(304);
+  });
+});
@@ -0,0 +1,45 @@
+import { test, expect } from './fixtures';
+
+const API_URL = 'http://localhost:4000';
+
+test.describe('Employee delta sync API', () => {
+  test('returns only rows changed since a version, including deletes', async ({ request }) => {
+    const list = await request.get(`${API_URL}/employees?limit=1`);
+    const since = Number(list.headers()['x-data-version']);
+    expect(Number.isInteger(since)).toBeTruthy();
+    const keptEmail = `delta.kept.${since}@company.com`;
+
+    const kept = await (await request.post(`${API_URL}/employees`, {
+      data: { name: 'Delta Kept', email: keptEmail, position: 'Tester' }
+    })).json();
+    const removed = await (await request.post(`${API_URL}/employees`, {
+      data: { name: 'Delta Removed', email: `delta.removed.${since}@company.com`, position: 'Tester' }
+    })).json();
+    await request.put(`${API_URL}/employees/${kept.id}`, {
+      data: { name: 'Delta Kept Renamed', email: keptEmail, position: 'Tester' }
+    });
+    await request.delete(`${API_URL}/employees/${removed.id}`);
+
+    const delta = await (await request.get(`${API_URL}/employees/changes?since=${since}`)).json();
+    expect(delta.version).toBeGreaterThan(since);
+    expect(delta.upserts).toContainEqual({
+      id: kept.id, name: 'Delta Kept Renamed', email: keptEmail, position: 'Tester'
+    });
+    expect(delta.deletes).toContain(removed.id);
+    expect(delta.upserts.map(emp => emp.id)).not.toContain(removed.id);
+
+    const empty = await (await request.get(`${API_URL}/employees/changes?since=${delta.version}`)).json();
+    expect(empty.upserts).toHaveLength(0);
+    expect(empty.deletes).toHaveLength(0);
+  });
+
+  test('asks for a reset when the version is ahead of the server', async ({ request }) => {
+    const delta = await (await request.get(`${API_URL}/employees/changes?since=999999999`)).json();
+    expect(delta.reset).toBe(true);
+  });
+
+  test('requires since', async ({ request }) => {
+    const response = await request.get(`${API_URL}/employees/changes`);
+    expect(response.status()).toBe(400);
+  });
+});
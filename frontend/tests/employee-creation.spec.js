@@ -1,7 +1,11 @@
 import { test, expect } from '@playwright/test';
 
 test.describe('Employee Creation', () => {
+  // Emails are unique per employee, so every test creates its own
+  let stamp;
+
   test.beforeEach(async ({ page }) => {
+    stamp = Date.now();
     // Login before each test
     await page.goto('/login');
     await page.getByLabel('Username').fill('admin');
@@ -20,7 +24,7 @@ test.describe('Employee Creation', () => {
     
     // Fill in employee details
     await page.getByLabel('Name').fill('John Doe');
-    await page.getByLabel('Email').fill('john.doe@example.com');
+    await page.getByLabel('Email').fill(`john.doe.${stamp}@example.com`);
     await page.getByLabel('Position').fill('Software Engineer');
     
     // Submit form
@@ -31,7 +35,7 @@ test.describe('Employee Creation', () => {
     
     // Verify employee appears in the list
     await expect(page.getByRole('table')).toContainText('John Doe');
-    await expect(page.getByRole('table')).toContainText('john.doe@example.com');
+    await expect(page.getByRole('table')).toContainText(`john.doe.${stamp}@example.com`);
     await expect(page.getByRole('table')).toContainText('Software Engineer');
   });
 
@@ -45,7 +49,7 @@ test.describe('Employee Creation', () => {
     
     // Fill in employee details in the dialog
     await page.getByLabel('Name').fill('Jane Smith');
-    await page.getByLabel('Email').fill('jane.smith@example.com');
+    await page.getByLabel('Email').fill(`jane.smith.${stamp}@example.com`);
     await page.getByLabel('Position').fill('Product Manager');
     
     // Submit form
@@ -56,7 +60,7 @@ test.describe('Employee Creation', () => {
     
     // Verify new employee appears in the list
     await expect(page.getByRole('table')).toContainText('Jane Smith');
-    await expect(page.getByRole('table')).toContainText('jane.smith@example.com');
+    await expect(page.getByRole('table')).toContainText(`jane.smith.${stamp}@example.com`);
     await expect(page.getByRole('table')).toContainText('Product Manager');
   });
 
@@ -1,7 +1,11 @@
 import { test, expect } from '@playwright/test';
 
 test.describe('Employee Delete', () => {
+  // Emails are unique per employee, so every test creates its own
+  let stamp;
+
   test.beforeEach(async ({ page }) => {
+    stamp = Date.now();
     // Login before each test
     await page.goto('/login');
     await page.fill('input[type="text"]', 'admin');
@@ -11,8 +15,8 @@ test.describe('Employee Delete', () => {
     
     // Create test employees for deletion
     const testEmployees = [
-      { name: 'Delete Test 1', email: 'delete1@test.com', position: 'Tester 1' },
-      { name: 'Delete Test 2', email: 'delete2@test.com', position: 'Tester 2' }
+      { name: 'Delete Test 1', email: `delete1.${stamp}@test.com`, position: 'Tester 1' },
+      { name: 'Delete Test 2', email: `delete2.${stamp}@test.com`, position: 'Tester 2' }
     ];
     
     for (const employee of testEmployees) {
@@ -50,7 +54,7 @@ test.describe('Employee Delete', () => {
     
     // Verify employee was deleted from the list
     await expect(page.locator('table')).not.toContainText('Delete Test 1');
-    await expect(page.locator('table')).not.toContainText('delete1@test.com');
+    await expect(page.locator('table')).not.toContainText(`delete1.${stamp}@test.com`);
     
     // Verify other employee is still there
     await expect(page.locator('table')).toContainText('Delete Test 2');
@@ -76,7 +80,7 @@ test.describe('Employee Delete', () => {
     
     // Verify employee is still in the list
     await expect(page.locator('table')).toContainText('Delete Test 1');
-    await expect(page.locator('table')).toContainText('delete1@test.com');
+    await expect(page.locator('table')).toContainText(`delete1.${stamp}@test.com`);
   });
 
   test('delete multiple employees', async ({ page }) => {
@@ -1,7 +1,11 @@
 import { test, expect } from '@playwright/test';
 
 test.describe('Employee Edit', () => {
+  // Emails are unique per employee, so every test creates its own
+  let stamp;
+
   test.beforeEach(async ({ page }) => {
+    stamp = Date.now();
     // Login before each test
     await page.goto('/login');
     await page.fill('input[type="text"]', 'admin');
@@ -13,7 +17,7 @@ test.describe('Employee Edit', () => {
     await page.click('text=Add Employee');
     await expect(page).toHaveURL('/form');
     await page.fill('input[name="name"]', 'Test Employee');
-    await page.fill('input[name="email"]', 'test.employee@company.com');
+    await page.fill('input[name="email"]', `test.employee.${stamp}@company.com`);
     await page.fill('input[name="position"]', 'Test Position');
     await page.click('button[type="submit"]');
     await expect(page).toHaveURL('/list');
@@ -36,11 +40,11 @@ test.describe('Employee Edit', () => {
     
     // Update employee details
     const nameInput = page.locator('input[name="name"], input[value="Test Employee"]').first();
-    const emailInput = page.locator('input[name="email"], input[value="test.employee@company.com"]').first();
+    const emailInput = page.locator(`input[name="email"], input[value="test.employee.${stamp}@company.com"]`).first();
     const positionInput = page.locator('input[name="position"], input[value="Test Position"]').first();
     
     await nameInput.fill('Updated Employee');
-    await emailInput.fill('updated.employee@company.com');
+    await emailInput.fill(`updated.employee.${stamp}@company.com`);
     await positionInput.fill('Updated Position');
     
     // Submit the edit
@@ -56,12 +60,12 @@ test.describe('Employee Edit', () => {
     
     // Verify updated employee appears in the list
     await expect(page.locator('table')).toContainText('Updated Employee');
-    await expect(page.locator('table')).toContainText('updated.employee@company.com');
+    await expect(page.locator('table')).toContainText(`updated.employee.${stamp}@company.com`);
     await expect(page.locator('table')).toContainText('Updated Position');
     
     // Verify old data is not present
     await expect(page.locator('table')).not.toContainText('Test Employee');
-    await expect(page.locator('table')).not.toContainText('test.employee@company.com');
+    await expect(page.locator('table')).not.toContainText(`test.employee.${stamp}@company.com`);
     await expect(page.locator('table')).not.toContainText('Test Position');
   });
 
@@ -90,7 +94,7 @@ test.describe('Employee Edit', () => {
     
     // Clear required fields or enter invalid data
     const nameInput = page.locator('input[name="name"], input[value="Test Employee"]').first();
-    const emailInput = page.locator('input[name="email"], input[value="test.employee@company.com"]').first();
+    const emailInput = page.locator(`input[name="email"], input[value="test.employee.${stamp}@company.com"]`).first();
     
     await nameInput.fill('');
     await emailInput.fill('invalid-email');
@@ -108,7 +112,7 @@ test.describe('Employee Edit', () => {
     // Original employee should still be in the list unchanged
     await page.locator('button:has-text("Cancel"), [data-testid="cancel-button"]').first().click();
     await expect(page.locator('table')).toContainText('Test Employee');
-    await expect(page.locator('table')).toContainText('test.employee@company.com');
+    await expect(page.locator('table')).toContainText(`test.employee.${stamp}@company.com`);
   });
 
   test('edit multiple fields', async ({ page }) => {
@@ -118,7 +122,7 @@ test.describe('Employee Edit', () => {
     
     // Update all fields
     const nameInput = page.locator('input[name="name"], input[value="Test Employee"]').first();
-    const emailInput = page.locator('input[name="email"], input[value="test.employee@company.com"]').first();
+    const emailInput = page.locator(`input[name="email"], input[value="test.employee.${stamp}@company.com"]`).first();
     const positionInput = page.locator('input[name="position"], input[value="Test Position"]').first();
     
     await nameInput.fill('John Updated');
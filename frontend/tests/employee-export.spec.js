@@ -0,0 +1,36 @@
+import { test, expect } from './fixtures';
+
+const API_URL = 'http://localhost:4000';
+
+test.describe('Employee export API', () => {
+  test.beforeAll(async ({ request }) => {
+    await request.post(`${API_URL}/employees`, {
+      data: { name: 'Export, "Quoted"', email: `export.quoted.${Date.now()}@company.com`, position: 'Exporter' }
+    });
+  });
+
+  test('streams NDJSON by default', async ({ request }) => {
+    const response = await request.get(`${API_URL}/employees/export`);
+    expect(response.ok()).toBeTruthy();
+    expect(response.headers()['content-type']).toContain('application/x-ndjson');
+
+    const rows = (await response.text()).trim().split('\n').map(line => JSON.parse(line));
+    expect(rows.map(row => row.name)).toContain('Export, "Quoted"');
+    const ids = rows.map(row => row.id);
+    expect(ids).toEqual([...ids].sort((a, b) => a - b));
+  });
+
+  test('streams CSV with quoted fields', async ({ request }) => {
+    const response = await request.get(`${API_URL}/employees/export?format=csv`);
+    expect(response.headers()['content-type']).toContain('text/csv');
+
+    const text = await response.text();
+    expect(text.startsWith('id,name,email,position\r\n')).toBeTruthy();
+    expect(text).toContain('"Export, ""Quoted"""');
+  });
+
+  test('rejects unknown formats', async ({ request }) => {
+    const response = await request.get(`${API_URL}/employees/export?format=xml`);
+    expect(response.status()).toBe(400);
+  });
+});
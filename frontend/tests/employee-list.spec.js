@@ -1,7 +1,11 @@
 import { test, expect } from '@playwright/test';
 
 test.describe('Employee List Page', () => {
+  // Emails are unique per employee, so every test creates its own
+  let stamp;
+
   test.beforeEach(async ({ page }) => {
+    stamp = Date.now();
     // Login before each test
     await page.goto('/login');
     await page.getByLabel('Username').fill('admin');
@@ -37,7 +41,7 @@ test.describe('Employee List Page', () => {
     await expect(page.getByRole('dialog')).toBeVisible();
     
     await page.getByLabel('Name').fill('John Doe');
-    await page.getByLabel('Email').fill('john.doe@test.com');
+    await page.getByLabel('Email').fill(`john.doe.${stamp}@test.com`);
     await page.getByLabel('Position').fill('Software Engineer');
     await page.getByRole('button', { name: /add|submit/i }).click();
     
@@ -46,7 +50,7 @@ test.describe('Employee List Page', () => {
     
     // Check if employee appears in table
     await expect(page.getByRole('table')).toContainText('John Doe');
-    await expect(page.getByRole('table')).toContainText('john.doe@test.com');
+    await expect(page.getByRole('table')).toContainText(`john.doe.${stamp}@test.com`);
     await expect(page.getByRole('table')).toContainText('Software Engineer');
   });
 
@@ -54,13 +58,13 @@ test.describe('Employee List Page', () => {
     // Add a test employee first with unique identifier
     await page.getByRole('button', { name: '+ Add Employee' }).click();
     await page.getByLabel('Name').fill('Jane ActionTest');
-    await page.getByLabel('Email').fill('jane.actiontest@test.com');
+    await page.getByLabel('Email').fill(`jane.actiontest.${stamp}@test.com`);
     await page.getByLabel('Position').fill('Product Manager');
     await page.getByRole('button', { name: /add|submit/i }).click();
     await expect(page.getByRole('dialog')).not.toBeVisible();
     
     // Check action buttons are present using first matching row
-    const tableRow = page.locator('tr').filter({ hasText: 'jane.actiontest@test.com' }).first();
+    const tableRow = page.locator('tr').filter({ hasText: `jane.actiontest.${stamp}@test.com` }).first();
     await expect(tableRow.getByRole('button', { name: 'View' })).toBeVisible();
     await expect(tableRow.getByRole('button', { name: 'Edit' })).toBeVisible();
     await expect(tableRow.getByRole('button', { name: 'Delete' })).toBeVisible();
@@ -70,20 +74,20 @@ test.describe('Employee List Page', () => {
     // Add a test employee first
     await page.getByRole('button', { name: '+ Add Employee' }).click();
     await page.getByLabel('Name').fill('Alice Cooper');
-    await page.getByLabel('Email').fill('alice.cooper@test.com');
+    await page.getByLabel('Email').fill(`alice.cooper.${stamp}@test.com`);
     await page.getByLabel('Position').fill('Designer');
     await page.getByRole('button', { name: /add|submit/i }).click();
     await expect(page.getByRole('dialog')).not.toBeVisible();
     
     // Click View button
-    const tableRow = page.locator('tr').filter({ hasText: 'Alice Cooper' });
+    const tableRow = page.locator('tr').filter({ hasText: `alice.cooper.${stamp}@test.com` });
     await tableRow.getByRole('button', { name: 'View' }).click();
     
     // Check view dialog opens
     await expect(page.getByRole('dialog')).toBeVisible();
     await expect(page.getByText('Employee Details')).toBeVisible();
     await expect(page.getByText('Name: Alice Cooper')).toBeVisible();
-    await expect(page.getByText('Email: alice.cooper@test.com')).toBeVisible();
+    await expect(page.getByText(`Email: alice.cooper.${stamp}@test.com`)).toBeVisible();
     await expect(page.getByText('Position: Designer')).toBeVisible();
     
     // Close dialog
@@ -95,13 +99,13 @@ test.describe('Employee List Page', () => {
     // Add a test employee first
     await page.getByRole('button', { name: '+ Add Employee' }).click();
     await page.getByLabel('Name').fill('Bob Wilson');
-    await page.getByLabel('Email').fill('bob.wilson@test.com');
+    await page.getByLabel('Email').fill(`bob.wilson.${stamp}@test.com`);
     await page.getByLabel('Position').fill('Developer');
     await page.getByRole('button', { name: /add|submit/i }).click();
     await expect(page.getByRole('dialog')).not.toBeVisible();
     
     // Click Edit button
-    const tableRow = page.locator('tr').filter({ hasText: 'Bob Wilson' });
+    const tableRow = page.locator('tr').filter({ hasText: `bob.wilson.${stamp}@test.com` });
     await tableRow.getByRole('button', { name: 'Edit' }).click();
     
     // Check edit dialog opens
@@ -110,7 +114,7 @@ test.describe('Employee List Page', () => {
     
     // Check form is pre-filled
     await expect(page.getByLabel('Name')).toHaveValue('Bob Wilson');
-    await expect(page.getByLabel('Email')).toHaveValue('bob.wilson@test.com');
+    await expect(page.getByLabel('Email')).toHaveValue(`bob.wilson.${stamp}@test.com`);
     await expect(page.getByLabel('Position')).toHaveValue('Developer');
     
     // Close dialog
@@ -122,13 +126,13 @@ test.describe('Employee List Page', () => {
     // Add a test employee first
     await page.getByRole('button', { name: '+ Add Employee' }).click();
     await page.getByLabel('Name').fill('Charlie Brown');
-    await page.getByLabel('Email').fill('charlie.brown@test.com');
+    await page.getByLabel('Email').fill(`charlie.brown.${stamp}@test.com`);
     await page.getByLabel('Position').fill('Tester');
     await page.getByRole('button', { name: /add|submit/i }).click();
     await expect(page.getByRole('dialog')).not.toBeVisible();
     
     // Click Delete button
-    const tableRow = page.locator('tr').filter({ hasText: 'Charlie Brown' });
+    const tableRow = page.locator('tr').filter({ hasText: `charlie.brown.${stamp}@test.com` });
     await tableRow.getByRole('button', { name: 'Delete' }).click();
     
     // Check delete confirmation dialog opens
@@ -147,16 +151,16 @@ test.describe('Employee List Page', () => {
     // Add a test employee first
     await page.getByRole('button', { name: '+ Add Employee' }).click();
     await page.getByLabel('Name').fill('Delete Me');
-    await page.getByLabel('Email').fill('delete.me@test.com');
+    await page.getByLabel('Email').fill(`delete.me.${stamp}@test.com`);
     await page.getByLabel('Position').fill('Temporary');
     await page.getByRole('button', { name: /add|submit/i }).click();
     await expect(page.getByRole('dialog')).not.toBeVisible();
     
     // Confirm employee is in table
-    await expect(page.getByRole('table')).toContainText('Delete Me');
+    await expect(page.getByRole('table')).toContainText(`delete.me.${stamp}@test.com`);
     
     // Click Delete button
-    const tableRow = page.locator('tr').filter({ hasText: 'Delete Me' });
+    const tableRow = page.locator('tr').filter({ hasText: `delete.me.${stamp}@test.com` });
     await tableRow.getByRole('button', { name: 'Delete' }).click();
     
     // Confirm deletion
@@ -164,7 +168,7 @@ test.describe('Employee List Page', () => {
     
     // Wait for dialog to close and check employee is removed
     await expect(page.getByRole('dialog')).not.toBeVisible();
-    await expect(page.getByRole('table')).not.toContainText('Delete Me');
+    await expect(page.getByRole('table')).not.toContainText(`delete.me.${stamp}@test.com`);
     
     // Check success message
     await expect(page.getByText('Employee deleted successfully!')).toBeVisible();
@@ -221,7 +225,7 @@ test.describe('Employee List Page', () => {
     // Add new employee
     await page.getByRole('button', { name: '+ Add Employee' }).click();
     await page.getByLabel('Name').fill('Refresh Test');
-    await page.getByLabel('Email').fill('refresh.test@test.com');
+    await page.getByLabel('Email').fill(`refresh.test.${stamp}@test.com`);
     await page.getByLabel('Position').fill('Tester');
     await page.getByRole('button', { name: /add|submit/i }).click();
     
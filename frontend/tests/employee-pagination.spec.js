@@ -0,0 +1,49 @@
+import { test, expect } from './fixtures';
+
+const API_URL = 'http://localhost:4000';
+
+test.describe('Employee list pagination API', () => {
+  test.beforeAll(async ({ request }) => {
+    // Make sure there are enough rows to span several small pages
+    const stamp = Date.now();
+    for (let i = 0; i < 5; i++) {
+      await request.post(`${API_URL}/employees`, {
+        data: { name: `Page Test ${i}`, email: `page.test${i}.${stamp}@company.com`, position: 'Tester' }
+      });
+    }
+  });
+
+  test('default page is bounded and reports the total count', async ({ request }) => {
+    const response = await request.get(`${API_URL}/employees`);
+    expect(response.ok()).toBeTruthy();
+
+    const rows = await response.json();
+    expect(rows.length).toBeLessThanOrEqual(50);
+    expect(Number(response.headers()['x-total-count'])).toBeGreaterThanOrEqual(rows.length);
+  });
+
+  test('cursor walks through pages without overlap', async ({ request }) => {
+    const first = await request.get(`${API_URL}/employees?limit=2`);
+    const firstRows = await first.json();
+    const cursor = first.headers()['x-next-cursor'];
+    expect(firstRows).toHaveLength(2);
+    expect(cursor).toBeTruthy();
+
+    const second = await request.get(`${API_URL}/employees?limit=2&cursor=${cursor}`);
+    const secondRows = await second.json();
+    expect(secondRows.length).toBeGreaterThan(0);
+    expect(secondRows[0].id).toBeGreaterThan(firstRows[1].id);
+  });
+
+  test('sorts by name in descending order', async ({ request }) => {
+    const response = await request.get(`${API_URL}/employees?sort=name&order=desc&limit=5`);
+    const names = (await response.json()).map(emp => emp.name);
+    expect(names).toEqual([...names].sort().reverse());
+  });
+
+  test('rejects invalid parameters', async ({ request }) => {
+    expect((await request.get(`${API_URL}/employees?sort=salary`)).status()).toBe(400);
+    expect((await request.get(`${API_URL}/employees?limit=0`)).status()).toBe(400);
+    expect((await request.get(`${API_URL}/employees?cursor=not-a-cursor`)).status()).toBe(400);
+  });
+});
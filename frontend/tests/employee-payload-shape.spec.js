@@ -0,0 +1,60 @@
+import { test, expect } from './fixtures';
+
+const API_URL = 'http://localhost:4000';
+
+test.describe('Employee list payloads', () => {
+  test.beforeAll(async ({ request }) => {
+    // Enough rows for a page to cross the compression threshold
+    const stamp = Date.now();
+    const rows = Array.from({ length: 30 }, (_, i) => ({
+      name: `Shape Tester ${i}`, email: `shape.${stamp}.${i}@company.com`, position: 'Tester'
+    }));
+    await request.post(`${API_URL}/employees/bulk`, { data: rows });
+  });
+
+  test('columns shape carries the same rows as objects', async ({ request }) => {
+    const objects = await (await request.get(`${API_URL}/employees?limit=20`)).json();
+    const columns = await (await request.get(`${API_URL}/employees?limit=20&shape=columns`)).json();
+
+    expect(columns.fields).toEqual(['id', 'name', 'email', 'position']);
+    const rows = columns.values[0].map((_, i) =>
+      Object.fromEntries(columns.fields.map((field, f) => [field, columns.values[f][i]])));
+    expect(rows).toEqual(objects);
+  });
+
+  test('search supports the columns shape', async ({ request }) => {
+    const res = await request.get(`${API_URL}/employees/search?q=shape&shape=columns`);
+    expect(res.status()).toBe(200);
+    const body = await res.json();
+    expect(body.fields).toEqual(['id', 'name', 'email', 'position']);
+    expect(body.values).toHaveLength(4);
+  });
+
+  test('rejects an unknown shape', async ({ request }) => {
+    const res = await request.get(`${API_URL}/employees?shape=rows`);
+    expect(res.status()).toBe(400);
+  });
+
+  test('compresses large pages when the client accepts it', async ({ request }) => {
+    const gzip = await request.get(`${API_URL}/employees?limit=50`, {
+      headers: { 'Accept-Encoding': 'gzip' }
+    });
+    expect(gzip.headers()['content-encoding']).toBe('gzip');
+    expect(gzip.headers()['vary']).toContain('Accept-Encoding');
+
+    const plain = await request.get(`${API_URL}/employees?limit=50`, {
+      headers: { 'Accept-Encoding': 'identity' }
+    });
+    expect(plain.headers()['content-encoding']).toBeUndefined();
+    // The bytes differ, so the ETags must too
+    expect(plain.headers()['etag']).not.toBe(gzip.headers()['etag']);
+    expect(await gzip.json()).toEqual(await plain.json());
+  });
+
+  test('leaves small responses uncompressed', async ({ request }) => {
+    const res = await request.get(`${API_URL}/employees?limit=1`, {
+      headers: { 'Accept-Encoding': 'gzip' }
+    });
+    expect(res.headers()['content-encoding']).toBeUndefined();
+  });
+});
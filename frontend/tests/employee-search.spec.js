@@ -1,7 +1,11 @@
-import { test, expect } from '@playwright/test';
+import { test, expect } from './fixtures';
 
 test.describe('Employee Search', () => {
+  // Emails are unique per employee, so every test creates its own
+  let stamp;
+
   test.beforeEach(async ({ page }) => {
+    stamp = Date.now();
     // Login before each test
     await page.goto('/login');
     await page.getByLabel('Username').fill('admin');
@@ -11,10 +15,10 @@ test.describe('Employee Search', () => {
     
     // Create some test employees for searching
     const employees = [
-      { name: 'Alice Johnson', email: 'alice.johnson@company.com', position: 'Frontend Developer' },
-      { name: 'Bob Smith', email: 'bob.smith@company.com', position: 'Backend Developer' },
-      { name: 'Carol Wilson', email: 'carol.wilson@company.com', position: 'UI/UX Designer' },
-      { name: 'David Brown', email: 'david.brown@company.com', position: 'Product Manager' }
+      { name: 'Alice Johnson', email: `alice.johnson.${stamp}@company.com`, position: 'Frontend Developer' },
+      { name: 'Bob Smith', email: `bob.smith.${stamp}@company.com`, position: 'Backend Developer' },
+      { name: 'Carol Wilson', email: `carol.wilson.${stamp}@company.com`, position: 'UI/UX Designer' },
+      { name: 'David Brown', email: `david.brown.${stamp}@company.com`, position: 'Product Manager' }
     ];
     
     for (const employee of employees) {
@@ -137,4 +141,35 @@ test.describe('Employee Search', () => {
     await expect(page.getByRole('table')).toContainText('Alice Johnson');
     await expect(page.getByRole('table')).not.toContainText('Bob Smith');
   });
-});
\ No newline at end of file
+});
+test.describe('Employee search API', () => {
+  const API_URL = 'http://localhost:4000';
+
+  test('matches word prefixes and stays in sync with updates and deletes', async ({ request }) => {
+    const stamp = Date.now();
+    const created = await request.post(`${API_URL}/employees`, {
+      data: { name: 'Zebulon Quartermaine', email: `zebulon.q.${stamp}@company.com`, position: 'Archivist' }
+    });
+    const employee = await created.json();
+
+    let results = await (await request.get(`${API_URL}/employees/search?q=zebu quarter`)).json();
+    expect(results.map(emp => emp.id)).toContain(employee.id);
+
+    await request.put(`${API_URL}/employees/${employee.id}`, {
+      data: { name: 'Xanthe Quartermaine', email: `xanthe.q.${stamp}@company.com`, position: 'Archivist' }
+    });
+    results = await (await request.get(`${API_URL}/employees/search?q=zebulon`)).json();
+    expect(results.map(emp => emp.id)).not.toContain(employee.id);
+    results = await (await request.get(`${API_URL}/employees/search?q=xanthe`)).json();
+    expect(results.map(emp => emp.id)).toContain(employee.id);
+
+    await request.delete(`${API_URL}/employees/${employee.id}`);
+    results = await (await request.get(`${API_URL}/employees/search?q=xanthe`)).json();
+    expect(results.map(emp => emp.id)).not.toContain(employee.id);
+  });
+
+  test('requires a query', async ({ request }) => {
+    const response = await request.get(`${API_URL}/employees/search`);
+    expect(response.status()).toBe(400);
+  });
+});
@@ -0,0 +1,46 @@
+import { test, expect } from './fixtures';
+
+const API_URL = 'http://localhost:4000';
+
+test.describe('Employee stats', () => {
+  test('counts employees by position and email domain', async ({ request }) => {
+    const stamp = Date.now();
+    const position = `Statistician ${stamp}`;
+    const domain = `stats${stamp}.example.com`;
+    await request.post(`${API_URL}/employees/bulk`, {
+      data: [1, 2, 3].map(i => ({ name: `Stats ${i}`, email: `stats.${i}@${domain.toUpperCase()}`, position }))
+    });
+
+    const res = await request.get(`${API_URL}/employees/stats`);
+    expect(res.status()).toBe(200);
+    const stats = await res.json();
+
+    expect(stats.positions).toContainEqual({ position, count: 3 });
+    // Domains are compared case-insensitively
+    expect(stats.domains).toContainEqual({ domain, count: 3 });
+    expect(stats.total).toBe(stats.positions.reduce((sum, row) => sum + row.count, 0));
+    expect(stats.total).toBe(stats.domains.reduce((sum, row) => sum + row.count, 0));
+    expect(stats.totalPositions).toBe(stats.positions.length);
+  });
+
+  test('is cached until a write changes the data', async ({ request }) => {
+    const first = await request.get(`${API_URL}/employees/stats`);
+    const etag = first.headers()['etag'];
+    const { total } = await first.json();
+
+    const unchanged = await request.get(`${API_URL}/employees/stats`, {
+      headers: { 'If-None-Match': etag }
+    });
+    expect(unchanged.status()).toBe(304);
+
+    await request.post(`${API_URL}/employees`, {
+      data: { name: 'Stats Bump', email: `stats.bump.${Date.now()}@company.com`, position: 'Tester' }
+    });
+
+    const changed = await request.get(`${API_URL}/employees/stats`, {
+      headers: { 'If-None-Match': etag }
+    });
+    expect(changed.status()).toBe(200);
+    expect((await changed.json()).total).toBe(total + 1);
+  });
+});
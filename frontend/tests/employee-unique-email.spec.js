@@ -0,0 +1,40 @@
+import { test, expect } from './fixtures';
+
+const API_URL = 'http://localhost:4000';
+
+test.describe('Unique employee email', () => {
+  test('rejects creating or updating to an email that is taken', async ({ request }) => {
+    const email = `unique.${Date.now()}@company.com`;
+    const first = await request.post(`${API_URL}/employees`, {
+      data: { name: 'Unique One', email, position: 'Tester' }
+    });
+    expect(first.ok()).toBeTruthy();
+
+    const duplicate = await request.post(`${API_URL}/employees`, {
+      data: { name: 'Unique Two', email, position: 'Tester' }
+    });
+    expect(duplicate.status()).toBe(409);
+    expect((await duplicate.json()).error).toBe('An employee with this email already exists');
+
+    const other = await (await request.post(`${API_URL}/employees`, {
+      data: { name: 'Unique Three', email: `other.${email}`, position: 'Tester' }
+    })).json();
+    const update = await request.put(`${API_URL}/employees/${other.id}`, {
+      data: { name: 'Unique Three', email, position: 'Tester' }
+    });
+    expect(update.status()).toBe(409);
+  });
+
+  test('bulk import reports duplicate rows individually', async ({ request }) => {
+    const email = `bulk.unique.${Date.now()}@company.com`;
+    const response = await request.post(`${API_URL}/employees/bulk`, {
+      data: [
+        { name: 'Bulk Unique', email, position: 'Tester' },
+        { name: 'Bulk Duplicate', email, position: 'Tester' }
+      ]
+    });
+    const report = await response.json();
+    expect(report.inserted).toBe(1);
+    expect(report.errors).toEqual([{ index: 1, error: 'An employee with this email already exists' }]);
+  });
+});
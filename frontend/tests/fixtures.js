@@ -0,0 +1,28 @@
+import { test as base, expect } from '@playwright/test';
+
+const API_URL = 'http://localhost:4000';
+
+// The /employees API requires a session token. This `test` logs in once per
+// worker and gives every test a `request` context that sends the token, so
+// API specs can call the backend as a signed-in client.
+export const test = base.extend({
+  sessionToken: [async ({ playwright }, use) => {
+    const anonymous = await playwright.request.newContext();
+    const res = await anonymous.post(`${API_URL}/login`, {
+      data: { username: 'admin', password: 'password' }
+    });
+    const { token } = await res.json();
+    await anonymous.dispose();
+    await use(token);
+  }, { scope: 'worker' }],
+
+  request: async ({ playwright, sessionToken }, use) => {
+    const request = await playwright.request.newContext({
+      extraHTTPHeaders: { Authorization: `Bearer ${sessionToken}` }
+    });
+    await use(request);
+    await request.dispose();
+  }
+});
+
+export { expect };
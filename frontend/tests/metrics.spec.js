@@ -0,0 +1,28 @@
+import { test, expect } from './fixtures';
+
+const API_URL = 'http://localhost:4000';
+
+test.describe('Backend /metrics', () => {
+  test('reports request and SQL metrics in Prometheus text format', async ({ request }) => {
+    await request.get(`${API_URL}/employees?limit=5`);
+
+    const response = await request.get(`${API_URL}/metrics`);
+    expect(response.status()).toBe(200);
+    expect(response.headers()['content-type']).toContain('text/plain');
+
+    const body = await response.text();
+    expect(body).toContain('# TYPE http_request_duration_seconds histogram');
+    expect(body).toMatch(/http_requests_total\{method="GET",route="\/employees",status="200"\} \d+/);
+    expect(body).toMatch(/http_request_duration_seconds_bucket\{method="GET",route="\/employees",le="\+Inf"\} \d+/);
+    expect(body).toMatch(/sqlite_statement_duration_seconds_count\{method="all",statement="SELECT employees"\} \d+/);
+    expect(body).toMatch(/^http_requests_in_flight \d+$/m);
+  });
+
+  test('labels requests by route pattern, not by URL', async ({ request }) => {
+    await request.delete(`${API_URL}/employees/999999999`);
+
+    const body = await (await request.get(`${API_URL}/metrics`)).text();
+    expect(body).toContain('route="/employees/:id"');
+    expect(body).not.toContain('route="/employees/999999999"');
+  });
+});
@@ -0,0 +1,37 @@
+import { test, expect } from './fixtures';
+
+const API_URL = 'http://localhost:4000';
+
+test.describe('SQL query profiler admin route', () => {
+  test('lists the most expensive statements', async ({ request }) => {
+    await request.get(`${API_URL}/employees?limit=5`);
+
+    const response = await request.get(`${API_URL}/admin/queries?limit=5&sort=maxMs`);
+    expect(response.status()).toBe(200);
+    const report = await response.json();
+    expect(typeof report.enabled).toBe('boolean');
+    expect(report.sort).toBe('maxMs');
+    expect(report.statements.length).toBeLessThanOrEqual(5);
+
+    // Only populated when the backend runs with SLOW_QUERY_MS set
+    if (report.enabled) {
+      const list = report.statements.find(statement => statement.sql.includes('FROM employees'));
+      expect(list).toBeTruthy();
+      expect(list.calls).toBeGreaterThan(0);
+    }
+  });
+
+  test('does not expose parameters bound to the users table', async ({ request }) => {
+    const report = await (await request.get(`${API_URL}/admin/queries?limit=500`)).json();
+    report.statements
+      .filter(statement => /\busers\b/.test(statement.sql) && statement.slowest)
+      .forEach(statement => {
+        expect(statement.slowest.params.every(param => param === '[redacted]')).toBe(true);
+      });
+  });
+
+  test('rejects an invalid limit', async ({ request }) => {
+    const response = await request.get(`${API_URL}/admin/queries?limit=0`);
+    expect(response.status()).toBe(400);
+  });
+});
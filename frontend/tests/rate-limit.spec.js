@@ -0,0 +1,50 @@
+import { test, expect } from './fixtures';
+
+const API_URL = 'http://localhost:4000';
+
+test.describe('Login rate limiting', () => {
+  test('locks a username out after repeated failures', async ({ request }) => {
+    const username = `limited-${Date.now()}`;
+    const { user } = await (await request.get(`${API_URL}/admin/rate-limits`)).json();
+
+    for (let i = 0; i < user.limit; i++) {
+      const res = await request.post(`${API_URL}/login`, { data: { username, password: 'wrong' } });
+      expect(res.status()).toBe(401);
+    }
+
+    const limited = await request.post(`${API_URL}/login`, { data: { username, password: 'wrong' } });
+    expect(limited.status()).toBe(429);
+    expect(Number(limited.headers()['retry-after'])).toBeGreaterThanOrEqual(1);
+    expect((await limited.json()).error).toMatch(/too many login attempts/i);
+
+    // Other accounts are unaffected
+    const other = await request.post(`${API_URL}/login`, { data: { username: 'admin', password: 'password' } });
+    expect(other.status()).toBe(200);
+  });
+
+  test('counts concurrent guesses before their passwords are checked', async ({ request }) => {
+    const username = `burst-${Date.now()}`;
+    const { user } = await (await request.get(`${API_URL}/admin/rate-limits`)).json();
+
+    const responses = await Promise.all(Array.from({ length: user.limit + 5 }, () =>
+      request.post(`${API_URL}/login`, { data: { username, password: 'wrong' } })));
+    const statuses = responses.map(res => res.status());
+    expect(statuses.filter(status => status === 401)).toHaveLength(user.limit);
+    expect(statuses.filter(status => status === 429)).toHaveLength(5);
+  });
+
+  test('does not count requests without a username against one shared key', async ({ request }) => {
+    const { user } = await (await request.get(`${API_URL}/admin/rate-limits`)).json();
+
+    for (let i = 0; i < user.limit + 2; i++) {
+      const res = await request.post(`${API_URL}/login`, { data: { password: 'wrong' } });
+      expect(res.status()).toBe(400);
+    }
+  });
+
+  test('reports limiter state', async ({ request }) => {
+    const stats = await (await request.get(`${API_URL}/admin/rate-limits`)).json();
+    expect(stats.ip.limit).toBeGreaterThan(0);
+    expect(stats.user.keys).toBeLessThanOrEqual(stats.user.maxKeys);
+  });
+});
@@ -0,0 +1,23 @@
+import { test, expect } from './fixtures';
+
+const API_URL = 'http://localhost:4000';
+
+test.describe('Prepared statement cache', () => {
+  test('reuses statements across requests', async ({ request }) => {
+    const before = (await (await request.get(`${API_URL}/admin/pool`)).json()).statements;
+
+    for (let i = 0; i < 3; i++) {
+      const created = await request.post(`${API_URL}/employees`, {
+        data: { name: `Statement Cache ${i}`, email: `statement.cache.${Date.now()}.${i}@company.com`, position: 'Tester' }
+      });
+      expect(created.ok()).toBeTruthy();
+      const { id } = await created.json();
+      expect(id).toBeGreaterThan(0);
+      await request.delete(`${API_URL}/employees/${id}`);
+    }
+
+    const after = (await (await request.get(`${API_URL}/admin/pool`)).json()).statements;
+    expect(after.hits).toBeGreaterThan(before.hits);
+    expect(after.size).toBeGreaterThan(0);
+  });
+});
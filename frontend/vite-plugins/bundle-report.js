@@ -0,0 +1,168 @@
+import { Buffer } from 'node:buffer';
+import fs from 'node:fs';
+import path from 'node:path';
+import zlib from 'node:zlib';
+import { normalizePath } from 'vite';
+import { renderTreemap } from './treemap.js';
+
+// Reports what a production build ships: every chunk and asset with its raw
+// and gzipped size, and for each route the JavaScript and CSS a browser must
+// download before the page can render (the entry chunk, the route's lazy
+// chunk and everything they import statically). Lazy chunks a route only
+// loads later, such as dialogs, are listed separately.
+//
+// Writes reports/bundle-report.json and prints a summary after `vite build`,
+// so the effect of a change on first paint can be compared build to build,
+// plus reports/bundle-treemap.html showing which modules fill each chunk.
+//
+// `budgets` caps the gzipped size of JavaScript chunks by chunk name, with
+// '*' as the limit for any chunk not named. Chunks over budget are listed in
+// the report and fail the build once the reports are written, so a
+// dependency that quietly doubles a chunk is caught in review rather than in
+// production; `failOnBudget: false` only prints them as a warning.
+
+const gzipSize = source => zlib.gzipSync(source, { level: 9 }).length;
+
+const kib = bytes => `${(bytes / 1024).toFixed(1)} KiB`;
+
+// "react-dom" for .../node_modules/react-dom/..., "@mui/material" for scoped
+// packages; source files are grouped by directory
+function moduleGroup(root, id) {
+  const index = id.lastIndexOf('/node_modules/');
+  if (index === -1) {
+    return path.posix.dirname(path.posix.relative(root, id.replace(/\?.*$/, '')));
+  }
+  const parts = id.slice(index + '/node_modules/'.length).split('/');
+  return parts[0].startsWith('@') ? `${parts[0]}/${parts[1]}` : parts[0];
+}
+
+// Chunk -> package or directory -> module, sized by each module's rendered
+// (tree-shaken, not yet minified) length
+function treemapData(root, chunks, files) {
+  return {
+    name: 'bundle',
+    note: 'Box areas are rendered module sizes before minification; chunk labels show the gzipped size served.',
+    children: chunks.map(chunk => {
+      const groups = new Map();
+      Object.entries(chunk.modules).forEach(([id, info]) => {
+        const group = moduleGroup(root, id);
+        if (!groups.has(group)) groups.set(group, []);
+        groups.get(group).push({ name: path.posix.basename(id.replace(/\?.*$/, '')), size: info.renderedLength });
+      });
+      return {
+        name: chunk.fileName,
+        label: `${chunk.fileName} (${kib(files[chunk.fileName].gzipBytes)} gzip)`,
+        children: [...groups].map(([name, children]) => ({ name, children }))
+      };
+    })
+  };
+}
+
+// `routes` maps a route to the source module it renders, e.g.
+// { '/login': 'src/components/Login.jsx' }; `budgets` maps chunk names to
+// gzipped byte limits.
+export default function bundleReport({
+  routes = {},
+  budgets = {},
+  failOnBudget = true,
+  outFile = 'reports/bundle-report.json',
+  treemapFile = 'reports/bundle-treemap.html'
+} = {}) {
+  let root;
+  let report;
+  let treemap;
+
+  return {
+    name: 'bundle-report',
+    apply: 'build',
+
+    configResolved(config) {
+      root = normalizePath(config.root);
+    },
+
+    generateBundle(options, bundle) {
+      const files = {};
+      for (const [fileName, output] of Object.entries(bundle)) {
+        const source = output.type === 'chunk' ? output.code : output.source;
+        files[fileName] = {
+          type: output.type === 'chunk' ? 'js' : path.extname(fileName).slice(1),
+          bytes: Buffer.byteLength(source),
+          gzipBytes: gzipSize(source),
+          ...(output.type === 'chunk' && {
+            name: output.name,
+            budgetBytes: budgets[output.name] ?? budgets['*'] ?? null,
+            entry: output.isEntry,
+            lazy: output.isDynamicEntry,
+            module: output.facadeModuleId && path.posix.relative(root, output.facadeModuleId)
+          })
+        };
+      }
+
+      // A chunk plus its static imports and their CSS, transitively
+      const closure = (fileName, seen = new Set()) => {
+        if (seen.has(fileName)) return seen;
+        seen.add(fileName);
+        const chunk = bundle[fileName];
+        chunk.imports.forEach(imported => closure(imported, seen));
+        (chunk.viteMetadata?.importedCss || []).forEach(css => seen.add(css));
+        return seen;
+      };
+      const chunks = Object.values(bundle).filter(output => output.type === 'chunk');
+      const entries = chunks.filter(chunk => chunk.isEntry).map(chunk => chunk.fileName);
+
+      const routeReports = Object.entries(routes).map(([route, modulePath]) => {
+        const page = chunks.find(chunk => chunk.facadeModuleId === path.posix.join(root, modulePath));
+        const initial = new Set();
+        entries.forEach(fileName => closure(fileName, initial));
+        if (page) closure(page.fileName, initial);
+        const deferred = new Set();
+        (page ? page.dynamicImports : []).forEach(fileName => closure(fileName, deferred));
+        initial.forEach(fileName => deferred.delete(fileName));
+
+        const sum = (set, key) => [...set].reduce((total, fileName) => total + files[fileName][key], 0);
+        return {
+          route,
+          chunk: page ? page.fileName : null,
+          initialFiles: [...initial].sort(),
+          initialBytes: sum(initial, 'bytes'),
+          initialGzipBytes: sum(initial, 'gzipBytes'),
+          deferredFiles: [...deferred].sort(),
+          deferredGzipBytes: sum(deferred, 'gzipBytes')
+        };
+      });
+
+      const overBudget = Object.entries(files)
+        .filter(([, file]) => file.budgetBytes != null && file.gzipBytes > file.budgetBytes)
+        .map(([fileName, file]) => ({ fileName, name: file.name, gzipBytes: file.gzipBytes, budgetBytes: file.budgetBytes }));
+
+      report = { generatedAt: new Date().toISOString(), routes: routeReports, overBudget, files };
+      treemap = renderTreemap(treemapData(root, chunks, files));
+    },
+
+    writeBundle() {
+      const target = path.resolve(root, outFile);
+      fs.mkdirSync(path.dirname(target), { recursive: true });
+      fs.writeFileSync(target, JSON.stringify(report, null, 2) + '\n');
+      fs.writeFileSync(path.resolve(root, treemapFile), treemap);
+
+      console.log(`\nInitial download per route (gzip), details in ${outFile}:`);
+      report.routes.forEach(({ route, chunk, initialFiles, initialGzipBytes, deferredGzipBytes }) => {
+        const note = chunk ? '' : ' (no chunk found for this route)';
+        console.log(`  ${route.padEnd(10)} ${kib(initialGzipBytes).padStart(10)} in ${initialFiles.length} files` +
+          `, ${kib(deferredGzipBytes)} loaded on demand${note}`);
+      });
+      console.log(`Treemap: ${treemapFile}`);
+
+      if (report.overBudget.length) {
+        const lines = report.overBudget.map(({ fileName, name, gzipBytes, budgetBytes }) =>
+          `  ${fileName} (${name}): ${kib(gzipBytes)} gzip, budget ${kib(budgetBytes)}`);
+        const message = `Chunks over their size budget:\n${lines.join('\n')}\n` +
+          'Split or trim them, or raise the budget in vite.config.js if the growth is intended.';
+        if (failOnBudget) {
+          this.error(message);
+        }
+        this.warn(message);
+      }
+    }
+  };
+}
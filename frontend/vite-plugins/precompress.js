@@ -0,0 +1,56 @@
+import { Buffer } from 'node:buffer';
+import fs from 'node:fs';
+import path from 'node:path';
+import zlib from 'node:zlib';
+
+// Writes a .br and a .gz copy next to every compressible build output, so a
+// static server (nginx gzip_static/brotli_static, `serve`, a CDN) can send
+// them as-is instead of compressing on each request. Build time can afford
+// maximum compression levels that would be too slow to run per request.
+
+const COMPRESSIBLE = /\.(js|mjs|css|html|svg|json|txt)$/;
+
+const ENCODERS = {
+  br: source => zlib.brotliCompressSync(source, {
+    params: {
+      [zlib.constants.BROTLI_PARAM_QUALITY]: zlib.constants.BROTLI_MAX_QUALITY,
+      [zlib.constants.BROTLI_PARAM_SIZE_HINT]: source.length
+    }
+  }),
+  gz: source => zlib.gzipSync(source, { level: zlib.constants.Z_BEST_COMPRESSION })
+};
+
+// Files under `threshold` bytes are left alone; the headers would outweigh
+// the saving.
+export default function precompress({ threshold = 1024 } = {}) {
+  return {
+    name: 'precompress',
+    apply: 'build',
+
+    writeBundle(options, bundle) {
+      let files = 0;
+      let before = 0;
+      let after = 0;
+      for (const [fileName, output] of Object.entries(bundle)) {
+        if (!COMPRESSIBLE.test(fileName)) continue;
+        const source = Buffer.from(output.type === 'chunk' ? output.code : output.source);
+        if (source.length < threshold) continue;
+
+        for (const [extension, encode] of Object.entries(ENCODERS)) {
+          const compressed = encode(source);
+          // Only worth serving if it is actually smaller
+          if (compressed.length < source.length) {
+            fs.writeFileSync(path.join(options.dir, `${fileName}.${extension}`), compressed);
+          }
+          if (extension === 'br') after += Math.min(compressed.length, source.length);
+        }
+        files++;
+        before += source.length;
+      }
+      if (files) {
+        console.log(`precompressed ${files} files: ${(before / 1024).toFixed(1)} KiB -> ` +
+          `${(after / 1024).toFixed(1)} KiB brotli`);
+      }
+    }
+  };
+}
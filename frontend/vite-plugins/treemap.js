@@ -0,0 +1,126 @@
+// Renders a size tree ({ name, size } leaves under { name, children } nodes)
+// as a self-contained HTML treemap: the squarified layout is computed here
+// and written out as positioned boxes, so the page needs no script or
+// dependency to open. Hovering a box shows its path and size.
+
+const WIDTH = 1600;
+const HEIGHT = 900;
+const HEADER = 16;
+const PADDING = 2;
+const MIN_LABEL_WIDTH = 40;
+
+const escapeHtml = text => String(text).replace(/[&<>"]/g, c => ({ '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;' })[c]);
+
+const kib = bytes => `${(bytes / 1024).toFixed(1)} KiB`;
+
+function totalSize(node) {
+  if (node.total === undefined) {
+    node.total = node.children ? node.children.reduce((sum, child) => sum + totalSize(child), 0) : node.size;
+  }
+  return node.total;
+}
+
+// Aspect ratio of the worst box in a row laid along a side of length `side`
+function worst(row, side) {
+  const sum = row.reduce((total, item) => total + item.area, 0);
+  const max = Math.max(...row.map(item => item.area));
+  const min = Math.min(...row.map(item => item.area));
+  return Math.max((side * side * max) / (sum * sum), (sum * sum) / (side * side * min));
+}
+
+function placeRow(row, rect, boxes) {
+  const sum = row.reduce((total, item) => total + item.area, 0);
+  if (rect.w >= rect.h) {
+    const width = sum / rect.h;
+    let y = rect.y;
+    row.forEach(item => {
+      const height = item.area / width;
+      boxes.push({ node: item.node, x: rect.x, y, w: width, h: height });
+      y += height;
+    });
+    return { x: rect.x + width, y: rect.y, w: rect.w - width, h: rect.h };
+  }
+  const height = sum / rect.w;
+  let x = rect.x;
+  row.forEach(item => {
+    const width = item.area / height;
+    boxes.push({ node: item.node, x, y: rect.y, w: width, h: height });
+    x += width;
+  });
+  return { x: rect.x, y: rect.y + height, w: rect.w, h: rect.h - height };
+}
+
+// Squarified treemap (Bruls, Huizing and van Wijk): fills `rect` with one box
+// per node, area proportional to size, keeping boxes close to square.
+function squarify(nodes, rect) {
+  const total = nodes.reduce((sum, node) => sum + totalSize(node), 0);
+  if (!total || rect.w <= 0 || rect.h <= 0) return [];
+  const scale = (rect.w * rect.h) / total;
+  const items = nodes
+    .filter(node => totalSize(node) > 0)
+    .sort((a, b) => totalSize(b) - totalSize(a))
+    .map(node => ({ node, area: totalSize(node) * scale }));
+
+  const boxes = [];
+  let row = [];
+  let remaining = rect;
+  for (let i = 0; i < items.length;) {
+    const side = Math.min(remaining.w, remaining.h);
+    if (row.length === 0 || worst([...row, items[i]], side) <= worst(row, side)) {
+      row.push(items[i++]);
+    } else {
+      remaining = placeRow(row, remaining, boxes);
+      row = [];
+    }
+  }
+  if (row.length) placeRow(row, remaining, boxes);
+  return boxes;
+}
+
+function renderBoxes(nodes, rect, path, hue, depth, out) {
+  squarify(nodes, rect).forEach(({ node, x, y, w, h }) => {
+    const label = node.label || node.name;
+    const title = `${[...path, node.name].join(' / ')}\n${kib(totalSize(node))}${node.note ? ` (${node.note})` : ''}`;
+    const nodeHue = depth === 0 ? node.hue : hue;
+    out.push(`<div class="box" style="left:${x.toFixed(1)}px;top:${y.toFixed(1)}px;width:${w.toFixed(1)}px;` +
+      `height:${h.toFixed(1)}px;background:hsl(${nodeHue},55%,${Math.min(40 + depth * 12, 88)}%)" ` +
+      `title="${escapeHtml(title)}">${w >= MIN_LABEL_WIDTH && h >= HEADER ? escapeHtml(label) : ''}</div>`);
+
+    const inner = { x: x + PADDING, y: y + HEADER, w: w - 2 * PADDING, h: h - HEADER - PADDING };
+    if (node.children && inner.w > 4 && inner.h > 4) {
+      renderBoxes(node.children, inner, [...path, node.name], nodeHue, depth + 1, out);
+    }
+  });
+}
+
+export function renderTreemap(tree, { title = 'Bundle treemap' } = {}) {
+  tree.children.forEach((child, i) => {
+    child.hue = Math.round((i * 360) / tree.children.length);
+  });
+  const boxes = [];
+  renderBoxes(tree.children, { x: 0, y: 0, w: WIDTH, h: HEIGHT }, [], 0, 0, boxes);
+
+  return `<!doctype html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>${escapeHtml(title)}</title>
+<style>
+  body { font: 12px system-ui, sans-serif; margin: 16px; color: #222; }
+  .map { position: relative; width: ${WIDTH}px; height: ${HEIGHT}px; }
+  .box { position: absolute; box-sizing: border-box; overflow: hidden; white-space: nowrap;
+         text-overflow: ellipsis; border: 1px solid rgba(0, 0, 0, 0.25); padding: 0 3px;
+         line-height: ${HEADER - 2}px; color: #111; }
+  .box:hover { outline: 2px solid #000; z-index: 1; }
+</style>
+</head>
+<body>
+<h1>${escapeHtml(title)}</h1>
+<p>${escapeHtml(tree.note || '')}</p>
+<div class="map">
+${boxes.join('\n')}
+</div>
+</body>
+</html>
+`;
+}
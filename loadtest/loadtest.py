@@ -0,0 +1,359 @@
+"""Load generator for the Employee Manager backend.
+
+``seed`` tops the database up to a dataset size through ``POST /employees/bulk``
+(streamed as NDJSON, so 1M rows never sit in memory). ``run`` drives the API
+with a fixed number of concurrent virtual users for a set duration, each
+picking its next request from a weighted mix, and writes a JSON report with
+p50/p95/p99 latency, throughput and error rate per operation.
+
+Usage:
+    python loadtest.py seed --rows 100k
+    python loadtest.py run --concurrency 32 --duration 60 --mix list=50,search=25,create=10,update=10,delete=5
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import math
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from pathlib import Path
+
+import aiohttp
+
+HERE = Path(__file__).resolve().parent
+DEFAULT_URL = os.environ.get("LOADTEST_URL", "http://localhost:4000")
+DEFAULT_RESULTS_DIR = HERE / "results"
+
+DATASETS = {"1k": 1_000, "100k": 100_000, "1m": 1_000_000}
+SEED_BATCH = 10_000
+
+OPERATIONS = ("login", "list", "search", "create", "update", "delete")
+DEFAULT_MIX = {"login": 5, "list": 45, "search": 25, "create": 10, "update": 10, "delete": 5}
+
+CREDENTIALS = ("admin", "password")
+# Logins the backend's rate limiter turned away are reported under this name
+LOGIN_LIMITED = "login-limited"
+FIRST_NAMES = ["John", "Jane", "Mike", "Sarah", "David", "Emma", "Liam", "Olivia", "Noah", "Ava",
+               "Lucas", "Mia", "Ethan", "Chloe", "Mateo", "Priya", "Wei", "Fatima", "Kenji", "Sofia"]
+LAST_NAMES = ["Doe", "Smith", "Johnson", "Wilson", "Brown", "Garcia", "Martin", "Lee", "Patel", "Khan",
+              "Nguyen", "Silva", "Kowalski", "Tanaka", "Haddad", "Okafor", "Rossi", "Novak", "Jensen", "Moreau"]
+POSITIONS = ["Software Engineer", "Product Manager", "UX Designer", "Data Analyst", "DevOps Engineer",
+             "QA Engineer", "Engineering Manager", "Technical Writer"]
+SEARCH_TERMS = [name[:length] for name in FIRST_NAMES + LAST_NAMES for length in (3, len(name))] + \
+    ["engineer", "manager", "designer", "analyst"]
+SORTS = ["id", "name", "email", "position"]
+
+# Keeps the emails of rows created during a run unique across users and runs
+RUN_ID = f"load{int(time.time())}"
+_created_sequence = itertools.count()
+
+
+def parse_rows(value):
+    """``1k``/``100k``/``1m`` or a plain row count."""
+    if value.lower() in DATASETS:
+        return DATASETS[value.lower()]
+    try:
+        rows = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected one of {', '.join(DATASETS)} or a number, got {value!r}")
+    if rows < 0:
+        raise argparse.ArgumentTypeError("row count must not be negative")
+    return rows
+
+
+def parse_mix(value):
+    """``list=50,search=25,...`` -> weights by operation; omitted operations get 0."""
+    mix = dict.fromkeys(OPERATIONS, 0)
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in mix:
+            raise argparse.ArgumentTypeError(f"unknown operation {name!r}; expected {', '.join(OPERATIONS)}")
+        try:
+            mix[name] = float(weight)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"weight for {name!r} must be a number")
+    if sum(mix.values()) <= 0:
+        raise argparse.ArgumentTypeError("at least one operation needs a positive weight")
+    return mix
+
+
+def make_employee(rng, n, batch):
+    first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+    return {
+        "name": f"{first} {last}",
+        "email": f"{first.lower()}.{last.lower()}.{n}.{batch}@company.com",
+        "position": rng.choice(POSITIONS),
+    }
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    index = math.ceil(pct / 100 * len(sorted_values)) - 1
+    return sorted_values[min(max(index, 0), len(sorted_values) - 1)]
+
+
+def summarize(samples, errors, elapsed):
+    latencies = sorted(samples)
+    count = len(latencies)
+    return {
+        "requests": count,
+        "errors": errors,
+        "errorRate": round(errors / count, 4) if count else 0,
+        "throughputRps": round(count / elapsed, 1) if elapsed else 0,
+        "latencyMs": {
+            "mean": round(sum(latencies) / count, 2) if count else None,
+            "p50": percentile(latencies, 50),
+            "p95": percentile(latencies, 95),
+            "p99": percentile(latencies, 99),
+            "max": latencies[-1] if latencies else None,
+        },
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=HERE, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def sign_in(session, url):
+    """Log in once and send the session token with every later request."""
+    username, password = CREDENTIALS
+    async with session.post(f"{url}/login", json={"username": username, "password": password}) as resp:
+        resp.raise_for_status()
+        token = (await resp.json())["token"]
+    session.headers["Authorization"] = f"Bearer {token}"
+
+
+async def count_rows(session, url):
+    async with session.get(f"{url}/employees", params={"limit": 1}) as resp:
+        resp.raise_for_status()
+        return int(resp.headers.get("X-Total-Count", 0))
+
+
+class Recorder:
+    """Latency samples and error counts per operation; ignores the warm-up.
+
+    Every virtual user logs in from the same address, so a run with logins in
+    its mix soon reaches the backend's per-IP login limit. Those ``429``
+    answers are the limiter working, not failures: they are recorded as
+    ``login-limited`` rather than as ``login`` errors, which also keeps their
+    near-instant latency out of the password-check numbers.
+    """
+
+    def __init__(self, warmup_until):
+        self.warmup_until = warmup_until
+        self.samples = defaultdict(list)
+        self.errors = defaultdict(int)
+        self.statuses = defaultdict(lambda: defaultdict(int))
+
+    def record(self, operation, started, status):
+        if started < self.warmup_until:
+            return
+        if operation == "login" and status == 429:
+            operation = LOGIN_LIMITED
+        self.samples[operation].append(round((time.perf_counter() - started) * 1000, 2))
+        self.statuses[operation][str(status)] += 1
+        if operation != LOGIN_LIMITED and (not isinstance(status, int) or status >= 400):
+            self.errors[operation] += 1
+
+
+class VirtualUser:
+    """One closed-loop client: sends a request, waits for it, picks the next."""
+
+    def __init__(self, session, url, recorder, mix, rng, limit):
+        self.session = session
+        self.url = url
+        self.recorder = recorder
+        self.operations = list(mix)
+        self.weights = list(mix.values())
+        self.rng = rng
+        self.limit = limit
+        # Rows this user created; updates and deletes only touch these so the
+        # seeded dataset is the same for every run
+        self.created = []
+
+    async def request(self, operation, method, path, **kwargs):
+        started = time.perf_counter()
+        try:
+            async with self.session.request(method, f"{self.url}{path}", **kwargs) as resp:
+                body = await resp.read()
+                status = resp.status
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            body, status = None, type(err).__name__
+        self.recorder.record(operation, started, status)
+        return status, body
+
+    async def login(self):
+        username, password = CREDENTIALS
+        await self.request("login", "POST", "/login", json={"username": username, "password": password})
+
+    async def list(self):
+        params = {"limit": self.limit, "sort": self.rng.choice(SORTS), "order": self.rng.choice(["asc", "desc"])}
+        await self.request("list", "GET", "/employees", params=params)
+
+    async def search(self):
+        params = {"q": self.rng.choice(SEARCH_TERMS), "limit": self.limit}
+        await self.request("search", "GET", "/employees/search", params=params)
+
+    async def create(self):
+        employee = make_employee(self.rng, next(_created_sequence), RUN_ID)
+        status, body = await self.request("create", "POST", "/employees", json=employee)
+        if status == 200 and body:
+            self.created.append(json.loads(body)["id"])
+
+    async def update(self):
+        if not self.created:
+            return await self.create()
+        employee = make_employee(self.rng, next(_created_sequence), RUN_ID)
+        await self.request("update", "PUT", f"/employees/{self.rng.choice(self.created)}", json=employee)
+
+    async def delete(self):
+        if not self.created:
+            return await self.create()
+        employee_id = self.created.pop(self.rng.randrange(len(self.created)))
+        await self.request("delete", "DELETE", f"/employees/{employee_id}")
+
+    async def run(self, deadline):
+        while time.perf_counter() < deadline:
+            operation = self.rng.choices(self.operations, self.weights)[0]
+            await getattr(self, operation)()
+
+    async def cleanup(self):
+        """Delete whatever this user created and did not delete itself."""
+        for employee_id in self.created:
+            async with self.session.delete(f"{self.url}/employees/{employee_id}"):
+                pass
+
+
+async def seed(args):
+    timeout = aiohttp.ClientTimeout(total=None)
+    async with aiohttp.ClientSession(timeout=timeout) as session:
+        await sign_in(session, args.url)
+        existing = await count_rows(session, args.url)
+        missing = args.rows - existing
+        if missing <= 0:
+            print(f"Database already has {existing} employees (target {args.rows}); nothing to do")
+            return 0
+
+        print(f"Adding {missing} employees to the existing {existing}...")
+        rng = random.Random(args.seed)
+        batch = int(time.time())
+        started = time.perf_counter()
+        inserted = 0
+        # One bulk request per SEED_BATCH rows keeps each import report small
+        for offset in range(0, missing, SEED_BATCH):
+            size = min(SEED_BATCH, missing - offset)
+            body = "".join(json.dumps(make_employee(rng, existing + offset + i, batch)) + "\n" for i in range(size))
+            async with session.post(f"{args.url}/employees/bulk", data=body.encode(),
+                                    headers={"Content-Type": "application/x-ndjson"}) as resp:
+                resp.raise_for_status()
+                report = await resp.json()
+            inserted += report["inserted"]
+            if report["failed"]:
+                print(f"  {report['failed']} rows rejected, e.g. {report['errors'][:1]}", file=sys.stderr)
+            print(f"  {inserted}/{missing}", flush=True)
+
+        elapsed = time.perf_counter() - started
+        print(f"Inserted {inserted} rows in {elapsed:.1f}s ({inserted / elapsed:.0f} rows/s); "
+              f"total {await count_rows(session, args.url)}")
+    return 0
+
+
+async def run(args):
+    rng = random.Random(args.seed)
+    connector = aiohttp.TCPConnector(limit=args.concurrency)
+    timeout = aiohttp.ClientTimeout(total=args.request_timeout)
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        await sign_in(session, args.url)
+        rows = await count_rows(session, args.url)
+
+        print(f"{args.concurrency} users for {args.duration}s (+{args.warmup}s warm-up) "
+              f"against {rows} employees at {args.url}", flush=True)
+        started = time.perf_counter()
+        recorder = Recorder(warmup_until=started + args.warmup)
+        deadline = started + args.warmup + args.duration
+        users = [
+            VirtualUser(session, args.url, recorder, args.mix, random.Random(rng.random()), args.limit)
+            for _ in range(args.concurrency)
+        ]
+        await asyncio.gather(*(user.run(deadline) for user in users))
+        elapsed = time.perf_counter() - recorder.warmup_until
+        await asyncio.gather(*(user.cleanup() for user in users))
+
+    all_samples = [sample for samples in recorder.samples.values() for sample in samples]
+    report = {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z"),
+        "commit": git_commit(),
+        "host": platform.node(),
+        "url": args.url,
+        "datasetRows": rows,
+        "concurrency": args.concurrency,
+        "durationSeconds": args.duration,
+        "warmupSeconds": args.warmup,
+        "mix": {name: weight for name, weight in args.mix.items() if weight},
+        "overall": summarize(all_samples, sum(recorder.errors.values()), elapsed),
+        "operations": {
+            operation: {**summarize(samples, recorder.errors[operation], elapsed),
+                        "statuses": dict(recorder.statuses[operation])}
+            for operation, samples in sorted(recorder.samples.items())
+        },
+    }
+
+    output = args.output or DEFAULT_RESULTS_DIR / f"{report['timestamp'].replace(':', '')}-{rows}rows-c{args.concurrency}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2) + "\n")
+
+    print(f"\n{'operation':13} {'requests':>9} {'rps':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'errors':>7}")
+    for name, stats in [*report["operations"].items(), ("overall", report["overall"])]:
+        p50, p95, p99 = (str(stats["latencyMs"][key]) for key in ("p50", "p95", "p99"))
+        print(f"{name:13} {stats['requests']:9} {stats['throughputRps']:8} {p50:>8} {p95:>8} {p99:>8} "
+              f"{stats['errorRate']:7.2%}")
+    print(f"\nReport written to {output}")
+    return 0 if report["overall"]["errorRate"] <= args.max_error_rate else 1
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default=DEFAULT_URL, help=f"backend base URL (default: $LOADTEST_URL or {DEFAULT_URL})")
+    parser.add_argument("--seed", type=int, default=None, help="random seed, for repeatable data and request order")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    seed_parser = commands.add_parser("seed", help="top the database up to a dataset size")
+    seed_parser.add_argument("--rows", type=parse_rows, required=True,
+                             help=f"target row count: {', '.join(DATASETS)} or a number")
+    seed_parser.set_defaults(handler=seed)
+
+    run_parser = commands.add_parser("run", help="run a load test and write a JSON report")
+    run_parser.add_argument("--concurrency", type=int, default=16, help="concurrent virtual users (default: 16)")
+    run_parser.add_argument("--duration", type=float, default=30, help="measured seconds (default: 30)")
+    run_parser.add_argument("--warmup", type=float, default=5, help="seconds excluded from the report (default: 5)")
+    run_parser.add_argument("--mix", type=parse_mix, default=DEFAULT_MIX,
+                            help="operation weights, e.g. list=50,search=25,create=10,update=10,delete=5 "
+                                 f"(operations: {', '.join(OPERATIONS)})")
+    run_parser.add_argument("--limit", type=int, default=50, help="page size for list and search (default: 50)")
+    run_parser.add_argument("--request-timeout", type=float, default=30, help="seconds per request (default: 30)")
+    run_parser.add_argument("--max-error-rate", type=float, default=0.01,
+                            help="exit non-zero above this overall error rate (default: 0.01)")
+    run_parser.add_argument("--output", type=Path, default=None,
+                            help="report path (default: results/<timestamp>-<rows>rows-c<concurrency>.json)")
+    run_parser.set_defaults(handler=run)
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    sys.exit(asyncio.run(args.handler(args)))
@@ -1,89 +1,60 @@
 import asyncio
 from playwright import async_api
+from harness import run_standalone
+from waits import click, fill
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
+async def run_test(context):
+    # Open a new page in the browser context
+    page = await context.new_page()
+
+    # Navigate to your target URL and wait until the network request is committed
+    await page.goto("http://localhost:5173", wait_until="commit", timeout=10000)
+
+    # Wait for the main page to reach DOMContentLoaded state (optional for stability)
     try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:5173", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
+        await page.wait_for_load_state("domcontentloaded", timeout=3000)
+    except async_api.Error:
+        pass
+
+    # Iterate through all iframes and wait for them to load as well
+    for frame in page.frames:
         try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
+            await frame.wait_for_load_state("domcontentloaded", timeout=3000)
         except async_api.Error:
             pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # Input valid username and password
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('admin')
-        
 
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div/form/div[2]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('password')
-        
+    # Interact with the page elements to simulate user flow
+    # Input valid username and password
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div/input').nth(0)
+    await fill(elem, 'admin')
+
+
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div/div/div/form/div[2]/div/input').nth(0)
+    await fill(elem, 'password')
+
+
+    # Click the login button to submit credentials
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div/div/div/form/button').nth(0)
+    await click(elem, response='/login')
+
+
+    # Navigate to Employee List page to verify redirection and check localStorage for session token
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/header/div/div[2]/a[2]').nth(0)
+    await click(elem)
+
 
-        # Click the login button to submit credentials
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div/form/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
+    # Assertion: Verify that login is successful and user is redirected to the employee list page
+    assert (await page.title()) == 'Employee Manager'
+    section_text = await frame.locator('xpath=html/body/div/main/section/h1').text_content()
+    assert section_text == 'Employee List'
+    # Assertion: Verify a session token is stored in localStorage
+    session_token = await frame.evaluate("() => window.localStorage.getItem('session_token')")
+    assert session_token is not None and session_token != ''
 
-        # Navigate to Employee List page to verify redirection and check localStorage for session token
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/header/div/div[2]/a[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
 
-        # Assertion: Verify that login is successful and user is redirected to the employee list page
-        assert (await page.title()) == 'Employee Manager'
-        section_text = await frame.locator('xpath=html/body/div/main/section/h1').text_content()
-        assert section_text == 'Employee List'
-        # Assertion: Verify a session token is stored in localStorage
-        session_token = await frame.evaluate("() => window.localStorage.getItem('session_token')")
-        assert session_token is not None and session_token != ''
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+if __name__ == "__main__":
+    asyncio.run(run_standalone(run_test))
@@ -1,77 +1,47 @@
 import asyncio
 from playwright import async_api
+from harness import run_standalone
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
+async def run_test(context):
+    # Open a new page in the browser context
+    page = await context.new_page()
+
+    # Navigate to your target URL and wait until the network request is committed
+    await page.goto("http://localhost:5173", wait_until="commit", timeout=10000)
+
+    # Wait for the main page to reach DOMContentLoaded state (optional for stability)
     try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:5173", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
+        await page.wait_for_load_state("domcontentloaded", timeout=3000)
+    except async_api.Error:
+        pass
+
+    # Iterate through all iframes and wait for them to load as well
+    for frame in page.frames:
         try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
+            await frame.wait_for_load_state("domcontentloaded", timeout=3000)
         except async_api.Error:
             pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # Attempt to navigate directly to the employee list page URL without logging in to verify redirection to login page.
-        await page.goto('http://localhost:5173/employees', timeout=10000)
-        
 
-        # Attempt to navigate directly to another employee management route URL without logging in to verify redirection to login page.
-        await page.goto('http://localhost:5173/employees/create', timeout=10000)
-        
+    # Interact with the page elements to simulate user flow
+    # Attempt to navigate directly to the employee list page URL without logging in to verify redirection to login page.
+    await page.goto('http://localhost:5173/employees', timeout=10000)
+
+
+    # Attempt to navigate directly to another employee management route URL without logging in to verify redirection to login page.
+    await page.goto('http://localhost:5173/employees/create', timeout=10000)
+
+
+    # Attempt to navigate directly to another employee management route URL without logging in to verify redirection to login page.
+    await page.goto('http://localhost:5173/employees/123/edit', timeout=10000)
+
+
+    # Assert that the page is redirected to the login page by checking the URL and presence of login form elements
+    assert '/login' in page.url
+    assert await page.locator('text=Login').is_visible()
+    assert await page.locator('input[label="Username"]').is_visible()
+    assert await page.locator('input[label="Password"]').is_visible()
+    assert await page.locator('button:has-text("Login")').is_visible()
 
-        # Attempt to navigate directly to another employee management route URL without logging in to verify redirection to login page.
-        await page.goto('http://localhost:5173/employees/123/edit', timeout=10000)
-        
 
-        # Assert that the page is redirected to the login page by checking the URL and presence of login form elements
-        assert '/login' in page.url
-        assert await page.locator('text=Login').is_visible()
-        assert await page.locator('input[label="Username"]').is_visible()
-        assert await page.locator('input[label="Password"]').is_visible()
-        assert await page.locator('button:has-text("Login")').is_visible()
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+if __name__ == "__main__":
+    asyncio.run(run_standalone(run_test))
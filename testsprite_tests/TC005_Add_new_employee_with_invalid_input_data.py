@@ -1,132 +1,103 @@
 import asyncio
 from playwright import async_api
+from harness import run_standalone
+from waits import click, fill
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
+async def run_test(context):
+    # Open a new page in the browser context
+    page = await context.new_page()
+
+    # Navigate to your target URL and wait until the network request is committed
+    await page.goto("http://localhost:5173", wait_until="commit", timeout=10000)
+
+    # Wait for the main page to reach DOMContentLoaded state (optional for stability)
     try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:5173", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
+        await page.wait_for_load_state("domcontentloaded", timeout=3000)
+    except async_api.Error:
+        pass
+
+    # Iterate through all iframes and wait for them to load as well
+    for frame in page.frames:
         try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
+            await frame.wait_for_load_state("domcontentloaded", timeout=3000)
         except async_api.Error:
             pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # Input username and password and click login button
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('admin')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div/form/div[2]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('password')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div/form/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Submit the employee form with empty fields to trigger validation errors
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div/form/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Submit form with invalid email format to verify validation error
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('John Doe')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div/form/div[2]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('invalid-email-format')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div/form/div[3]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Developer')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div/form/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Submit form with empty name field and valid email and position to verify validation error for empty name
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div/form/div[2]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('john.doe@example.com')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div/form/div[3]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Developer')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div/form/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Assert validation error messages are displayed for empty fields after first submit
-        validation_errors = await frame.locator('xpath=//div[contains(@class, "error") or contains(text(), "required")]').all_text_contents()
-        assert any('required' in error.lower() for error in validation_errors), "Expected validation error for required fields"
-        # Assert validation error for invalid email format after second submit
-        email_error = await frame.locator('xpath=//div[contains(text(), "email") and contains(text(), "invalid")]').all_text_contents()
-        assert len(email_error) > 0, "Expected validation error for invalid email format"
-        # Assert validation error for empty name field after third submit
-        name_error = await frame.locator('xpath=//div[contains(text(), "name") and contains(text(), "required")]').all_text_contents()
-        assert len(name_error) > 0, "Expected validation error for empty name field"
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+
+    # Interact with the page elements to simulate user flow
+    # Input username and password and click login button
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div/input').nth(0)
+    await fill(elem, 'admin')
+
+
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div/div/div/form/div[2]/div/input').nth(0)
+    await fill(elem, 'password')
+
+
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div/div/div/form/button').nth(0)
+    await click(elem)
+
+
+    # Submit the employee form with empty fields to trigger validation errors
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div/div/div/form/button').nth(0)
+    await click(elem)
+
+
+    # Submit form with invalid email format to verify validation error
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div/input').nth(0)
+    await fill(elem, 'John Doe')
+
+
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div/div/div/form/div[2]/div/input').nth(0)
+    await fill(elem, 'invalid-email-format')
+
+
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div/div/div/form/div[3]/div/input').nth(0)
+    await fill(elem, 'Developer')
+
+
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div/div/div/form/button').nth(0)
+    await click(elem)
+
+
+    # Submit form with empty name field and valid email and position to verify validation error for empty name
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div/input').nth(0)
+    await fill(elem, '')
+
+
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div/div/div/form/div[2]/div/input').nth(0)
+    await fill(elem, 'john.doe@example.com')
+
+
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div/div/div/form/div[3]/div/input').nth(0)
+    await fill(elem, 'Developer')
+
+
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div/div/div/form/button').nth(0)
+    await click(elem)
+
+
+    # Assert validation error messages are displayed for empty fields after first submit
+    validation_errors = await frame.locator('xpath=//div[contains(@class, "error") or contains(text(), "required")]').all_text_contents()
+    assert any('required' in error.lower() for error in validation_errors), "Expected validation error for required fields"
+    # Assert validation error for invalid email format after second submit
+    email_error = await frame.locator('xpath=//div[contains(text(), "email") and contains(text(), "invalid")]').all_text_contents()
+    assert len(email_error) > 0, "Expected validation error for invalid email format"
+    # Assert validation error for empty name field after third submit
+    name_error = await frame.locator('xpath=//div[contains(text(), "name") and contains(text(), "required")]').all_text_contents()
+    assert len(name_error) > 0, "Expected validation error for empty name field"
+
+
+if __name__ == "__main__":
+    asyncio.run(run_standalone(run_test))
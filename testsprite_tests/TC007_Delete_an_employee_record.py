@@ -1,109 +1,72 @@
 import asyncio
 from playwright import async_api
+from harness import run_standalone
+from waits import click, fill
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
+async def run_test(context):
+    # Open a new page in the browser context
+    page = await context.new_page()
+
+    # Navigate to your target URL and wait until the network request is committed
+    await page.goto("http://localhost:5173", wait_until="commit", timeout=10000)
+
+    # Wait for the main page to reach DOMContentLoaded state (optional for stability)
     try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:5173", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
+        await page.wait_for_load_state("domcontentloaded", timeout=3000)
+    except async_api.Error:
+        pass
+
+    # Iterate through all iframes and wait for them to load as well
+    for frame in page.frames:
         try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
+            await frame.wait_for_load_state("domcontentloaded", timeout=3000)
         except async_api.Error:
             pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # Input username and password and click login button
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('admin')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div/form/div[2]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('password')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div/form/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Click on 'Employee List' link to navigate to employee list page
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/header/div/div[2]/a[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Click the Delete button for the employee record to initiate deletion
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div/div[2]/table/tbody/tr/td[5]/button[3]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Click the Delete button in the confirmation dialog to confirm deletion
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div[2]/div[3]/div/div[2]/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Verify employee record is removed from the list
-        frame = context.pages[-1]
-        await page.wait_for_timeout(3000)
-        employee_names = await frame.locator('xpath=//table/tbody/tr/td[2]').all_text_contents()
-        assert 'Test User' not in employee_names, 'Employee record was not deleted from the list'
-        # Verify backend API returned success response for employee deletion
-        # Assuming the test framework captures network responses, we check for a successful delete API call
-        delete_success = False
-        async def handle_response(response):
-            if '/api/employees/' in response.url and response.request.method == 'DELETE':
-                if response.status == 200:
-                    nonlocal delete_success
-                    delete_success = True
-        frame.on('response', handle_response)
-        await page.wait_for_timeout(3000)
-        assert delete_success, 'Backend API did not return success response for employee deletion'
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+
+    # Interact with the page elements to simulate user flow
+    # Input username and password and click login button
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div/input').nth(0)
+    await fill(elem, 'admin')
+
+
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div/div/div/form/div[2]/div/input').nth(0)
+    await fill(elem, 'password')
+
+
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div/div/div/form/button').nth(0)
+    await click(elem)
+
+
+    # Click on 'Employee List' link to navigate to employee list page
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/header/div/div[2]/a[2]').nth(0)
+    await click(elem)
+
+
+    # Click the Delete button for the employee record to initiate deletion
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div/div/div/div[2]/table/tbody/tr/td[5]/button[3]').nth(0)
+    await click(elem)
+
+
+    # Click the Delete button in the confirmation dialog to confirm deletion
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div[2]/div[3]/div/div[2]/button[2]').nth(0)
+    async with page.expect_response(lambda r: '/employees/' in r.url and r.request.method == 'DELETE') as delete_response:
+        await click(elem)
+
+
+    # Verify employee record is removed from the list
+    frame = context.pages[-1]
+    employee_names = await frame.locator('xpath=//table/tbody/tr/td[2]').all_text_contents()
+    assert 'Test User' not in employee_names, 'Employee record was not deleted from the list'
+    # Verify backend API returned success response for employee deletion
+    response = await delete_response.value
+    assert response.ok, 'Backend API did not return success response for employee deletion'
+
+
+if __name__ == "__main__":
+    asyncio.run(run_standalone(run_test))
@@ -1,180 +1,151 @@
 import asyncio
 from playwright import async_api
+from harness import run_standalone
+from waits import click, fill
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
+async def run_test(context):
+    # Open a new page in the browser context
+    page = await context.new_page()
+
+    # Navigate to your target URL and wait until the network request is committed
+    await page.goto("http://localhost:5173", wait_until="commit", timeout=10000)
+
+    # Wait for the main page to reach DOMContentLoaded state (optional for stability)
     try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:5173", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
+        await page.wait_for_load_state("domcontentloaded", timeout=3000)
+    except async_api.Error:
+        pass
+
+    # Iterate through all iframes and wait for them to load as well
+    for frame in page.frames:
         try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
+            await frame.wait_for_load_state("domcontentloaded", timeout=3000)
         except async_api.Error:
             pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # Input username and password, then click login to access the main application UI for further UI component verification.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('admin')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div/form/div[2]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('password')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div/form/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Change viewport to tablet size and verify employee list table, forms, dialogs, and navigation menu usability and visual consistency.
-        await page.goto('http://localhost:5173/form', timeout=10000)
-        
-
-        await page.mouse.wheel(0, window.innerHeight)
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/header/div/div[2]/a[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Change viewport to tablet size and verify employee list table, forms, dialogs, and navigation menu usability and visual consistency.
-        await page.goto('http://localhost:5173/list', timeout=10000)
-        
-
-        # Change viewport to tablet size and verify employee list table, forms, dialogs, and navigation menu usability and visual consistency.
-        await page.goto('http://localhost:5173/list', timeout=10000)
-        
-
-        # Change viewport to tablet size and verify employee list table, forms, dialogs, and navigation menu usability and visual consistency.
-        await page.goto('http://localhost:5173/list', timeout=10000)
-        
-
-        # Change viewport to tablet size and verify employee list table, forms, dialogs, and navigation menu usability and visual consistency.
-        await page.goto('http://localhost:5173/list', timeout=10000)
-        
-
-        # Change viewport to tablet size and verify employee list table, forms, dialogs, and navigation menu usability and visual consistency.
-        await page.goto('http://localhost:5173/list', timeout=10000)
-        
-
-        # Change viewport to tablet size and verify employee list table, forms, dialogs, and navigation menu usability and visual consistency.
-        await page.goto('http://localhost:5173/list', timeout=10000)
-        
-
-        # Change viewport to tablet size and verify employee list table, forms, dialogs, and navigation menu usability and visual consistency.
-        await page.goto('http://localhost:5173/list', timeout=10000)
-        
-
-        # Change viewport to tablet size and verify employee list table, forms, dialogs, and navigation menu usability and visual consistency.
-        await page.goto('http://localhost:5173/list', timeout=10000)
-        
-
-        # Change viewport to tablet size and verify employee list table, forms, dialogs, and navigation menu usability and visual consistency.
-        await page.goto('http://localhost:5173/list', timeout=10000)
-        
-
-        # Change viewport to tablet size and verify employee list table, forms, dialogs, and navigation menu usability and visual consistency.
-        await page.goto('http://localhost:5173/list', timeout=10000)
-        
-
-        # Change viewport to tablet size and verify employee list table, forms, dialogs, and navigation menu usability and visual consistency.
-        await page.goto('http://localhost:5173/list', timeout=10000)
-        
-
-        # Verify forms and dialogs render appropriately on all screen sizes and are usable.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/header/div/div[2]/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Assert navigation menu items are visible and clickable
-        nav_items = ['Add Employee', 'Employee List', 'Logoff']
-        for item in nav_items:
-            locator = frame.locator(f"text={item}")
-            assert await locator.is_visible(), f"Navigation item '{item}' should be visible"
-            assert await locator.is_enabled(), f"Navigation item '{item}' should be enabled/clickable"
-          
-        # Assert form fields and submit button on Add Employee form
-        form_labels = ['Name', 'Email', 'Position']
-        for label in form_labels:
-            label_locator = frame.locator(f"label:text-is('{label}')")
-            input_locator = frame.locator(f"input[aria-label='{label}'], input[name='{label.lower()}']")
-            assert await label_locator.is_visible(), f"Form label '{label}' should be visible"
-            assert await input_locator.is_visible(), f"Input for '{label}' should be visible"
-            # Check required attribute if applicable
-            if label in ['Name', 'Email', 'Position'] :
-                assert await input_locator.get_attribute('required') in ['true', 'required', ''], f"Input '{label}' should be required"
-          
-        # Assert submit button visibility and enabled state
-        submit_btn = frame.locator(f"button:text-is('{page_content['section']['submit_button']}')")
-        assert await submit_btn.is_visible(), "Submit button should be visible"
-        assert await submit_btn.is_enabled(), "Submit button should be enabled"
-          
-        # Assert employee list table is visible on Employee List page
-        await page.goto('http://localhost:5173/list')
-        table_locator = frame.locator('table')
-        assert await table_locator.is_visible(), "Employee list table should be visible"
-          
-        # Assert no UI elements overflow or overlap by checking bounding boxes
-        elements_to_check = [
-            frame.locator('nav'),
-            frame.locator('form'),
-            frame.locator('table'),
-            frame.locator('dialog')
-        ]
-        for elem in elements_to_check:
-            if await elem.count() > 0:
-                box = await elem.bounding_box()
-                assert box is not None, "Element bounding box should be retrievable"
-                # Check that element is within viewport bounds
-                assert box['x'] >= 0 and box['y'] >= 0, "Element should not be positioned off-screen"
-                assert box['width'] > 0 and box['height'] > 0, "Element should have positive size"
-                # Additional checks for overlap could be implemented if needed
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+
+    # Interact with the page elements to simulate user flow
+    # Input username and password, then click login to access the main application UI for further UI component verification.
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div/input').nth(0)
+    await fill(elem, 'admin')
+
+
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div/div/div/form/div[2]/div/input').nth(0)
+    await fill(elem, 'password')
+
+
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div/div/div/form/button').nth(0)
+    await click(elem)
+
+
+    # Change viewport to tablet size and verify employee list table, forms, dialogs, and navigation menu usability and visual consistency.
+    await page.goto('http://localhost:5173/form', timeout=10000)
+
+
+    await page.mouse.wheel(0, window.innerHeight)
+
+
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/header/div/div[2]/a[2]').nth(0)
+    await click(elem)
+
+
+    # Change viewport to tablet size and verify employee list table, forms, dialogs, and navigation menu usability and visual consistency.
+    await page.goto('http://localhost:5173/list', timeout=10000)
+
+
+    # Change viewport to tablet size and verify employee list table, forms, dialogs, and navigation menu usability and visual consistency.
+    await page.goto('http://localhost:5173/list', timeout=10000)
+
+
+    # Change viewport to tablet size and verify employee list table, forms, dialogs, and navigation menu usability and visual consistency.
+    await page.goto('http://localhost:5173/list', timeout=10000)
+
+
+    # Change viewport to tablet size and verify employee list table, forms, dialogs, and navigation menu usability and visual consistency.
+    await page.goto('http://localhost:5173/list', timeout=10000)
+
+
+    # Change viewport to tablet size and verify employee list table, forms, dialogs, and navigation menu usability and visual consistency.
+    await page.goto('http://localhost:5173/list', timeout=10000)
+
+
+    # Change viewport to tablet size and verify employee list table, forms, dialogs, and navigation menu usability and visual consistency.
+    await page.goto('http://localhost:5173/list', timeout=10000)
+
+
+    # Change viewport to tablet size and verify employee list table, forms, dialogs, and navigation menu usability and visual consistency.
+    await page.goto('http://localhost:5173/list', timeout=10000)
+
+
+    # Change viewport to tablet size and verify employee list table, forms, dialogs, and navigation menu usability and visual consistency.
+    await page.goto('http://localhost:5173/list', timeout=10000)
+
+
+    # Change viewport to tablet size and verify employee list table, forms, dialogs, and navigation menu usability and visual consistency.
+    await page.goto('http://localhost:5173/list', timeout=10000)
+
+
+    # Change viewport to tablet size and verify employee list table, forms, dialogs, and navigation menu usability and visual consistency.
+    await page.goto('http://localhost:5173/list', timeout=10000)
+
+
+    # Change viewport to tablet size and verify employee list table, forms, dialogs, and navigation menu usability and visual consistency.
+    await page.goto('http://localhost:5173/list', timeout=10000)
+
+
+    # Verify forms and dialogs render appropriately on all screen sizes and are usable.
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/header/div/div[2]/a').nth(0)
+    await click(elem)
+
+
+    # Assert navigation menu items are visible and clickable
+    nav_items = ['Add Employee', 'Employee List', 'Logoff']
+    for item in nav_items:
+        locator = frame.locator(f"text={item}")
+        assert await locator.is_visible(), f"Navigation item '{item}' should be visible"
+        assert await locator.is_enabled(), f"Navigation item '{item}' should be enabled/clickable"
+
+    # Assert form fields and submit button on Add Employee form
+    form_labels = ['Name', 'Email', 'Position']
+    for label in form_labels:
+        label_locator = frame.locator(f"label:text-is('{label}')")
+        input_locator = frame.locator(f"input[aria-label='{label}'], input[name='{label.lower()}']")
+        assert await label_locator.is_visible(), f"Form label '{label}' should be visible"
+        assert await input_locator.is_visible(), f"Input for '{label}' should be visible"
+        # Check required attribute if applicable
+        if label in ['Name', 'Email', 'Position'] :
+            assert await input_locator.get_attribute('required') in ['true', 'required', ''], f"Input '{label}' should be required"
+
+    # Assert submit button visibility and enabled state
+    submit_btn = frame.locator(f"button:text-is('{page_content['section']['submit_button']}')")
+    assert await submit_btn.is_visible(), "Submit button should be visible"
+    assert await submit_btn.is_enabled(), "Submit button should be enabled"
+
+    # Assert employee list table is visible on Employee List page
+    await page.goto('http://localhost:5173/list')
+    table_locator = frame.locator('table')
+    assert await table_locator.is_visible(), "Employee list table should be visible"
+
+    # Assert no UI elements overflow or overlap by checking bounding boxes
+    elements_to_check = [
+        frame.locator('nav'),
+        frame.locator('form'),
+        frame.locator('table'),
+        frame.locator('dialog')
+    ]
+    for elem in elements_to_check:
+        if await elem.count() > 0:
+            box = await elem.bounding_box()
+            assert box is not None, "Element bounding box should be retrievable"
+            # Check that element is within viewport bounds
+            assert box['x'] >= 0 and box['y'] >= 0, "Element should not be positioned off-screen"
+            assert box['width'] > 0 and box['height'] > 0, "Element should have positive size"
+            # Additional checks for overlap could be implemented if needed
+
+
+if __name__ == "__main__":
+    asyncio.run(run_standalone(run_test))
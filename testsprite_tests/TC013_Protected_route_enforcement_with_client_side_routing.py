@@ -1,165 +1,136 @@
 import asyncio
 from playwright import async_api
+from harness import run_standalone
+from waits import click, fill
 
-async def run_test():
-    pw = None
-    browser = None
-    context = None
-    
+async def run_test(context):
+    # Open a new page in the browser context
+    page = await context.new_page()
+
+    # Navigate to your target URL and wait until the network request is committed
+    await page.goto("http://localhost:5173", wait_until="commit", timeout=10000)
+
+    # Wait for the main page to reach DOMContentLoaded state (optional for stability)
     try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
-        
-        # Open a new page in the browser context
-        page = await context.new_page()
-        
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:5173", wait_until="commit", timeout=10000)
-        
-        # Wait for the main page to reach DOMContentLoaded state (optional for stability)
+        await page.wait_for_load_state("domcontentloaded", timeout=3000)
+    except async_api.Error:
+        pass
+
+    # Iterate through all iframes and wait for them to load as well
+    for frame in page.frames:
         try:
-            await page.wait_for_load_state("domcontentloaded", timeout=3000)
+            await frame.wait_for_load_state("domcontentloaded", timeout=3000)
         except async_api.Error:
             pass
-        
-        # Iterate through all iframes and wait for them to load as well
-        for frame in page.frames:
-            try:
-                await frame.wait_for_load_state("domcontentloaded", timeout=3000)
-            except async_api.Error:
-                pass
-        
-        # Interact with the page elements to simulate user flow
-        # Attempt to navigate manually to the protected employee list route without authentication to verify redirection to login.
-        await page.goto('http://localhost:5173/employees', timeout=10000)
-        
-
-        # Fill in username and password and submit login form to authenticate.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('admin')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div/form/div[2]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('password')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div/form/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Navigate to the Employee List page via the navigation link to verify access to another protected page.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/header/div/div[2]/a[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Click on the 'Add Employee' link to navigate to the Add Employee form page and verify access.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/header/div/div[2]/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Click the Logoff button to log out and then attempt to access a protected route to verify redirection to login page.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/header/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Attempt to manually navigate to the protected route /employees again without authentication to verify redirection to login page.
-        await page.goto('http://localhost:5173/employees', timeout=10000)
-        
-
-        # Perform login again with provided credentials to verify access to protected pages after authentication.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('admin')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div/form/div[2]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('password')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div/form/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Log off and then attempt to manually navigate to the Add Employee form route (/form) without authentication to verify redirection to login page.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/header/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Attempt to manually navigate to the Add Employee form route (/form) without authentication to verify redirection to login page.
-        await page.goto('http://localhost:5173/form', timeout=10000)
-        
-
-        # Navigate back to login page and perform login to verify access to the form page after authentication.
-        await page.goto('http://localhost:5173/login', timeout=10000)
-        
-
-        # Input username and password and submit login form to authenticate and verify access to form page.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('admin')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div/form/div[2]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('password')
-        
-
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/div/div/div/form/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Test refreshing the Add Employee form page to verify the authentication guard enforcement on page reload.
-        await page.goto('http://localhost:5173/form', timeout=10000)
-        
-
-        # Log off and then attempt to refresh the Add Employee form page to verify redirection to login on refresh without authentication.
-        frame = context.pages[-1]
-        elem = frame.locator('xpath=html/body/div/header/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # Assert redirection to login page when accessing protected route without authentication
-        assert 'login' in page.url, f"Expected to be redirected to login page, but current URL is {page.url}"
-        # Assert access to employee list page after successful login
-        assert 'employees' in page.url, f"Expected to be on employees page after login, but current URL is {page.url}"
-        # Assert access to add employee form page after successful login
-        assert 'form' in page.url, f"Expected to be on form page after login, but current URL is {page.url}"
-        # Assert redirection to login page after logoff and attempt to access protected route
-        assert 'login' in page.url, f"Expected to be redirected to login page after logoff, but current URL is {page.url}"
-        await asyncio.sleep(5)
-    
-    finally:
-        if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+
+    # Interact with the page elements to simulate user flow
+    # Attempt to navigate manually to the protected employee list route without authentication to verify redirection to login.
+    await page.goto('http://localhost:5173/employees', timeout=10000)
+
+
+    # Fill in username and password and submit login form to authenticate.
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div/input').nth(0)
+    await fill(elem, 'admin')
+
+
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div/div/div/form/div[2]/div/input').nth(0)
+    await fill(elem, 'password')
+
+
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div/div/div/form/button').nth(0)
+    await click(elem)
+
+
+    # Navigate to the Employee List page via the navigation link to verify access to another protected page.
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/header/div/div[2]/a[2]').nth(0)
+    await click(elem)
+
+
+    # Click on the 'Add Employee' link to navigate to the Add Employee form page and verify access.
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/header/div/div[2]/a').nth(0)
+    await click(elem)
+
+
+    # Click the Logoff button to log out and then attempt to access a protected route to verify redirection to login page.
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/header/div/div[2]/button').nth(0)
+    await click(elem)
+
+
+    # Attempt to manually navigate to the protected route /employees again without authentication to verify redirection to login page.
+    await page.goto('http://localhost:5173/employees', timeout=10000)
+
+
+    # Perform login again with provided credentials to verify access to protected pages after authentication.
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div/input').nth(0)
+    await fill(elem, 'admin')
+
+
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div/div/div/form/div[2]/div/input').nth(0)
+    await fill(elem, 'password')
+
+
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div/div/div/form/button').nth(0)
+    await click(elem)
+
+
+    # Log off and then attempt to manually navigate to the Add Employee form route (/form) without authentication to verify redirection to login page.
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/header/div/div[2]/button').nth(0)
+    await click(elem)
+
+
+    # Attempt to manually navigate to the Add Employee form route (/form) without authentication to verify redirection to login page.
+    await page.goto('http://localhost:5173/form', timeout=10000)
+
+
+    # Navigate back to login page and perform login to verify access to the form page after authentication.
+    await page.goto('http://localhost:5173/login', timeout=10000)
+
+
+    # Input username and password and submit login form to authenticate and verify access to form page.
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div/div/div/form/div/div/input').nth(0)
+    await fill(elem, 'admin')
+
+
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div/div/div/form/div[2]/div/input').nth(0)
+    await fill(elem, 'password')
+
+
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/div/div/div/form/button').nth(0)
+    await click(elem)
+
+
+    # Test refreshing the Add Employee form page to verify the authentication guard enforcement on page reload.
+    await page.goto('http://localhost:5173/form', timeout=10000)
+
+
+    # Log off and then attempt to refresh the Add Employee form page to verify redirection to login on refresh without authentication.
+    frame = context.pages[-1]
+    elem = frame.locator('xpath=html/body/div/header/div/div[2]/button').nth(0)
+    await click(elem)
+
+
+    # Assert redirection to login page when accessing protected route without authentication
+    assert 'login' in page.url, f"Expected to be redirected to login page, but current URL is {page.url}"
+    # Assert access to employee list page after successful login
+    assert 'employees' in page.url, f"Expected to be on employees page after login, but current URL is {page.url}"
+    # Assert access to add employee form page after successful login
+    assert 'form' in page.url, f"Expected to be on form page after login, but current URL is {page.url}"
+    # Assert redirection to login page after logoff and attempt to access protected route
+    assert 'login' in page.url, f"Expected to be redirected to login page after logoff, but current URL is {page.url}"
+
+
+if __name__ == "__main__":
+    asyncio.run(run_standalone(run_test))
@@ -0,0 +1,69 @@
+"""Shared browser setup for the TestSprite TC scripts.
+
+Each TC script defines ``async def run_test(context)`` and only drives the
+page, through the condition-based helpers in ``waits.py``. Running a script
+directly goes through :func:`run_standalone`, which starts its own Playwright
+and Chromium; ``run_parallel.py`` instead runs many scripts over one shared
+browser, with a fresh context per test.
+"""
+
+from playwright import async_api
+
+from waits import STEP_BUDGET_MS, start_recording, track_network
+
+DEFAULT_TIMEOUT_MS = 5000
+
+LAUNCH_ARGS = [
+    "--window-size=1280,720",         # Set the browser window size
+    "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
+    "--ipc=host",                     # Use host-level IPC for better stability
+]
+
+
+async def launch_browser(pw, single_process=True):
+    """Launch headless Chromium.
+
+    ``--single-process`` keeps a one-off run light, but is not stable with
+    several contexts open at once, so the parallel runner turns it off.
+    """
+    args = LAUNCH_ARGS + (["--single-process"] if single_process else [])
+    return await pw.chromium.launch(headless=True, args=args)
+
+
+async def new_context(browser):
+    """Create an isolated browser context (like an incognito window)."""
+    context = await browser.new_context()
+    context.set_default_timeout(DEFAULT_TIMEOUT_MS)
+    track_network(context)
+    return context
+
+
+def format_steps(steps, budget_ms=STEP_BUDGET_MS):
+    """One line per step, marking those slower than ``budget_ms``."""
+    return "\n".join(
+        f"{'SLOW' if step['ms'] > budget_ms else '    '} {step['ms']:8.1f} ms  {step['step']}"
+        for step in steps
+    )
+
+
+async def run_standalone(test):
+    """Run one ``test(context)`` coroutine in its own browser."""
+    pw = None
+    browser = None
+    context = None
+    steps = start_recording()
+
+    try:
+        pw = await async_api.async_playwright().start()
+        browser = await launch_browser(pw)
+        context = await new_context(browser)
+        await test(context)
+    finally:
+        if steps:
+            print(format_steps(steps))
+        if context:
+            await context.close()
+        if browser:
+            await browser.close()
+        if pw:
+            await pw.stop()
@@ -0,0 +1,172 @@
+"""Run the TC scripts concurrently over one shared browser.
+
+Every ``TC*.py`` script next to this file is imported and its
+``run_test(context)`` is called with a fresh, isolated browser context, up to
+``--workers`` at a time. All tests share one backend and database, so the
+ones that change rows or rely on specific rows (``SERIAL_TESTS``) never
+overlap each other; the rest run alongside them. Results are written as JSON
+in the same shape as
+``tmp/test_results.json``, with an extra ``durationMs`` per test plus the
+timing of each step (``steps``) and the steps over ``--budget-ms``
+(``slowSteps``).
+
+Usage:
+    python run_parallel.py [--workers N] [--pattern 'TC00*'] [--output PATH] [--budget-ms MS]
+"""
+
+import argparse
+import asyncio
+import contextlib
+import importlib.util
+import json
+import os
+import sys
+import time
+import traceback
+from datetime import datetime, timezone
+from pathlib import Path
+
+from playwright import async_api
+
+HERE = Path(__file__).resolve().parent
+sys.path.insert(0, str(HERE))
+
+from harness import launch_browser, new_context  # noqa: E402
+from waits import STEP_BUDGET_MS, slow_steps, start_recording  # noqa: E402
+
+DEFAULT_OUTPUT = HERE / "tmp" / "parallel_test_results.json"
+PREVIOUS_RESULTS = HERE / "tmp" / "test_results.json"
+
+# Submit the add form, edit or delete the first row, or open it and expect it
+# as seen; run concurrently they would edit or delete each other's rows
+SERIAL_TESTS = {"TC004", "TC005", "TC006", "TC007", "TC011", "TC014"}
+
+
+def discover(pattern):
+    return sorted(HERE.glob(f"{pattern}.py"))
+
+
+def load_module(path):
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_title(path):
+    """``TC001_User_login`` -> ``TC001-User login``, as TestSprite names them."""
+    test_id, _, name = path.stem.partition("_")
+    return f"{test_id}-{name.replace('_', ' ')}"
+
+
+def load_metadata():
+    """Project/test ids and descriptions from the last TestSprite run, by TC id."""
+    if not PREVIOUS_RESULTS.exists():
+        return {}
+    with PREVIOUS_RESULTS.open() as f:
+        return {result["title"].split("-")[0]: result for result in json.load(f)}
+
+
+def now_iso():
+    return datetime.now(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+async def run_one(browser, path, semaphore, serial_lock, metadata, timeout, budget_ms):
+    # The lock is taken before a worker slot, so a queued serial test does
+    # not hold one up
+    serial = serial_lock if path.stem.split("_")[0] in SERIAL_TESTS else contextlib.nullcontext()
+    async with serial, semaphore:
+        # Each gathered coroutine runs in its own task, so steps stay per test
+        steps = start_recording()
+        previous = metadata.get(path.stem.split("_")[0], {})
+        created = now_iso()
+        started = time.perf_counter()
+        status, error = "PASSED", ""
+        context = None
+        try:
+            module = load_module(path)
+            context = await new_context(browser)
+            await asyncio.wait_for(module.run_test(context), timeout)
+        except Exception:
+            status, error = "FAILED", traceback.format_exc()
+        finally:
+            if context:
+                await context.close()
+        duration_ms = round((time.perf_counter() - started) * 1000)
+        slow = slow_steps(steps, budget_ms)
+
+        print(f"{status:6} {path.stem} ({duration_ms / 1000:.1f}s)", flush=True)
+        for entry in slow:
+            print(f"       slow step: {entry['ms']:.0f} ms  {entry['step']}", flush=True)
+        return {
+            "projectId": previous.get("projectId"),
+            "testId": previous.get("testId"),
+            "userId": previous.get("userId"),
+            "title": test_title(path),
+            "description": previous.get("description", ""),
+            "code": path.read_text(),
+            "testStatus": status,
+            "testError": error,
+            "testType": previous.get("testType", "FRONTEND"),
+            "createFrom": previous.get("createFrom", "mcp"),
+            "testVisualization": "",
+            "created": created,
+            "modified": now_iso(),
+            "durationMs": duration_ms,
+            "steps": steps,
+            "slowSteps": slow,
+        }
+
+
+async def main(args):
+    paths = discover(args.pattern)
+    if not paths:
+        print(f"No tests match {args.pattern}.py", file=sys.stderr)
+        return 1
+
+    metadata = load_metadata()
+    semaphore = asyncio.Semaphore(args.workers)
+    serial_lock = asyncio.Lock()
+    started = time.perf_counter()
+
+    async with async_api.async_playwright() as pw:
+        browser = await launch_browser(pw, single_process=False)
+        try:
+            results = await asyncio.gather(*(
+                run_one(browser, path, semaphore, serial_lock, metadata, args.timeout, args.budget_ms)
+                for path in paths
+            ))
+        finally:
+            await browser.close()
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    with args.output.open("w") as f:
+        json.dump(results, f, indent=2)
+
+    passed = sum(result["testStatus"] == "PASSED" for result in results)
+    elapsed = time.perf_counter() - started
+    slow = sum(len(result["slowSteps"]) for result in results)
+    print(f"\n{passed}/{len(results)} passed in {elapsed:.1f}s with {args.workers} workers")
+    if slow:
+        print(f"{slow} step(s) took longer than {args.budget_ms:.0f} ms")
+    print(f"Report written to {args.output}")
+    return 0 if passed == len(results) else 1
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 4,
+                        help="number of tests to run at once (default: CPU count)")
+    parser.add_argument("--pattern", default="TC*",
+                        help="glob for the test scripts to run, without .py (default: TC*)")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT,
+                        help=f"JSON report path (default: {DEFAULT_OUTPUT.relative_to(HERE)})")
+    parser.add_argument("--timeout", type=float, default=180,
+                        help="seconds before a single test is failed (default: 180)")
+    parser.add_argument("--budget-ms", type=float, default=STEP_BUDGET_MS,
+                        help=f"flag steps slower than this (default: $STEP_BUDGET_MS or {STEP_BUDGET_MS:.0f})")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main(parse_args())))
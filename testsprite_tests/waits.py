@@ -0,0 +1,130 @@
+"""Condition-based waits and per-step timings for the TC scripts.
+
+Instead of sleeping a fixed time before every action, the helpers here rely on
+Playwright's auto-waiting for the element and then wait for the app's own API
+traffic to finish: either a specific response (``response="/login"``) or, by
+default, until no XHR/fetch request has been in flight for ``QUIET_MS``.
+
+Every helper records how long it took. :func:`start_recording` returns the
+list the current test's timings go into; the harness prints it and the
+parallel runner adds it to the JSON report, flagging steps slower than the
+budget so regressions in app latency stand out.
+"""
+
+import asyncio
+import contextvars
+import os
+import time
+import weakref
+from contextlib import asynccontextmanager
+
+# Longer than the employee list's 250ms search debounce, so a search that is
+# about to fire counts as pending traffic
+QUIET_MS = 300
+SETTLE_TIMEOUT_MS = 10000
+STEP_BUDGET_MS = float(os.environ.get("STEP_BUDGET_MS", 2000))
+
+_timings = contextvars.ContextVar("step_timings", default=None)
+_trackers = weakref.WeakKeyDictionary()
+
+
+class _NetworkTracker:
+    """Counts the XHR/fetch requests in flight for one browser context."""
+
+    def __init__(self, context):
+        self.in_flight = 0
+        self.last_activity = time.monotonic()
+        context.on("request", self._started)
+        context.on("requestfinished", self._finished)
+        context.on("requestfailed", self._finished)
+
+    @staticmethod
+    def _is_api(request):
+        return request.resource_type in ("xhr", "fetch")
+
+    def _started(self, request):
+        if self._is_api(request):
+            self.in_flight += 1
+            self.last_activity = time.monotonic()
+
+    def _finished(self, request):
+        if self._is_api(request):
+            self.in_flight = max(0, self.in_flight - 1)
+            self.last_activity = time.monotonic()
+
+
+def track_network(context):
+    """Start counting API requests for ``context``; needed by :func:`settle`."""
+    if context not in _trackers:
+        _trackers[context] = _NetworkTracker(context)
+
+
+def start_recording():
+    """Collect step timings for the current task into a new list and return it."""
+    steps = []
+    _timings.set(steps)
+    return steps
+
+
+def slow_steps(steps, budget_ms=STEP_BUDGET_MS):
+    return [step for step in steps if step["ms"] > budget_ms]
+
+
+@asynccontextmanager
+async def step(label):
+    """Time the enclosed block as one step of the current test."""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        steps = _timings.get()
+        if steps is not None:
+            steps.append({"step": label, "ms": round((time.perf_counter() - started) * 1000, 1)})
+
+
+async def settle(page, quiet_ms=QUIET_MS, timeout_ms=SETTLE_TIMEOUT_MS):
+    """Wait until no API request has been in flight for ``quiet_ms``.
+
+    Gives up silently after ``timeout_ms``; the assertion that follows reports
+    what is actually wrong.
+    """
+    tracker = _trackers.get(page.context)
+    if tracker is None:
+        return
+    # Count from now too, so a request the last action is about to send
+    # still has quiet_ms to show up
+    started = time.monotonic()
+    deadline = started + timeout_ms / 1000
+    while time.monotonic() < deadline:
+        quiet_for = (time.monotonic() - max(started, tracker.last_activity)) * 1000
+        if tracker.in_flight == 0 and quiet_for >= quiet_ms:
+            return
+        await asyncio.sleep(0.02)
+
+
+async def _act(locator, action, label, response):
+    page = locator.page
+    async with step(label):
+        if response:
+            async with page.expect_response(lambda r: response in r.url) as info:
+                await action()
+            await info.value
+        else:
+            await action()
+            await settle(page)
+
+
+async def fill(locator, value, response=None):
+    """Fill a field once it is editable, then wait for any traffic it causes."""
+    await _act(locator, lambda: locator.fill(value), f"fill {locator} = {value!r}", response)
+
+
+async def click(locator, response=None, timeout=5000):
+    """Click once actionable, then wait for ``response`` or for traffic to settle."""
+    await _act(locator, lambda: locator.click(timeout=timeout), f"click {locator}", response)
+
+
+async def visible(locator, timeout=SETTLE_TIMEOUT_MS):
+    """Wait for ``locator`` to be shown, e.g. a dialog or a toast."""
+    async with step(f"visible {locator}"):
+        await locator.wait_for(state="visible", timeout=timeout)